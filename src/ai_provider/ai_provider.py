@@ -4,6 +4,41 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Initialized LLM clients keyed by (provider, model) so that every agent node,
+# and every repository processed in the same run, reuses one client and its
+# HTTP connection pool instead of re-initializing the provider.
+_LLM_CACHE: dict[tuple[str, str], Any] = {}
+
+
+def _configure_response_cache() -> None:
+    """
+    Persist LLM responses in SQLite when LLM_CACHE_PATH is set, so re-running the
+    discovery on the same repositories answers identical prompts from disk.
+    """
+    cache_path = os.getenv("LLM_CACHE_PATH")
+    if not cache_path:
+        return
+
+    from langchain_core.globals import get_llm_cache, set_llm_cache
+    if get_llm_cache() is not None:
+        return
+    try:
+        from langchain_community.cache import SQLiteCache
+    except ImportError as e:
+        raise ImportError("langchain_community is required for LLM_CACHE_PATH") from e
+
+    cache_path = os.path.expanduser(cache_path)
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+        cache = SQLiteCache(database_path=cache_path)
+    except Exception as e:
+        # The cache is an optimization; an unusable path must not stop the LLM calls themselves
+        logger.warning(f"Could not open LLM response cache at {cache_path}, continuing without it: {e}")
+        return
+
+    logger.info(f"Caching LLM responses in: {cache_path}")
+    set_llm_cache(cache)
+
 
 def _init_openai_llm(model_name: str) -> Any:
     """Initialize OpenAI LLM."""
@@ -70,6 +105,7 @@ def _init_azure_llm(model_name: str) -> Any:
 def init_llm_by_provider(model_name: Optional[str] = None) -> Any:
     """
     Initialize an LLM instance based on available provider configuration.
+    Instances are cached per (provider, model) for the lifetime of the process.
 
     Args:
         model_name: Optional model name to use. If None, uses LLM_DEPLOYMENT env var or defaults.
@@ -116,10 +152,17 @@ def init_llm_by_provider(model_name: Optional[str] = None) -> Any:
     # Determine which model to use (priority: parameter > env var > default)
     final_model = model_name or os.getenv("LLM_DEPLOYMENT", default_model)
 
+    cache_key = (provider_name, final_model)
+    llm = _LLM_CACHE.get(cache_key)
+    if llm is not None:
+        return llm
+
     logger.info(f"Using {provider_name} as LLM provider with model: {final_model}")
+    _configure_response_cache()
 
     # Initialize the LLM
     llm = provider(final_model)
+    _LLM_CACHE[cache_key] = llm
 
     return llm
 
@@ -148,8 +191,9 @@ def validate_llm_availability(model_name: Optional[str] = None) -> tuple[bool, O
         # Make a minimal test call to verify the model is accessible
         logger.info("Testing LLM availability with a simple prompt...")
 
-        # Use a very simple prompt to minimize cost and latency
-        test_response = llm.invoke("Hi")
+        # Use a very simple prompt to minimize cost and latency. A copy without the response
+        # cache: a cached "Hi" answer would pass the check with revoked credentials or no network.
+        test_response = llm.model_copy(update={"cache": False}).invoke("Hi")
 
         # If we got here, the model is available
         logger.info("LLM availability test passed")
@@ -53,8 +53,8 @@ def ai_service_discovery_agent(
     if os.path.exists(readme_path):
         try:
             with open(readme_path, "r", encoding="utf-8") as f:
-                readme_content = "".join(list(islice(f, readme_lines)))
-        except Exception as e:
+                readme_content = "".join(islice(f, readme_lines))
+        except (OSError, UnicodeDecodeError) as e:
             logger.warning(f"Could not read README.md: {e}")
 
     # Gather candidate summary string
@@ -136,8 +136,9 @@ def ai_service_discovery_agent(
         logger.info(f"Service discovery LLM output: {response}")
         try:
             discovered_services = response["services"]
-            assert isinstance(discovered_services, list)
-        except Exception as e:
+            if not isinstance(discovered_services, list):
+                raise TypeError(f"expected a list of services, got {type(discovered_services).__name__}")
+        except (KeyError, TypeError) as e:
             logger.warning(f"Could not parse LLM response, defaulting to empty list. Error: {e}")
             discovered_services = []
         return discovered_services
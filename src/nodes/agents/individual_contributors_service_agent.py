@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from langchain_core.output_parsers import JsonOutputParser
@@ -12,6 +13,9 @@ from src.nodes.runnables.discover_individual_contributors_runnable import discov
 
 logger = get_logger(__name__)
 
+# Concurrent git shortlog processes per repository
+CONTRIBUTOR_DISCOVERY_WORKERS = 4
+
 
 class IndividualResult(BaseModel):
     name: str = Field(description="User Name")
@@ -30,8 +34,21 @@ def individual_contributors_service_agent(state: RootRepoState, config: Runnable
     model_name = config.get("configurable", {}).get("model_name") if config else None
     llm = init_llm_by_provider(model_name)
     parser = JsonOutputParser(pydantic_object=ListOfIndividuals)
-    for service in state.self_built_software:
-        individuals_list = discover_individual_contributors_runnable(state.local_path, service.name, service.path)
+    services = state.self_built_software
+    if not services:
+        return state
+
+    # The shortlogs do not depend on each other or on the LLM answers, so git already runs
+    # for the next services while the LLM merges the contributors of the current one.
+    # shutdown(wait=False) only stops accepting work; the submitted discoveries still complete.
+    executor = ThreadPoolExecutor(max_workers=min(CONTRIBUTOR_DISCOVERY_WORKERS, len(services)))
+    discoveries = [
+        executor.submit(discover_individual_contributors_runnable, state.local_path, service.name, service.path)
+        for service in services
+    ]
+    executor.shutdown(wait=False)
+    for service, discovery in zip(services, discoveries):
+        individuals_list = discovery.result()
         prompt_text = """
         ## Role
         You are a repository individual contributors analyst. Your job is to analyze the contributors and merge the contributors.
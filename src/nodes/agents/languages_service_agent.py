@@ -57,18 +57,33 @@ def languages_service_agent(state: RootRepoState, config: RunnableConfig) -> Roo
         {language_content}
         """
 
+    prompt = PromptTemplate(
+        template=prompt_text,
+        input_variables=["language_content"],
+        partial_variables={"format_instructions": parser.get_format_instructions()}
+    )
+    chain = prompt | llm | parser
+
     for service in state.self_built_software:
-        prompt = PromptTemplate(
-            template=prompt_text,
-            input_variables=["language_content"],
-            partial_variables={"format_instructions": parser.get_format_instructions()}
-        )
         service_content = get_languages_and_package_manager_runnable(state.local_path, service.name, service.path)
-        if "language_content" in service_content:
-            chain = prompt | llm | parser
-            response = chain.invoke({"language_content": service_content["languages"]})
-            service.language = response
-        else:
-            service.language = [LanguageResult(name="NA", version="", reason="No language files found").dict()]
+        languages = service_content["languages"]
+
+        # Zero languages, or a single language without any manifest to read a
+        # version from, fully determine the answer - no need to ask the LLM.
+        if not languages:
+            service.language = [{"name": "NA", "version": "", "reason": "No language files found"}]
+            continue
+        if len(languages) == 1 and not languages[0]["packages_content"]:
+            language = languages[0]
+            service.language = [LanguageResult(
+                name=language["name"],
+                version="",
+                reason=f"Only language detected ({language['total_files']} source files), no package/build files found",
+            ).model_dump()]
+            continue
+
+        response = chain.invoke({"language_content": languages})
+        # The parser yields one result object; the field holds a list like every branch above
+        service.language = [response]
 
     return state
@@ -1,7 +1,7 @@
 import json
+import re
 
-from langchain import hub
-from langchain.agents import create_react_agent, AgentExecutor
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.runnables import RunnableConfig
 
 from src.ai_provider.ai_provider import init_llm_by_provider
@@ -13,42 +13,35 @@ from src.utils.context_injection import format_context_for_prompt
 
 logger = get_logger(__name__)
 
+# orjson is only a transitive dependency; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
-def monorepo_inspector_agent(state: RootRepoState, config: RunnableConfig) -> RootRepoState:
-    logger.info("👀  extra checks for *mono-repo* – placeholder implementation")
-
-    # Get model name from config if provided
-    model_name = config.get("configurable", {}).get("model_name") if config else None
-    llm = init_llm_by_provider(model_name)
-    tools = [discover_services_tool, repo_get_head_sha, repo_list_tree, repo_read_file, repo_search_code]
-    repo_root_url = state.repo_root_url
-
-    # Get user-provided context for injection into prompt
-    context_section = format_context_for_prompt(state.discovery_context)
+# First JSON array in the agent's final answer
+_JSON_ARRAY_RE = re.compile(r'\[.*?\]', re.DOTALL)
 
-    prompt = (
-        "## Role\n"
-        f"You are a software discovery analyst. Your job is to find deployable self-built software (services/apps/artifacts) inside a single Git monorepo, hosted on {repo_root_url}.\n"
-        f"{context_section}"
-        """
+# Placeholders: {repo_root_url}, {context_section}. Literal braces are doubled.
+_MONOREPO_PROMPT_TEMPLATE = """## Role
+You are a software discovery analyst. Your job is to find deployable self-built software (services/apps/artifacts) inside a single Git monorepo, hosted on {repo_root_url}.
+{context_section}
 ## Definition of "self-built software"
         A deployable unit intended to run independently (e.g., web/API service, worker/consumer, CLI app, scheduled job, serverless function, microservice). Libraries or shared packages that are not deployed independently are not services.
         
         ## Hard rules
-        """
-        f"- **You must always work on this repository {repo_root_url}**. Do not use any other repository."
-        """
+        - **You must always work on this repository {repo_root_url}**. Do not use any other repository.
         - **No guessing.** If evidence is insufficient, mark the candidate as rejected with reason, or leave it out.
         - **Private reasoning only.** Think step-by-step internally but do not reveal chain-of-thought. Only return the required outputs and brief justifications.
         - **Tools only (no cloning).** You may only read repo content via available API-based tools (e.g., list tree by commit SHA, read small files, code search). Do not fabricate file contents and do not fetch network resources except via provided tools. **Do not clone the repository.**
         - **Evidence required.** Every accepted service must be based on evidence files (e.g., `package.json`, `pom.xml`, `Dockerfile`, `Procfile`, `main.go`, `Program.cs`, `serverless.yml`, `Chart.yaml`, `helm/values.yaml`, `compose.yml`, CI targets, `nx.json`, `pnpm-workspace.yaml`, `go.mod`, `build.gradle`, `build.gradle.kts`, etc.).
-        - **Minimal output first.** Final required output is a JSON array of objects: `{ "name": string, "path": string }`. Include only accepted services. Additionally, return a separate Explanation section with a compact table of evidence (paths + short reason). Do not include chain-of-thought.
+        - **Minimal output first.** Final required output is a JSON array of objects: `{{ "name": string, "path": string }}`. Include only accepted services. Additionally, return a separate Explanation section with a compact table of evidence (paths + short reason). Do not include chain-of-thought.
         
         ## Inputs
         - `repo_root_url`: the HTTPS URL of the GitHub repository root (default branch).
         
         ## Available tools (examples; use what exists in your runtime)
-        - `repo.get_head_sha(repo_root_url)` → `{ sha: string, default_branch: string }`
+        - `repo.get_head_sha(repo_root_url)` → `{{ sha: string, default_branch: string }}`
         - `repo.list_tree(sha, recursive=True)` → directory entries for the tree at the given commit
         - `repo.read_file(path, sha, max_bytes)` → file content (Base64 or text), truncated if large
         - `repo.search_code(query, limit?)` → list of matching file paths (optional)
@@ -56,7 +49,7 @@ def monorepo_inspector_agent(state: RootRepoState, config: RunnableConfig) -> Ro
 
         > If a listed tool is unavailable in your environment, use an equivalent. If no file access tool is available, return an error result:
         > ```json
-        > {"error":"tooling_missing","message":"No repository file-access tools available."}
+        > {{"error":"tooling_missing","message":"No repository file-access tools available."}}
         > ```
 
         ## Method (execute end-to-end without user approval)
@@ -95,7 +88,7 @@ def monorepo_inspector_agent(state: RootRepoState, config: RunnableConfig) -> Ro
         - If only 1 weak signal, either reject with reason or mark “needs-human-review” (but do not include in final minimal JSON).
         
         ## Output
-        - **Primary output (strict):** JSON array of `{ "name": string, "path": string }` with only accepted services.
+        - **Primary output (strict):** JSON array of `{{ "name": string, "path": string }}` with only accepted services.
         - **Secondary (Explanation):** concise table: `name | path | evidence_paths[] | reason (1–2 lines)`.
         - Do **not** include chain-of-thought.
 
@@ -111,10 +104,72 @@ def monorepo_inspector_agent(state: RootRepoState, config: RunnableConfig) -> Ro
         ## Required Final Output Format
         
         **Output (strict minimal JSON only):**
-        Return ONLY a JSON array of objects: [{ "name": string, "path": string }]. Do not include any explanation, evidence, or extra text. No markdown, no blocks, no chain-of-thought. Only the JSON array.
+        Return ONLY a JSON array of objects: [{{ "name": string, "path": string }}]. Do not include any explanation, evidence, or extra text. No markdown, no blocks, no chain-of-thought. Only the JSON array.
+    """
+
+
+class _EarlyStop(Exception):
+    """Raised from the agent callbacks once a usable services array has been emitted."""
+
+    def __init__(self, output: str):
+        super().__init__(output)
+        self.output = output
+
+
+class _ServicesArrayEarlyStop(BaseCallbackHandler):
+    """
+    Stops the ReAct loop as soon as an intermediate step already carries the final
+    [{"name": ..., "path": ...}] array, saving the remaining LLM round-trips.
     """
+
+    # Exceptions from handlers are swallowed by the callback manager unless this is set
+    raise_error = True
+
+    def on_agent_action(self, action, **kwargs) -> None:
+        array_match = _JSON_ARRAY_RE.search(action.log or "")
+        if not array_match:
+            return
+        try:
+            services = _json_loads(array_match.group())
+        except json.JSONDecodeError:
+            return
+        if services and all(isinstance(svc, dict) and "name" in svc and "path" in svc for svc in services):
+            logger.info("Services array found in intermediate agent step, stopping early")
+            raise _EarlyStop(array_match.group())
+
+
+def _to_component(svc: dict, repo_root_url: str) -> SelfBuiltComponent:
+    path = (svc.get("path") or "").strip()
+    return SelfBuiltComponent(
+        name=(svc.get("name") or "").strip(),
+        path=path,
+        display_url=f"{repo_root_url}{path}",
+        owner=Owner(),
+        language=None,
+        component_type=ComponentType.UNKNOWN,
+        evidence=svc.get("evidence", ""),
+        confidence=svc.get("confidence", ""),
     )
 
+
+def monorepo_inspector_agent(state: RootRepoState, config: RunnableConfig) -> RootRepoState:
+    # Imported here so that loading the workflow graph does not pull in the langchain agents stack
+    from langchain import hub
+    from langchain.agents import create_react_agent, AgentExecutor
+
+    logger.info("👀  extra checks for *mono-repo* – placeholder implementation")
+
+    # Get model name from config if provided
+    model_name = config.get("configurable", {}).get("model_name") if config else None
+    llm = init_llm_by_provider(model_name)
+    tools = [discover_services_tool, repo_get_head_sha, repo_list_tree, repo_read_file, repo_search_code]
+    repo_root_url = state.repo_root_url
+
+    # Get user-provided context for injection into prompt
+    context_section = format_context_for_prompt(state.discovery_context)
+
+    prompt = _MONOREPO_PROMPT_TEMPLATE.format(repo_root_url=repo_root_url, context_section=context_section)
+
     react_prompt = hub.pull("hwchase17/react")
 
     agent = create_react_agent(
@@ -131,10 +186,14 @@ def monorepo_inspector_agent(state: RootRepoState, config: RunnableConfig) -> Ro
         max_iterations=3,
     )
 
-    response = agent_executor.invoke(
-        {"input": prompt},
-        return_only_outputs=True
-    )
+    try:
+        response = agent_executor.invoke(
+            {"input": prompt},
+            config={"callbacks": [_ServicesArrayEarlyStop()]},
+            return_only_outputs=True
+        )
+    except _EarlyStop as stop:
+        response = {"output": stop.output}
 
     # Extract the JSON array returned by the LLM
     # Get the output from the response
@@ -143,24 +202,14 @@ def monorepo_inspector_agent(state: RootRepoState, config: RunnableConfig) -> Ro
 
     # Extract and parse JSON from the response
     try:
-        import re
         # Clean up output: remove everything before the first '[' and after the last ']'
-        array_match = re.search(r'\[.*?\]', services_str, re.DOTALL)
+        array_match = _JSON_ARRAY_RE.search(services_str)
         if array_match:
             json_array_str = array_match.group()
-            services = json.loads(json_array_str)
+            services = _json_loads(json_array_str)
             logger.info(f"Parsed {len(services)} services: {services}")
 
-            for svc in services:
-                component = SelfBuiltComponent(
-                    name=svc.get("name", "").strip(),
-                    path=svc.get("path", "").strip(),
-                    display_url=f"{repo_root_url}{svc.get('path', '').strip()}",
-                    owner=Owner(),
-                    language=None,
-                    component_type=ComponentType.UNKNOWN
-                )
-                state.self_built_software.append(component)
+            state.self_built_software.extend(_to_component(svc, repo_root_url) for svc in services)
         else:
             logger.warning("No JSON array found in agent response")
 
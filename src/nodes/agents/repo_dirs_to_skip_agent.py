@@ -1,4 +1,3 @@
-from langchain.agents import initialize_agent
 from langchain_core.runnables import RunnableConfig
 
 from src.ai_provider.ai_provider import init_llm_by_provider
@@ -10,6 +9,8 @@ logger = get_logger(__name__)
 
 def repo_type_inspector_agent(state: RootRepoState, config: RunnableConfig) -> RootRepoState:
     """Takes repository data, and determines if a repository is a mono-repo or single-purpose-repo"""
+    # Imported here so that loading the workflow graph does not pull in the langchain agents stack
+    from langchain.agents import initialize_agent
 
     # Get model name from config if provided
     model_name = config.get("configurable", {}).get("model_name") if config else None
@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 from typing import List, Optional
 
 from langchain_core.output_parsers import JsonOutputParser
@@ -10,6 +12,9 @@ from src.logging.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on concurrent LLM calls in tech_stack_agent_batch, keeps large mono-repos under provider rate limits
+TECH_STACK_MAX_CONCURRENCY = 16
+
 
 class ConfidenceLevel(str, Enum):
     high = "high"
@@ -30,38 +35,36 @@ class TechStack(BaseModel):
 class TechStackResult(BaseModel):
     tech_stacks: List[TechStack] = Field(description="List of tech stacks with name and version")
 
-def tech_stack_agent(dependency_file_content: str, model_name: Optional[str] = None) -> TechStackResult:
-    """
-    Analyze a dependency management file and return a list of tech stacks used, including name and version.
-    """
-    llm = init_llm_by_provider(model_name)
-    parser = JsonOutputParser(pydantic_object=TechStackResult)
-    prompt_text = """
+# Technologies the model should prioritize; rendered once into the prompt
+_TECH_LIST = frozenset({
+    "Adobe Commerce", "AIOHTTP", "Akka", "Ambiorix", "Angular", "Apache HttpClient", "Apache HttpCore",
+    "Apache Log4j API", "ASP.NET", "ASP.NET Core", "Aura", "Aurelia", "Axum", "Azure OpenAI SDK", "Backbone.js",
+    "Beego", "Blazor", "Bootstrap", "Bottle", "breakr", "Buffalo", "Bulma", "CakePHP",
+    "Cf Java Logging Support Core", "Chai", "CherryPy", "Chi", "CMS", "CodeIgniter", "ctix Web", "CubicWeb",
+    "Cypress", "Dash", "Database", "Dioxus", "Django", "Dropwizard", "Drupal", "Echo", "Elasticsearch", "Electron",
+    "Ember.js", "Enzyme", "Express", "Falcon", "FastAPI", "Fastify", "Fat-Free Framework", "Fiery", "Flask",
+    "Flight", "FuelPHP", "Gatsby", "Gin", "Giotto", "Goji", "goqu", "Gorilla", "Grails", "Grape", "Grok",
+    "Growler", "Guava", "Hanami", "Hibernate", "Hug", "Iced", "Inferno", "Jasmine", "Javalin", "JDBI", "Jersey",
+    "Jest", "JHipster", "Joomla!", "jQuery", "Juniper", "Junit", "Kitura", "knex", "Knockout", "Kohana", "kotest",
+    "Ktor", "Kweb", "Lagom", "Laminas Project", "Laravel", "LiftWeb", "Lithium", "Logback Classic Module",
+    "MariaDB", "Martini", "Masonite", "Medoo", "Meteor", "Micronaut", "MobX", "Mocha", "MongoDB", "Morepath",
+    "MyBatis", "MySQL", "Nagare", "NestJS", "Nette", "Next.js", "Nuxt", "October CMS", "Phalcon", "Phoenix",
+    "PHP-MVC", "PHPixie", "Play", "PlayWright", "Polymer", "PostgreSQL", "Preact", "PrestaShop", "Project Lombok",
+    "Prophecy", "Protractor", "Pyramid", "Quarkus", "Quart", "Qwik", "Ratpack", "React", "Reahl", "Redis", "Redux",
+    "Remix", "Responder", "Revel", "Rocket", "Ruby on Rails", "Sanic", "Sass", "Semantic UI", "Sequelize",
+    "Shiny for R", "Silex", "Sinatra", "Slim", "SolidJS", "Spark", "Spring Boot", "SQL Server", "SQLite",
+    "Stencil", "Struts", "Svelte", "Swagger UI", "Symfony", "Tailwind CSS", "Tauri", "Thymeleaf", "Tokio",
+    "TurboGears", "TypeORM", "Vaadin Framework", "Vapor", "Vavr", "Vert.x", "Vitest", "Vue.js", "Warp", "Web.go",
+    "Web2py", "Wicket", "WordPress", "Yew", "Yii", "Zope", "ZURB Foundation"
+})
+_TECH_LIST_STR = ", ".join(sorted(_TECH_LIST, key=str.lower))
+
+_TECH_STACK_PROMPT = """
         SYSTEM: You must reply ONLY with a valid JSON object matching the output schema below.
         Given the content of a dependency management file, analyze and extract the list of major technologies, frameworks, platforms, or languages used by the project and their versions.
 
         - Prioritize the following list of technologies, frameworks, and platforms when extracting tech stacks (but do not limit to it alone):
-        [
-            "ctix Web", "Adobe Commerce", "AIOHTTP", "Akka", "Ambiorix", "Angular", "Apache HttpClient", "Apache HttpCore",
-            "Apache Log4j API", "ASP.NET", "ASP.NET Core", "Aura", "Aurelia", "Axum", "Azure OpenAI SDK", "Backbone.js",
-            "Beego", "Blazor", "Bootstrap", "Bottle", "breakr", "Buffalo", "Bulma", "CakePHP", "Cf Java Logging Support Core",
-            "Chai", "CherryPy", "Chi", "CMS", "CodeIgniter", "CubicWeb", "Cypress", "Dash", "Database", "Dioxus", "Django",
-            "Dropwizard", "Drupal", "Echo", "Elasticsearch", "Electron", "Ember.js", "Enzyme", "Express", "Falcon", "FastAPI",
-            "Fastify", "Fat-Free Framework", "Fiery", "Flask", "Flight", "FuelPHP", "Gatsby", "Gin", "Giotto", "Goji", "goqu",
-            "Gorilla", "Grails", "Grape", "Grok", "Growler", "Guava", "Hanami", "Hibernate", "Hug", "Iced", "Inferno",
-            "Jasmine", "Javalin", "JDBI", "Jersey", "Jest", "JHipster", "Joomla!", "jQuery", "Juniper", "Junit", "Kitura",
-            "knex", "Knockout", "Kohana", "kotest", "Ktor", "Kweb", "Lagom", "Laminas Project", "Laravel",
-            "LiftWeb", "Lithium", "Logback Classic Module", "MariaDB", "Martini", "Masonite",
-            "Medoo", "Meteor", "Micronaut", "MobX", "Mocha", "MongoDB", "Morepath", "MyBatis", "MySQL", "Nagare", "NestJS",
-            "Nette", "Next.js", "Nuxt", "October CMS", "Phalcon", "Phoenix", "PHPixie", "PHP-MVC", "Play", "PlayWright",
-            "Polymer", "PostgreSQL", "Preact", "PrestaShop", "Project Lombok", "Prophecy", "Protractor", "Pyramid", "Quarkus",
-            "Quart", "Qwik", "Ratpack", "React", "Reahl", "Redis", "Redux", "Remix", "Responder", "Revel", "Rocket",
-            "Ruby on Rails", "Sanic", "Sass", "Semantic UI", "Sequelize", "Shiny for R", "Silex", "Sinatra", "Slim",
-            "SolidJS", "Spark", "Spring Boot", "SQLite", "SQL Server", "Stencil", "Struts", "Svelte", "Swagger UI",
-            "Symfony", "Tailwind CSS", "Tauri", "Thymeleaf", "Tokio", "TurboGears", "TypeORM", "Vaadin Framework", "Vapor",
-            "Vavr", "Vert.x", "Vitest", "Vue.js", "Warp", "Web2py", "Web.go", "Wicket", "WordPress", "Yew", "Yii", "Zope",
-            "ZURB Foundation"
-        ]
+        {tech_list}
         - Only include major frameworks, platforms, languages, or umbrella technologies (e.g., Spring Boot, Django, React, Node.js, PostgreSQL, Java, TypeScript, etc.).
         - Do NOT include low-level dependencies, utility libraries, or drivers (e.g., do not include 'pg', include 'PostgreSQL'; do not include 'mysql-connector', include 'MySQL').
         - You can use string matching to identify technologies from the dependency file content.
@@ -70,7 +73,6 @@ def tech_stack_agent(dependency_file_content: str, model_name: Optional[str] = N
         - Map any dependency containing 'junit', 'JUnit', or 'org.junit' to 'JUnit'.
         - Map any dependency containing 'kotest' or 'Kotest' to 'Kotest'.
         - Map any dependency containing 'guava' or 'Guava' to 'Guava'.
-        - Map any dependency containing 'guava' or 'Guava' to 'Guava'.
         - Map any dependency containing 'log4j' to 'Apache Log4j API'.
         - Map any dependency containing 'fastify' to 'Fastify'.
         - Map any dependency containing 'openapi' to 'Swagger UI'.
@@ -102,13 +104,29 @@ def tech_stack_agent(dependency_file_content: str, model_name: Optional[str] = N
         
         """
 
+
+@lru_cache(maxsize=8)
+def _get_tech_stack_chain(model_name: Optional[str] = None):
+    """
+    Build the prompt | llm | parser chain once per model; the prompt and schema never change between calls.
+    """
+    llm = init_llm_by_provider(model_name)
+    parser = JsonOutputParser(pydantic_object=TechStackResult)
+
     prompt = PromptTemplate(
-        template=prompt_text,
+        template=_TECH_STACK_PROMPT,
         input_variables=["dependency_file_content"],
-        partial_variables={"format_instructions": parser.get_format_instructions()}
+        partial_variables={"format_instructions": parser.get_format_instructions(), "tech_list": _TECH_LIST_STR}
     )
 
-    chain = prompt | llm | parser
+    return prompt | llm | parser
+
+
+def tech_stack_agent(dependency_file_content: str, model_name: Optional[str] = None) -> TechStackResult:
+    """
+    Analyze a dependency management file and return a list of tech stacks used, including name and version.
+    """
+    chain = _get_tech_stack_chain(model_name)
 
     try:
         response = chain.invoke({"dependency_file_content": dependency_file_content})
@@ -118,3 +136,17 @@ def tech_stack_agent(dependency_file_content: str, model_name: Optional[str] = N
 
     logger.info(f"Tech stack LLM output: {response}")
     return response
+
+
+def tech_stack_agent_batch(contents: List[str], model_name: Optional[str] = None) -> List[TechStackResult]:
+    """
+    Analyze several dependency management files concurrently, at most TECH_STACK_MAX_CONCURRENCY at a time.
+    Results are returned in input order.
+    Threads rather than an event loop per call: the chain and its LLM client are cached for the process,
+    and an async client bound to an earlier, already closed loop fails on the next asyncio.run.
+    """
+    if not contents:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(TECH_STACK_MAX_CONCURRENCY, len(contents))) as executor:
+        return list(executor.map(lambda content: tech_stack_agent(content, model_name), contents))
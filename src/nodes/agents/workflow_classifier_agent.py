@@ -1,64 +1,357 @@
+import hashlib
 import os
-from itertools import islice
-from typing import Literal, List, Optional
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from typing import Dict, Literal, List, Optional, Tuple
+
+from langchain_core.output_parsers import JsonOutputParser
 
 from src.ai_provider.ai_provider import init_llm_by_provider
 from src.logging.logging import get_logger
 
 logger = get_logger(__name__)
 
+WorkflowClassification = Literal["deployment", "tooling", "unknown"]
+
+# Per-workflow content cap in batched prompts, keeps N workflows within a sane prompt size
+BATCH_WORKFLOW_MAX_CHARS = 4096
+
+# Upper bound on bytes read for the README head
+README_HEAD_MAX_BYTES = 16384
+
+# Upper bound on concurrent per-file fallback classifications in workflow_classifier_agent_batch
+WORKFLOW_CLASSIFIER_MAX_CONCURRENCY = 8
+
+# Number of LLM classifications remembered for the lifetime of the process
+CLASSIFICATION_CACHE_MAX_ENTRIES = 4096
+
+# (content digest, workflow file name, context digest) -> LLM classification, least recently used first.
+# Backed by a SQLite table when WORKFLOW_CLASSIFICATION_CACHE_PATH is set, so later runs reuse answers too.
+_CLASSIFICATION_CACHE: "OrderedDict[Tuple[str, str, str], WorkflowClassification]" = OrderedDict()
+_CLASSIFICATION_CACHE_LOCK = threading.Lock()
+
+_CLASSIFICATION_RULES = (
+    "classify the workflow as either a 'deployment workflow' (a workflow that directly deploys or releases an application or service to a runtime environment, such as Kubernetes, cloud, or production/staging servers), "
+    "a 'tooling workflow' (automation, migration, provisioning, code quality, reusable or template workflows, or similar tasks that do NOT directly deploy or release applications/services), "
+    "or 'unknown' if unclear.\n"
+    "If the workflow only calls other reusable workflows (using 'uses: ./.github/workflows/xyz.yml') and does not itself contain deployment or release steps, classify it as 'tooling'.\n"
+    "If the workflow is designed to be called by other workflows (e.g., uses 'workflow_call'), classify it as 'tooling' unless it directly deploys something itself.\n"
+    "If the workflow only builds and publishes documentation or static sites (e.g., to GitHub Pages), classify it as 'tooling'.\n"
+)
+
+
+# Rule-based shortcuts for the cases the classification rules above already decide
+_WORKFLOW_CALL_RE = re.compile(r'^\s*workflow_call\s*:', re.MULTILINE)
+# Target of every job- or step-level `uses:`; local reusable workflows start with "./"
+_USES_RE = re.compile(r'^\s*(?:-\s*)?uses:\s*["\']?([^\s"\'#]+)', re.MULTILINE)
+_CLASSIFICATION_LABEL_RE = re.compile(r'\b(deployment|tooling|unknown)\b')
+_STEPS_RE = re.compile(r'^\s*steps\s*:', re.MULTILINE)
+_PAGES_PUBLISH_RE = re.compile(r'peaceiris/actions-gh-pages|actions/deploy-pages')
+# Actions a GitHub Pages publish may use besides its own: GitHub's first-party actions
+_PAGES_WORKFLOW_ACTION_RE = re.compile(r'actions/|peaceiris/actions-gh-pages@')
+_DEPLOY_COMMAND_RE = re.compile(
+    r'kubectl|helm\s+(?:upgrade|install)|docker\s+push|cf\s+push|terraform\s+apply|'
+    r'az\s+webapp|aws\s+(?:ecs|lambda|deploy)|gcloud\s+(?:run|app|functions)|serverless\s+deploy|sam\s+deploy'
+)
+
+
+def _fast_classify(workflow_content: str) -> Optional[WorkflowClassification]:
+    """
+    Classify the unambiguous tooling cases without an LLM call; None means the LLM has to decide.
+    Anything that may deploy, including through a marketplace action, is left to the LLM.
+    """
+    remote_uses = [target for target in _USES_RE.findall(workflow_content) if not target.startswith("./")]
+    # Every job only calls local reusable workflows and there are no steps of its own
+    if not remote_uses and _USES_RE.search(workflow_content) and not _STEPS_RE.search(workflow_content):
+        return "tooling"
+    if _DEPLOY_COMMAND_RE.search(workflow_content):
+        return None
+    # Called by other workflows, using no actions and never mentioning a deployment
+    if _WORKFLOW_CALL_RE.search(workflow_content) and not remote_uses and "deploy" not in workflow_content.lower():
+        return "tooling"
+    # Publishes to GitHub Pages with nothing but GitHub's own and the Pages actions
+    if _PAGES_PUBLISH_RE.search(workflow_content) and all(
+        _PAGES_WORKFLOW_ACTION_RE.match(target) for target in remote_uses
+    ):
+        return "tooling"
+    return None
+
+
+def _normalize_classification(answer: str) -> Optional[WorkflowClassification]:
+    """
+    Reduce an LLM answer such as "Deployment." or "This is a tooling workflow" to one of the three
+    labels; None when it names none or several of them. Only normalized labels are ever cached.
+    """
+    labels = set(_CLASSIFICATION_LABEL_RE.findall(answer.lower()))
+    return labels.pop() if len(labels) == 1 else None
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _classification_context_digest(repo_path: str, readme_lines: int, strong_signals: Optional[List[str]]) -> str:
+    """
+    Digest of the repository context that goes into the prompt next to the workflow: the README head
+    and the strong deployment signals. Part of the cache key, so a repository with other context
+    does not reuse another repository's answer for the same workflow file.
+    """
+    return _digest(_read_readme_head(repo_path, readme_lines) + "\0" + _format_strong_signals(strong_signals))
+
+
+def _classification_cache_key(workflow_content: str, workflow_path: str, context_digest: str) -> Tuple[str, str, str]:
+    # Keyed by content rather than full path, so the same workflow in another checkout or directory is classified once
+    return _digest(workflow_content), os.path.basename(workflow_path), context_digest
+
+
+def _connect_classification_cache() -> sqlite3.Connection:
+    cache_path = os.path.expanduser(os.environ["WORKFLOW_CLASSIFICATION_CACHE_PATH"])
+    # The documented default lives in ~/.cache, which may not exist yet
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    conn = sqlite3.connect(cache_path)
+    # Versioned table name: bump when the prompt or rules change so old answers are not reused
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS workflow_classification_v1 ("
+        "content_digest TEXT NOT NULL, file_name TEXT NOT NULL, context_digest TEXT NOT NULL, "
+        "classification TEXT NOT NULL, PRIMARY KEY (content_digest, file_name, context_digest))"
+    )
+    return conn
+
+
+def _remember_classification(key: Tuple[str, str, str], classification: WorkflowClassification) -> None:
+    with _CLASSIFICATION_CACHE_LOCK:
+        _CLASSIFICATION_CACHE[key] = classification
+        _CLASSIFICATION_CACHE.move_to_end(key)
+        while len(_CLASSIFICATION_CACHE) > CLASSIFICATION_CACHE_MAX_ENTRIES:
+            _CLASSIFICATION_CACHE.popitem(last=False)
+
+
+def _get_cached_classification(
+    workflow_content: str, workflow_path: str, context_digest: str
+) -> Optional[WorkflowClassification]:
+    key = _classification_cache_key(workflow_content, workflow_path, context_digest)
+    with _CLASSIFICATION_CACHE_LOCK:
+        classification = _CLASSIFICATION_CACHE.get(key)
+        if classification is not None:
+            _CLASSIFICATION_CACHE.move_to_end(key)
+            return classification
+    if not os.getenv("WORKFLOW_CLASSIFICATION_CACHE_PATH"):
+        return None
+    try:
+        with closing(_connect_classification_cache()) as conn:
+            row = conn.execute(
+                "SELECT classification FROM workflow_classification_v1 "
+                "WHERE content_digest = ? AND file_name = ? AND context_digest = ?",
+                key
+            ).fetchone()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Could not read workflow classification cache: {e}")
+        return None
+    if row is None:
+        return None
+    _remember_classification(key, row[0])
+    return row[0]
+
+
+def _cache_classification(
+    workflow_content: str, workflow_path: str, context_digest: str, classification: WorkflowClassification
+) -> None:
+    key = _classification_cache_key(workflow_content, workflow_path, context_digest)
+    _remember_classification(key, classification)
+    if not os.getenv("WORKFLOW_CLASSIFICATION_CACHE_PATH"):
+        return
+    try:
+        with closing(_connect_classification_cache()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO workflow_classification_v1 VALUES (?, ?, ?, ?)",
+                (*key, classification)
+            )
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Could not write workflow classification cache: {e}")
+
+
+def _read_readme_head(repo_path: str, readme_lines: int) -> str:
+    """
+    Return the first readme_lines lines of the repository README, or an empty string if unavailable.
+    """
+    readme_path = os.path.join(repo_path, "README.md")
+    try:
+        st = os.stat(readme_path)
+    except OSError:
+        return ""
+    # mtime/size in the key so a re-cloned repo at the same path is never served a stale README
+    return _read_readme_head_cached(readme_path, st.st_mtime_ns, st.st_size, readme_lines)
+
+
+@lru_cache(maxsize=64)
+def _read_readme_head_cached(readme_path: str, mtime_ns: int, size: int, readme_lines: int) -> str:
+    # One bounded read instead of iterating the file line by line; the head never needs more than this
+    try:
+        with open(readme_path, "rb") as f:
+            data = f.read(min(size, README_HEAD_MAX_BYTES))
+    except OSError as e:
+        logger.warning(f"Could not read README.md: {e}")
+        return ""
+    return "".join(data.decode("utf-8", errors="replace").splitlines(keepends=True)[:readme_lines])
+
+
+def _format_strong_signals(strong_signals: Optional[List[str]]) -> str:
+    if not strong_signals:
+        return ""
+    return (
+        "\nStrong deployment signals detected in this repository (file names):\n"
+        + "\n".join(strong_signals)
+    )
+
+
+def _build_classification_prompt(
+    workflow_content: str,
+    workflow_path: str,
+    repo_path: str,
+    readme_lines: int,
+    strong_signals: Optional[List[str]]
+) -> str:
+    readme_content = _read_readme_head(repo_path, readme_lines)
+    strong_signals_str = _format_strong_signals(strong_signals)
+    prompt = (
+        "You are an expert in DevOps and CI/CD. "
+        "Given the following GitHub Actions workflow file content, its file name and path, "
+        "the first part of the repository's README, and a list of strong deployment signals (if any), "
+        + _CLASSIFICATION_RULES
+        + "Respond with only one word: deployment, tooling, or unknown.\n"
+        f"Workflow file path: {workflow_path}\n"
+        f"README (first {readme_lines} lines):\n{readme_content}\n"
+        f"{strong_signals_str}\n"
+        "Workflow content:\n"
+        f"{workflow_content}"
+    )
+    logger.debug(f"Prompt for classification (truncated): {prompt[:500]}...")
+    return prompt
+
+
 def workflow_classifier_agent(
     workflow_content: str,
     workflow_path: str,
     repo_path: str = ".",
     readme_lines: int = 20,
     strong_signals: Optional[List[str]] = None
-) -> Literal["deployment", "tooling", "unknown"]:
+) -> WorkflowClassification:
     """
     Use LLM to classify a workflow file as deployment or tooling, including the first part of the README for context,
     the workflow file name/path, and any strong deployment signals found in the repo.
     """
+    fast = _fast_classify(workflow_content)
+    if fast:
+        logger.info(f"Workflow '{workflow_path}' classified by rules as: {fast}")
+        return fast
+    context_digest = _classification_context_digest(repo_path, readme_lines, strong_signals)
+    cached = _get_cached_classification(workflow_content, workflow_path, context_digest)
+    if cached:
+        logger.info(f"Workflow '{workflow_path}' classification reused from cache: {cached}")
+        return cached
+
     logger.info("Initializing LLM for workflow classification.")
-    readme_content = ""
-    readme_path = os.path.join(repo_path, "README.md")
-    if os.path.exists(readme_path):
-        try:
-            with open(readme_path, "r", encoding="utf-8") as f:
-                readme_content = "".join(list(islice(f, readme_lines)))
-        except Exception as e:
-            logger.warning(f"Could not read README.md: {e}")
-
-    strong_signals_str = ""
-    if strong_signals:
-        strong_signals_str = (
-            "\nStrong deployment signals detected in this repository (file names):\n"
-            + "\n".join(strong_signals)
-        )
+    try:
+        llm = init_llm_by_provider()
+        prompt = _build_classification_prompt(workflow_content, workflow_path, repo_path, readme_lines, strong_signals)
+        response = llm.invoke(prompt)
+        classification = _normalize_classification(response.content)
+        if classification is None:
+            logger.warning(f"Unexpected workflow classification for '{workflow_path}': {response.content!r}")
+            return "unknown"
+        logger.info(f"Workflow classified as: {classification}")
+        _cache_classification(workflow_content, workflow_path, context_digest, classification)
+        return classification
+    except Exception as e:
+        logger.error(f"Exception during workflow classification: {e}", exc_info=True)
+        return "unknown"
+
+
+def workflow_classifier_agent_batch(
+    workflows: List[Tuple[str, str]],
+    repo_path: str = ".",
+    readme_lines: int = 20,
+    strong_signals: Optional[List[str]] = None
+) -> Dict[str, WorkflowClassification]:
+    """
+    Classify several workflow files with a single LLM call. Takes (workflow_content, workflow_path) pairs and
+    returns a mapping of workflow path to classification. Falls back to per-file classification when the
+    batched response cannot be parsed or is missing a workflow.
+    """
+    if not workflows:
+        return {}
+    context_digest = _classification_context_digest(repo_path, readme_lines, strong_signals)
+    classifications: Dict[str, WorkflowClassification] = {}
+    pending: List[Tuple[str, str]] = []
+    for content, path in workflows:
+        known = _fast_classify(content) or _get_cached_classification(content, path, context_digest)
+        if known:
+            classifications[path] = known
+        else:
+            pending.append((content, path))
+    if classifications:
+        logger.info(f"Workflows classified by rules or cache: {classifications}")
+
+    workflows = pending
+    if not workflows:
+        return classifications
+    if len(workflows) == 1:
+        content, path = workflows[0]
+        classifications[path] = workflow_classifier_agent(content, path, repo_path, readme_lines, strong_signals)
+        return classifications
+
+    readme_content = _read_readme_head(repo_path, readme_lines)
+    strong_signals_str = _format_strong_signals(strong_signals)
+
+    sections = "".join(
+        f"--- WORKFLOW {i}: path={path} ---\n{content[:BATCH_WORKFLOW_MAX_CHARS]}\n"
+        for i, (content, path) in enumerate(workflows, start=1)
+    )
 
     try:
         llm = init_llm_by_provider()
         prompt = (
             "You are an expert in DevOps and CI/CD. "
-            "Given the following GitHub Actions workflow file content, its file name and path, "
+            f"Given the following {len(workflows)} GitHub Actions workflow files (content, file name and path), "
             "the first part of the repository's README, and a list of strong deployment signals (if any), "
-            "classify the workflow as either a 'deployment workflow' (a workflow that directly deploys or releases an application or service to a runtime environment, such as Kubernetes, cloud, or production/staging servers), "
-            "a 'tooling workflow' (automation, migration, provisioning, code quality, reusable or template workflows, or similar tasks that do NOT directly deploy or release applications/services), "
-            "or 'unknown' if unclear.\n"
-            "If the workflow only calls other reusable workflows (using 'uses: ./.github/workflows/xyz.yml') and does not itself contain deployment or release steps, classify it as 'tooling'.\n"
-            "If the workflow is designed to be called by other workflows (e.g., uses 'workflow_call'), classify it as 'tooling' unless it directly deploys something itself.\n"
-            "If the workflow only builds and publishes documentation or static sites (e.g., to GitHub Pages), classify it as 'tooling'.\n"
-            "Respond with only one word: deployment, tooling, or unknown.\n"
-            f"Workflow file path: {workflow_path}\n"
+            "for each workflow "
+            + _CLASSIFICATION_RULES
+            + "Respond with only a JSON object mapping each workflow path to one of: \"deployment\", \"tooling\", \"unknown\".\n"
             f"README (first {readme_lines} lines):\n{readme_content}\n"
             f"{strong_signals_str}\n"
-            "Workflow content:\n"
-            f"{workflow_content}"
+            f"{sections}"
         )
-        logger.debug(f"Prompt for classification (truncated): {prompt[:500]}...")
+        logger.debug(f"Prompt for batch classification (truncated): {prompt[:500]}...")
         response = llm.invoke(prompt)
-        classification = response.content.strip().lower()
-        logger.info(f"Workflow classified as: {classification}")
-        return classification
+        parsed = JsonOutputParser().parse(response.content)
+        if not isinstance(parsed, dict):
+            raise TypeError(f"Expected a JSON object, got {type(parsed).__name__}")
+        for content, path in workflows:
+            value = parsed.get(path)
+            classification = _normalize_classification(value) if isinstance(value, str) else None
+            # Anything but one of the three labels is classified again on its own below
+            if classification is not None:
+                classifications[path] = classification
+                _cache_classification(content, path, context_digest, classification)
     except Exception as e:
-        logger.error(f"Exception during workflow classification: {e}", exc_info=True)
-        return "unknown"
+        logger.warning(f"Batch workflow classification failed, falling back to per-file classification: {e}")
+
+    missing = [(content, path) for content, path in workflows if path not in classifications]
+    if missing:
+        # Overlap the per-file fallback calls instead of running them back to back. Threads, not
+        # asyncio.run: the LLM client is cached for the process and must not be tied to a closed loop.
+        with ThreadPoolExecutor(max_workers=min(WORKFLOW_CLASSIFIER_MAX_CONCURRENCY, len(missing))) as executor:
+            results = executor.map(
+                lambda workflow: workflow_classifier_agent(*workflow, repo_path, readme_lines, strong_signals),
+                missing,
+            )
+            for (_, path), classification in zip(missing, results):
+                classifications[path] = classification
+
+    logger.info(f"Workflows classified as: {classifications}")
+    return classifications
@@ -1,5 +1,5 @@
 import os
-from collections import Counter
+from collections import defaultdict, deque
 from typing import Literal
 
 from src.dto.state_dto import RootRepoState
@@ -7,82 +7,31 @@ from src.logging.logging import get_logger
 
 logger = get_logger(__name__)
 
-BUILD_MANIFESTS = {
+BUILD_MANIFESTS = frozenset({
     "package.json", "pyproject.toml", "setup.py", "pom.xml",
     "go.mod", "Cargo.toml", "build.gradle", "build.gradle.kts",
     "requirements.txt",
-}
-DOCKERFILE_NAMES = {"Dockerfile", "dockerfile"}
+})
+DOCKERFILE_NAMES = frozenset({"Dockerfile", "dockerfile"})
+# Single gate for the common case of a file matching neither set
+_ALL_MARKERS = BUILD_MANIFESTS | DOCKERFILE_NAMES
+# Dependency and build output directories: large, never services, and their
+# vendored manifests would inflate the hit counts (hidden dirs are skipped anyway)
+SKIP_DIRS = frozenset({
+    "node_modules", "vendor", "venv", "dist", "build", "target",
+    "__pycache__", "out", "coverage", "bin", "obj",
+})
 
 RepoType = Literal["mono-repo", "single-purpose-repo"]
 
 
-def classify_repo_type_runnable(state: RootRepoState) -> RootRepoState:
-    """
-    Decide whether a locally cloned repo is a *mono-repo* or *single-purpose-repo*
-    by looking for build manifests / Dockerfiles in the root and one-level-deep
-    sub-directories.
-    """
-
-    if not state.local_path:
-        raise ValueError("local_path is required but not set in state")
-
-    if not os.path.exists(state.local_path):
-        raise ValueError(f"Local repository path does not exist: {state.local_path}")
-
-    logger.info(f"↪️ classify_repo_type_runnable({state.local_path})")
+MONO_REPO_SCORE = 3
 
-    def get_depth(path: str, base_path: str) -> int:
-        """Calculate the depth of a file relative to the base path"""
-        rel_path = os.path.relpath(path, base_path)
-        if rel_path == ".":
-            return 0
-        return len(rel_path.split(os.sep))
 
-    manifest_hits, docker_hits = 0, 0
-    per_dir_hits = Counter()
-
-    # Walk through the repository directory
-    for root, dirs, files in os.walk(state.local_path):
-        # Skip .git directories and other hidden directories
-        dirs[:] = [d for d in dirs if not d.startswith('.')]
-
-        depth = get_depth(root, state.local_path)
-
-        # Only look at root level (depth 0) and up to 3 levels deep to match original tool behavior
-        # Skip deeper directories to avoid scanning too much
-        if depth > 3:
-            dirs.clear()  # Don't recurse further
-            continue
-
-        for filename in files:
-            # Skip hidden files
-            if filename.startswith('.'):
-                continue
-
-            file_path = os.path.join(root, filename)
-
-            # Determine the top-level directory for this file
-            if depth == 0:
-                top_dir = ""  # Root level
-            else:
-                # Get the immediate subdirectory under root
-                rel_path = os.path.relpath(root, state.local_path)
-                top_dir = rel_path.split(os.sep)[0]
-
-            if filename in BUILD_MANIFESTS:
-                manifest_hits += 1
-                per_dir_hits[top_dir] += 1
-                logger.debug(f"Found build manifest: {file_path}")
-            elif filename in DOCKERFILE_NAMES:
-                docker_hits += 1
-                per_dir_hits[top_dir] += 1
-                logger.debug(f"Found Dockerfile: {file_path}")
-
-    logger.info(f"📦 manifests={manifest_hits} dockerfiles={docker_hits} dirs_with_hits={len(per_dir_hits)}")
-    logger.debug(f"Directories with hits: {dict(per_dir_hits)}")
-
-    # Decide repo type based on weighted scoring system
+def _score(manifest_hits: int, docker_hits: int, dirs_with_hits: int) -> int:
+    """
+    Weighted score used to decide the repo type; MONO_REPO_SCORE or more means mono-repo.
+    """
     # Score calculation (more conservative approach):
     # - Multiple manifests: Only score if significantly more than typical single-purpose
     # - Multiple dockerfiles: Strong indicator of multiple services
@@ -94,7 +43,7 @@ def classify_repo_type_runnable(state: RootRepoState) -> RootRepoState:
     # Require 3+ manifests OR 2+ manifests in different directories
     if manifest_hits >= 3:
         score += 2  # Strong indicator
-    elif manifest_hits == 2 and len(per_dir_hits) > 1:
+    elif manifest_hits == 2 and dirs_with_hits > 1:
         score += 1  # Moderate indicator
 
     # Add points for multiple dockerfiles (strong indicator of multiple services)
@@ -103,16 +52,85 @@ def classify_repo_type_runnable(state: RootRepoState) -> RootRepoState:
 
     # Add points for build artifacts spread across multiple directories
     # But require substantial distribution (3+ directories for strong signal)
-    if len(per_dir_hits) >= 3:
+    if dirs_with_hits >= 3:
         score += 2
-    elif len(per_dir_hits) == 2:
+    elif dirs_with_hits == 2:
         score += 1
 
+    return score
+
+
+def classify_repo_type_runnable(state: RootRepoState) -> RootRepoState:
+    """
+    Decide whether a locally cloned repo is a *mono-repo* or *single-purpose-repo*
+    by looking for build manifests / Dockerfiles in the root and one-level-deep
+    sub-directories.
+    """
+
+    if not state.local_path:
+        raise ValueError("local_path is required but not set in state")
+
+    if not os.path.exists(state.local_path):
+        raise ValueError(f"Local repository path does not exist: {state.local_path}")
+
+    logger.info(f"↪️ classify_repo_type_runnable({state.local_path})")
+
+    manifest_hits, docker_hits = 0, 0
+    per_dir_hits = defaultdict(int)
+    decided = False
+
+    # Breadth-first traversal with os.scandir: DirEntry caches the file type from
+    # the directory read, and branches deeper than 3 levels are never opened.
+    # Each frame carries the top-level directory its files are attributed to
+    # ("" for the root level), so it is derived once when descending.
+    pending = deque([(state.local_path, 0, "")])
+    while pending:
+        root, depth, top_dir = pending.popleft()
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    # Skip .git directories and other hidden directories / files
+                    if entry.name.startswith('.'):
+                        continue
+
+                    if entry.is_dir(follow_symlinks=False):
+                        # Only look at root level (depth 0) and up to 3 levels deep to match original tool behavior
+                        if depth < 3 and entry.name not in SKIP_DIRS:
+                            pending.append((entry.path, depth + 1, entry.name if depth == 0 else top_dir))
+                        continue
+
+                    if entry.name not in _ALL_MARKERS:
+                        continue
+
+                    per_dir_hits[top_dir] += 1
+                    if entry.name in BUILD_MANIFESTS:
+                        manifest_hits += 1
+                        logger.debug(f"Found build manifest: {entry.path}")
+                    else:
+                        docker_hits += 1
+                        logger.debug(f"Found Dockerfile: {entry.path}")
+
+                    # Every score component only grows with more hits, so once the
+                    # mono-repo threshold is reached the rest of the tree cannot change the verdict
+                    if _score(manifest_hits, docker_hits, len(per_dir_hits)) >= MONO_REPO_SCORE:
+                        decided = True
+                        break
+        except OSError as exc:
+            logger.debug(f"Could not scan directory {root}: {exc}")
+        if decided:
+            logger.debug("Mono-repo threshold reached, stopping traversal early")
+            break
+
+    logger.info(f"📦 manifests={manifest_hits} dockerfiles={docker_hits} dirs_with_hits={len(per_dir_hits)}")
+    logger.debug(f"Directories with hits: {dict(per_dir_hits)}")
+
+    score = _score(manifest_hits, docker_hits, len(per_dir_hits))
+
     logger.info(f"🏆 Calculated score: {score} (manifests: {manifest_hits}, dockerfiles: {docker_hits}, directories: {len(per_dir_hits)})")
 
     repo_type: RepoType
     # Raise the threshold to be more conservative
-    if score >= 3:
+    if score >= MONO_REPO_SCORE:
         repo_type = "mono-repo"
     else:
         repo_type = "single-purpose-repo"
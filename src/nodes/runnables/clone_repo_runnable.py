@@ -2,17 +2,24 @@ import os
 import shutil
 import subprocess
 import tempfile
+import time
+from typing import Optional
 from urllib.parse import urlparse
 
 from src.dto.state_dto import RootRepoState
 from src.logging.logging import get_logger
+from src.utils.git_utils import read_head_commit
 
 logger = get_logger(__name__)
 
+# Prefix of the per-run directory that holds an uncached clone
+CLONE_WORK_DIR_PREFIX = "sbs-clone-"
+
 def clone_repo_tool_runnable(state: RootRepoState) -> RootRepoState:
     """
     Clone a Git repository to repo temp directory using GITHUB_TOKEN for authentication.
     - Uses default branch if none specified.
+    - When CLONE_CACHE_DIR is set, reuses a cached clone of the same HEAD commit instead of cloning.
     Returns:
     - Updated RootRepoState with local_path set to the cloned repo path.
     """
@@ -26,11 +33,6 @@ def clone_repo_tool_runnable(state: RootRepoState) -> RootRepoState:
         else:
             repo_name = repo_url.split('/')[-1]
 
-        # Create repo temp directory at os temp directory
-        temp_dir = os.path.join(tempfile.gettempdir(), repo_name)
-        os.makedirs(temp_dir, exist_ok=True)
-        local_path = temp_dir
-
         # Get GitHub token from environment
         github_token = os.getenv('GITHUB_TOKEN')
         if not github_token:
@@ -39,34 +41,22 @@ def clone_repo_tool_runnable(state: RootRepoState) -> RootRepoState:
         # Convert GitHub URL to authenticated URL
         authenticated_url = _get_authenticated_url(repo_url, github_token)
 
-        # Remove existing directory if it exists but is not a valid git repo
-        if os.path.exists(local_path):
-            shutil.rmtree(local_path, ignore_errors=True)
-
-        logger.info(f"Cloning {repo_url} to {local_path}")
-
-        # Execute git clone with authenticated URL
-        result = subprocess.run(
-            ["git", "clone", authenticated_url, local_path],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-
-        if result.returncode != 0:
-            # Cleanup on failure
-            if os.path.exists(local_path):
-                shutil.rmtree(local_path, ignore_errors=True)
-            logger.error(f"Git clone failed: {result.stderr}")
-            raise Exception(f"Git clone failed: {result.stderr}")
+        cached_path = _clone_into_cache(repo_url, repo_name, authenticated_url)
+        if cached_path:
+            state.local_path = cached_path
+            return state
 
-        # Verify the clone was successful
-        if not os.path.exists(local_path) or not os.path.exists(os.path.join(local_path, ".git")):
-            if os.path.exists(local_path):
-                shutil.rmtree(local_path, ignore_errors=True)
-            raise Exception("Repository was not cloned properly")
+        # Unique temp directory per run: concurrent runs on the same repo cannot collide,
+        # and there is no leftover clone to remove first. The clone itself goes into
+        # <work_dir>/<repo_name>, because the root service is named after the last path component.
+        work_dir = tempfile.mkdtemp(prefix=CLONE_WORK_DIR_PREFIX)
+        local_path = os.path.join(work_dir, repo_name)
 
-        logger.info(f"Successfully cloned {repo_url} to {local_path}")
+        try:
+            _clone(repo_url, authenticated_url, local_path)
+        except BaseException:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            raise
 
         # Update state with local path
         state.local_path = local_path
@@ -80,6 +70,152 @@ def clone_repo_tool_runnable(state: RootRepoState) -> RootRepoState:
         logger.error(f"Error during clone: {str(exc)}")
         raise exc
 
+def _clone(repo_url: str, authenticated_url: str, local_path: str) -> None:
+    """Clone authenticated_url into local_path, removing local_path again on failure."""
+    logger.info(f"Cloning {repo_url} to {local_path}")
+
+    # Execute git clone with authenticated URL. Blobless single-branch clone: the full
+    # commit history stays available for `git shortlog` (contributor discovery), only
+    # file contents outside the checked-out HEAD are skipped. Not --depth=1 for that reason.
+    result = subprocess.run(
+        ["git", "clone", "--single-branch", "--filter=blob:none", authenticated_url, local_path],
+        capture_output=True,
+        text=True,
+        timeout=300  # 5 minute timeout
+    )
+
+    if result.returncode != 0:
+        # Cleanup on failure
+        if os.path.exists(local_path):
+            shutil.rmtree(local_path, ignore_errors=True)
+        logger.error(f"Git clone failed: {result.stderr}")
+        raise Exception(f"Git clone failed: {result.stderr}")
+
+    # Verify the clone was successful
+    if not os.path.exists(local_path) or not os.path.exists(os.path.join(local_path, ".git")):
+        if os.path.exists(local_path):
+            shutil.rmtree(local_path, ignore_errors=True)
+        raise Exception("Repository was not cloned properly")
+
+    logger.info(f"Successfully cloned {repo_url} to {local_path}")
+
+def get_clone_cache_dir() -> Optional[str]:
+    """Root of the commit-keyed clone cache, or None when caching is disabled (CLONE_CACHE_DIR unset)."""
+    cache_dir = os.getenv("CLONE_CACHE_DIR")
+    return os.path.abspath(os.path.expanduser(cache_dir)) if cache_dir else None
+
+def is_cached_clone(local_path: Optional[str]) -> bool:
+    """True if local_path lives in the clone cache and must outlive the current run."""
+    cache_dir = get_clone_cache_dir()
+    if not cache_dir or not local_path:
+        return False
+    # Cached clones sit at <cache_dir>/<entry>/<repo_name>
+    return os.path.dirname(os.path.dirname(os.path.abspath(local_path))) == cache_dir
+
+def clone_work_dir(local_path: Optional[str]) -> Optional[str]:
+    """The per-run directory holding an uncached clone at local_path, or None if it has none."""
+    if not local_path:
+        return None
+    parent = os.path.dirname(os.path.abspath(local_path))
+    return parent if os.path.basename(parent).startswith(CLONE_WORK_DIR_PREFIX) else None
+
+def _remote_head_sha(authenticated_url: str) -> Optional[str]:
+    """Commit SHA of the remote HEAD via a single ls-remote round-trip, or None if it cannot be resolved."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-remote", authenticated_url, "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+    except subprocess.TimeoutExpired:
+        logger.warning("git ls-remote timed out, cloning without cache")
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        logger.warning(f"git ls-remote failed, cloning without cache: {result.stderr.strip()}")
+        return None
+    return result.stdout.split()[0]
+
+def _clone_into_cache(repo_url: str, repo_name: str, authenticated_url: str) -> Optional[str]:
+    """
+    Return a cached clone of the remote HEAD commit, cloning it into the cache on a miss.
+    Returns None when the cache is disabled or the remote HEAD cannot be resolved.
+    """
+    cache_dir = get_clone_cache_dir()
+    if not cache_dir:
+        return None
+
+    sha = _remote_head_sha(authenticated_url)
+    if not sha:
+        return None
+
+    owner = urlparse(repo_url).path.strip('/').split('/')[0]
+    # The entry is keyed on the commit; the clone inside it keeps the repository name,
+    # which names the root service
+    cache_path = os.path.join(cache_dir, f"{owner}__{repo_name}__{sha}")
+    clone_path = os.path.join(cache_path, repo_name)
+    if os.path.isdir(os.path.join(clone_path, ".git")):
+        logger.info(f"Using cached clone of {repo_url} at {clone_path}")
+        # Mark as recently used for eviction
+        os.utime(cache_path)
+        return clone_path
+    if os.path.isdir(cache_path):
+        # Entries only appear complete (by rename), so this is one from the older flat layout
+        shutil.rmtree(cache_path, ignore_errors=True)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # Clone next to the final location and rename, so a partial clone is never visible under cache_path
+    staging_path = tempfile.mkdtemp(prefix=".staging-", dir=cache_dir)
+    try:
+        _clone(repo_url, authenticated_url, os.path.join(staging_path, repo_name))
+    except BaseException:
+        shutil.rmtree(staging_path, ignore_errors=True)
+        raise
+
+    # A push between ls-remote and the clone means the clone holds a newer commit than `sha`;
+    # file it under the commit it actually contains so the entry name never lies
+    head = read_head_commit(os.path.join(staging_path, repo_name))
+    if not head:
+        shutil.rmtree(staging_path, ignore_errors=True)
+        return None
+    if head != sha:
+        logger.info(f"Remote HEAD of {repo_url} moved from {sha} to {head} while cloning")
+        cache_path = os.path.join(cache_dir, f"{owner}__{repo_name}__{head}")
+        clone_path = os.path.join(cache_path, repo_name)
+    try:
+        os.rename(staging_path, cache_path)
+    except OSError:
+        # Another run populated the same commit first
+        shutil.rmtree(staging_path, ignore_errors=True)
+        if not os.path.isdir(os.path.join(clone_path, ".git")):
+            raise
+
+    _evict_clone_cache(cache_dir, keep=cache_path)
+    return clone_path
+
+def _evict_clone_cache(cache_dir: str, keep: str) -> None:
+    """
+    Remove the least recently used cached clones beyond CLONE_CACHE_MAX_ENTRIES.
+    Every run touches its entry when it starts using it, so an entry used within the last
+    CLONE_CACHE_MIN_AGE_SECONDS may still be read by a concurrent run and is kept even
+    if that leaves the cache over its limit for a while.
+    """
+    max_entries = int(os.getenv("CLONE_CACHE_MAX_ENTRIES", "20"))
+    min_age_seconds = int(os.getenv("CLONE_CACHE_MIN_AGE_SECONDS", str(24 * 60 * 60)))
+    with os.scandir(cache_dir) as entries:
+        clones = [
+            (entry.stat(follow_symlinks=False).st_mtime, entry.path) for entry in entries
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.') and entry.path != keep
+        ]
+    clones.sort(reverse=True)
+    cutoff = time.time() - min_age_seconds
+    for mtime, path in clones[max(max_entries - 1, 0):]:
+        if mtime > cutoff:
+            logger.debug(f"Keeping recently used cached clone {path}")
+            continue
+        logger.info(f"Evicting cached clone {path}")
+        shutil.rmtree(path, ignore_errors=True)
+
 def _get_authenticated_url(repo_url: str, token: str) -> str:
     """
     Convert a GitHub repository URL to an authenticated URL using the provided token.
@@ -1,24 +1,76 @@
+import atexit
+import os
 import shutil
+import subprocess
+import threading
+import uuid
+from typing import List, Union
 
 from src.dto.state_dto import RootRepoState
 from src.logging.logging import get_logger
+from src.nodes.runnables.clone_repo_runnable import clone_work_dir, is_cached_clone
 
 logger = get_logger(__name__)
 
+# Deletions still running in the background, waited for at interpreter exit
+_PENDING_DELETIONS: List[Union[subprocess.Popen, threading.Thread]] = []
+
 
 def delete_repo_runnable(state: RootRepoState) -> RootRepoState:
     """
     Delete the temp directory from  a Git repository
+    The directory is renamed away first and removed in the background, so the workflow
+    does not wait on unlinking the clone (the original path is free again immediately).
     Returns:
     - RootRepoState
     """
+    if is_cached_clone(state.local_path):
+        logger.info(f"Keeping cached clone repo: {state.local_path}")
+        return state
+
     logger.info(f"Deleting clone repo: {state.local_path}")
 
     try:
+        if not os.path.exists(state.local_path):
+            raise FileNotFoundError(state.local_path)
+        # Uncached clones live in a per-run directory, which goes with them
+        target = clone_work_dir(state.local_path) or state.local_path
+        trash_path = f"{target}.deleting-{uuid.uuid4().hex}"
+        try:
+            os.rename(target, trash_path)
+        except OSError as exc:
+            logger.debug(f"Could not move {target} aside, deleting in place: {exc}")
+            shutil.rmtree(target)
+            return state
 
-        shutil.rmtree(state.local_path)
+        _delete_in_background(trash_path)
 
         return state
     except Exception as exc:
         logger.error(f"Error deleting clone repository: {str(exc)}")
         raise exc
+
+
+def _delete_in_background(path: str) -> None:
+    # Forget deletions that have already finished
+    _PENDING_DELETIONS[:] = [
+        d for d in _PENDING_DELETIONS
+        if (d.poll() is None if isinstance(d, subprocess.Popen) else d.is_alive())
+    ]
+    # rm -rf avoids the per-entry Python overhead of rmtree on large .git object stores
+    if os.name == "posix" and shutil.which("rm"):
+        _PENDING_DELETIONS.append(subprocess.Popen(["rm", "-rf", path]))
+    else:
+        thread = threading.Thread(target=shutil.rmtree, args=(path,), kwargs={"ignore_errors": True}, daemon=True)
+        thread.start()
+        _PENDING_DELETIONS.append(thread)
+
+
+@atexit.register
+def _wait_for_pending_deletions() -> None:
+    for deletion in _PENDING_DELETIONS:
+        if isinstance(deletion, subprocess.Popen):
+            deletion.wait()
+        else:
+            deletion.join()
+    _PENDING_DELETIONS.clear()
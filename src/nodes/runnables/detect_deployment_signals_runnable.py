@@ -1,11 +1,18 @@
+import json
+import os
 import re
+import sqlite3
+from collections import defaultdict
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from src.dto.state_dto import RootRepoState
 from src.logging.logging import get_logger
-from src.nodes.agents.workflow_classifier_agent import workflow_classifier_agent
+from src.nodes.agents.workflow_classifier_agent import workflow_classifier_agent_batch
+from src.utils.git_utils import read_head_commit
 
 logger = get_logger(__name__)
 
@@ -32,12 +39,26 @@ def deployment_signals_detection_runnable(state: RootRepoState) -> RootRepoState
         logger.error(f"Local repository path does not exist: {local_repo_path}")
         return state
 
+    cache_key = _deployment_cache_key(state)
+    cached = _load_cached_deployment_analysis(cache_key)
+    if cached is not None:
+        state.deployable, state.deployable_signal_files = cached
+        logger.info(f"Reusing deployment analysis of {cache_key[0]} at {cache_key[1]}: deployable={state.deployable}")
+        return state
+
+    _analyze_deployment_signals(state, local_repo_path)
+    _store_deployment_analysis(cache_key, state.deployable, state.deployable_signal_files)
+    return state
+
+def _analyze_deployment_signals(state: RootRepoState, local_repo_path: Path) -> None:
+    """Run signal detection (and the LLM workflow check if needed), setting deployable and deployable_signal_files."""
     logger.info(f"Analyzing deployment signals in: {local_repo_path}")
 
     deployment_signals = detect_deployment_signals(local_repo_path)
 
     strong_signals = [signal for signal in deployment_signals if signal.strength == 'strong']
-    state.deployable_signal_files = [signal.file_path for signal in strong_signals]
+    # A file can carry strong signals of several categories (e.g. kustomization.yaml), list it once
+    state.deployable_signal_files = list(dict.fromkeys(signal.file_path for signal in strong_signals))
 
     # Log findings
     if deployment_signals:
@@ -51,13 +72,13 @@ def deployment_signals_detection_runnable(state: RootRepoState) -> RootRepoState
     is_deployable = _evaluate_deployment_signals(deployment_signals)
     if is_deployable:
         state.deployable = True
-        return state
+        return
 
     ci_cd_signals = [
         signal for signal in deployment_signals
         if signal.category == 'ci_cd' and signal.strength in ['strong', 'medium']
     ]
-    has_app_service_deploy = has_service_deployment_workflow_llm(local_repo_path, ci_cd_signals)
+    has_app_service_deploy = has_service_deployment_workflow_llm(local_repo_path, ci_cd_signals, deployment_signals)
     if has_app_service_deploy:
         logger.info(f"Repository has deployable service detection. "
                     f"Also contains tool/automation workflows.")
@@ -67,7 +88,427 @@ def deployment_signals_detection_runnable(state: RootRepoState) -> RootRepoState
                     f"Also does not contain tool/automation workflows.")
         state.deployable = False
 
-    return state
+def _deployment_cache_key(state: RootRepoState) -> Optional[Tuple[str, str]]:
+    """(repo_root_url, HEAD commit) when DEPLOYMENT_CACHE_PATH is set and the commit can be resolved, else None."""
+    if not os.getenv("DEPLOYMENT_CACHE_PATH") or not state.repo_root_url:
+        return None
+    head_commit = read_head_commit(state.local_path)
+    if head_commit is None:
+        return None
+    return state.repo_root_url, head_commit
+
+def _connect_deployment_cache() -> sqlite3.Connection:
+    cache_path = os.path.expanduser(os.environ["DEPLOYMENT_CACHE_PATH"])
+    # The documented default lives in ~/.cache, which may not exist yet
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    conn = sqlite3.connect(cache_path)
+    # Versioned table name: bump when detection changes so old results are not reused
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS deployment_analysis_v2 ("
+        "repo_root_url TEXT NOT NULL, commit_sha TEXT NOT NULL, "
+        "deployable INTEGER NOT NULL, deployable_signal_files TEXT NOT NULL, "
+        "PRIMARY KEY (repo_root_url, commit_sha))"
+    )
+    return conn
+
+def _load_cached_deployment_analysis(cache_key: Optional[Tuple[str, str]]) -> Optional[Tuple[bool, List[str]]]:
+    if cache_key is None:
+        return None
+    try:
+        with closing(_connect_deployment_cache()) as conn:
+            row = conn.execute(
+                "SELECT deployable, deployable_signal_files FROM deployment_analysis_v2 "
+                "WHERE repo_root_url = ? AND commit_sha = ?",
+                cache_key
+            ).fetchone()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Could not read deployment cache: {e}")
+        return None
+    if row is None:
+        return None
+    return bool(row[0]), json.loads(row[1])
+
+def _store_deployment_analysis(cache_key: Optional[Tuple[str, str]], deployable: bool, signal_files: List[str]) -> None:
+    if cache_key is None:
+        return
+    try:
+        with closing(_connect_deployment_cache()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO deployment_analysis_v2 VALUES (?, ?, ?, ?)",
+                (*cache_key, int(deployable), json.dumps(signal_files))
+            )
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Could not write deployment cache: {e}")
+
+
+# Deployment signal glob patterns, relative to the repository root
+SIGNAL_PATTERNS = {
+    "package_manager": {
+        "java": [
+            ("**/pom.xml", "Maven Project"),
+            ("**/build.gradle", "Gradle Project"),
+            ("**/build.gradle.kts", "Gradle Kotlin Project"),
+        ],
+        "javascript": [
+            ("**/package.json", "NPM/Node.js Project"),
+            ("**/project.json", "NX/Build Tool Project"),
+            ("**/yarn.lock", "Yarn Project"),
+            ("**/pnpm-lock.yaml", "PNPM Project"),
+        ],
+        "python": [
+            ("**/requirements.txt", "Python Requirements"),
+            ("**/pyproject.toml", "Python Project"),
+            ("**/setup.py", "Python Setup"),
+            ("**/Pipfile", "Pipenv Project"),
+            ("**/poetry.lock", "Poetry Project"),
+        ],
+        "dotnet": [
+            ("**/*.csproj", ".NET Project"),
+            ("**/*.sln", ".NET Solution"),
+            ("**/packages.config", ".NET Packages"),
+        ],
+        "go": [
+            ("**/go.mod", "Go Module"),
+        ],
+        "rust": [
+            ("**/Cargo.toml", "Rust Cargo Project"),
+        ],
+        "php": [
+            ("**/composer.json", "PHP Composer Project"),
+        ],
+        "ruby": [
+            ("**/Gemfile", "Ruby Gem Project"),
+        ],
+    },
+    "kubernetes": {
+        "deployment_manifests": [
+            ("**/deployment.yaml", "Kubernetes Deployment"),
+            ("**/deployment.yml", "Kubernetes Deployment"),
+            ("**/statefulset.yaml", "Kubernetes StatefulSet"),
+            ("**/statefulset.yml", "Kubernetes StatefulSet"),
+            ("**/job.yaml", "Kubernetes Job"),
+            ("**/job.yml", "Kubernetes Job"),
+            ("**/cronjob.yaml", "Kubernetes CronJob"),
+            ("**/cronjob.yml", "Kubernetes CronJob"),
+            ("**/*-deployment.yaml", "Kubernetes Deployment"),
+            ("**/*-deployment.yml", "Kubernetes Deployment"),
+            ("**/k8s/**/*.yaml", "Kubernetes Manifest"),
+            ("**/k8s/**/*.yml", "Kubernetes Manifest"),
+            ("**/kubernetes/**/*.yaml", "Kubernetes Manifest"),
+            ("**/kubernetes/**/*.yml", "Kubernetes Manifest"),
+            ("**/manifests/**/*.yaml", "Kubernetes Manifest"),
+            ("**/manifests/**/*.yml", "Kubernetes Manifest"),
+        ],
+        "helm": [
+            ("**/Chart.yaml", "Helm Chart"),
+            ("**/Chart.yml", "Helm Chart"),
+            ("**/values.yaml", "Helm Values"),
+            ("**/values.yml", "Helm Values"),
+            ("**/charts/**", "Helm Chart Directory"),
+            ("**/templates/**/*.yaml", "Helm Template"),
+            ("**/templates/**/*.yml", "Helm Template"),
+        ],
+        "kustomize": [
+            ("**/kustomization.yaml", "Kustomize"),
+            ("**/kustomization.yml", "Kustomize"),
+            ("**/Kustomization", "Kustomize"),
+        ]
+    },
+    "containerization": {
+        "docker": [
+            ("**/Dockerfile", "Docker Build"),
+            ("**/Dockerfile.*", "Docker Build Variant"),
+            ("**/docker-compose.yml", "Docker Compose"),
+            ("**/docker-compose.yaml", "Docker Compose"),
+            ("**/docker-compose.*.yml", "Docker Compose Variant"),
+            ("**/docker-compose.*.yaml", "Docker Compose Variant"),
+            ("**/.dockerignore", "Docker Configuration"),
+        ],
+        "buildpacks": [
+            ("**/project.toml", "Cloud Native Buildpacks"),
+            ("**/Procfile", "Buildpack Process File"),
+        ]
+    },
+    "serverless": {
+        "framework_agnostic": [
+            ("**/serverless.yml", "Serverless Framework"),
+            ("**/serverless.yaml", "Serverless Framework"),
+        ],
+        "aws": [
+            ("**/template.yaml", "AWS SAM Template"),
+            ("**/template.yml", "AWS SAM Template"),
+            ("**/sam-template.yaml", "AWS SAM Template"),
+            ("**/cloudformation.yaml", "AWS CloudFormation"),
+            ("**/cloudformation.yml", "AWS CloudFormation"),
+            ("**/*.sam.yaml", "AWS SAM"),
+            ("**/*.sam.yml", "AWS SAM"),
+        ],
+        "azure": [
+            ("**/host.json", "Azure Functions"),
+            ("**/function.json", "Azure Function"),
+            ("**/proxies.json", "Azure Functions Proxies"),
+        ],
+        "gcp": [
+            ("**/app.yaml", "Google App Engine"),
+            ("**/app.yml", "Google App Engine"),
+            ("**/cron.yaml", "Google App Engine Cron"),
+            ("**/queue.yaml", "Google App Engine Queue"),
+            ("**/cloudbuild.yaml", "Google Cloud Build"),
+            ("**/cloudbuild.yml", "Google Cloud Build"),
+        ],
+        "vercel": [
+            ("**/vercel.json", "Vercel Deployment"),
+            ("**/now.json", "Vercel (Now) Deployment"),
+        ],
+        "netlify": [
+            ("**/netlify.toml", "Netlify Deployment"),
+        ],
+        "cloudflare": [
+            ("**/wrangler.toml", "Cloudflare Workers"),
+        ]
+    },
+    "platform_specific": {
+        "heroku": [
+            ("**/Procfile", "Heroku Process File"),
+            ("**/app.json", "Heroku App Configuration"),
+            ("**/runtime.txt", "Heroku Runtime"),
+        ],
+        "fly_io": [
+            ("**/fly.toml", "Fly.io Deployment"),
+        ],
+        "render": [
+            ("**/render.yaml", "Render Deployment"),
+        ],
+        "railway": [
+            ("**/railway.json", "Railway Deployment"),
+            ("**/railway.toml", "Railway Deployment"),
+        ]
+    },
+    "ci_cd": {
+        "github_actions": [
+            ("**/.github/workflows/*.yml", "GitHub Actions Workflow"),
+            ("**/.github/workflows/*.yaml", "GitHub Actions Workflow"),
+        ],
+        "gitlab": [
+            ("**/.gitlab-ci.yml", "GitLab CI"),
+        ],
+        "jenkins": [
+            ("**/Jenkinsfile", "Jenkins Pipeline"),
+        ],
+        "azure_pipelines": [
+            ("**/azure-pipelines.yml", "Azure Pipelines"),
+            ("**/azure-pipelines.yaml", "Azure Pipelines"),
+        ],
+        "circle_ci": [
+            ("**/.circleci/config.yml", "CircleCI"),
+        ],
+        "travis": [
+            ("**/.travis.yml", "Travis CI"),
+        ]
+    },
+    "infrastructure_as_code": {
+        "terraform": [
+            ("**/*.tf", "Terraform"),
+            ("**/main.tf", "Terraform Main"),
+            ("**/variables.tf", "Terraform Variables"),
+            ("**/outputs.tf", "Terraform Outputs"),
+        ],
+        "pulumi": [
+            ("**/Pulumi.yaml", "Pulumi"),
+            ("**/Pulumi.yml", "Pulumi"),
+            ("**/__main__.py", "Pulumi Python"),
+            ("**/index.ts", "Pulumi TypeScript"),
+        ],
+        "cdk": [
+            ("**/cdk.json", "AWS CDK"),
+            ("**/cdk.yaml", "AWS CDK"),
+        ]
+    },
+    "gitops": {
+        "argocd": [
+            ("**/application.yaml", "Argo CD Application"),
+            ("**/application.yml", "Argo CD Application"),
+            ("**/argocd/**/*.yaml", "Argo CD Configuration"),
+        ],
+        "flux": [
+            ("**/kustomization.yaml", "Flux Kustomization"),
+            ("**/helmrelease.yaml", "Flux Helm Release"),
+            ("**/gitrepository.yaml", "Flux Git Repository"),
+        ]
+    }
+}
+
+# Files whose content is scanned for deployment steps / container build contexts
+CI_FILE_PATTERNS = [
+    "**/.github/workflows/*.yml",
+    "**/.github/workflows/*.yaml",
+    "**/.gitlab-ci.yml",
+    "**/Jenkinsfile",
+    "**/azure-pipelines.yml",
+    "**/azure-pipelines.yaml",
+]
+COMPOSE_FILE_PATTERNS = [
+    "**/docker-compose*.yml",
+    "**/docker-compose*.yaml",
+]
+
+# Lowercase substrings marking a deployment step in CI file content, checked in order
+DEPLOYMENT_KEYWORDS = (
+    'docker build', 'docker push', 'kubectl apply', 'helm upgrade',
+    'helm install', 'serverless deploy', 'aws ecs', 'gcloud deploy',
+    'terraform apply', 'pulumi up', 'deploy:', 'deployment:',
+    'aws lambda', 'azure functions', 'vercel --prod', 'netlify deploy'
+)
+
+# Compose build context, either a path ('build: .') or a named/mapped context ('build: api')
+BUILD_CONTEXT_RE = re.compile(r'build:\s*(?:\.|\w+)')
+
+# Upper bound on threads reading CI / compose files concurrently
+CONTENT_SCAN_WORKERS = 16
+
+# Directories whose contents are never deployment configuration
+EXCLUDED_DIRS = frozenset({
+    'node_modules', '.git', '__pycache__', 'target', 'build',
+    'dist', '.venv', 'venv', 'vendor', 'deps'
+})
+
+# Categories that provide a way to run the software
+WAY_TO_RUN_CATEGORIES = frozenset({"containerization", "serverless", "platform_specific", "kubernetes"})
+
+# Categories that count towards the package manager / CI/CD / way-to-run combination
+COMBINATION_CATEGORIES = frozenset({"package_manager", "ci_cd"}) | WAY_TO_RUN_CATEGORIES
+
+# Files above this size are skipped, they are unlikely to be configuration
+MAX_DEPLOYMENT_FILE_SIZE = 1024 * 1024  # 1MB
+
+_SIGNAL_PATTERN_LIST = [
+    (category, signal_type, pattern, description)
+    for category, subcategories in SIGNAL_PATTERNS.items()
+    for signal_type, patterns in subcategories.items()
+    for pattern, description in patterns
+]
+
+
+def _glob_to_regex(pattern: str) -> re.Pattern:
+    """Translate a pathlib-style glob ('**' spans directories, '*' stays within one) to a regex on posix relative paths."""
+    regex = ""
+    segments = pattern.split("/")
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == "**":
+            # A trailing '**' also matches the directory itself
+            regex = regex[:-1] + "(?:/.*)?" if last else regex + "(?:[^/]+/)*"
+            continue
+        regex += "".join("[^/]*" if c == "*" else "[^/]" if c == "?" else re.escape(c) for c in segment)
+        if not last:
+            regex += "/"
+    return re.compile(regex)
+
+
+class _PatternTable:
+    """
+    Glob patterns split by how cheaply they can be tested: exact basenames and
+    '*suffix' patterns become dict / endswith checks, the rest compiled regexes.
+    match() returns the indexes of all patterns matching an entry.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.size = len(patterns)
+        self.by_name: Dict[str, List[int]] = defaultdict(list)
+        self.by_suffix: List[Tuple[str, int]] = []
+        self.by_regex: List[Tuple[re.Pattern, int]] = []
+        for index, pattern in enumerate(patterns):
+            tail = pattern[3:] if pattern.startswith("**/") else None
+            if tail is not None and not any(c in tail for c in "*?/"):
+                self.by_name[tail].append(index)
+            elif tail is not None and tail.startswith("*") and not any(c in tail[1:] for c in "*?/"):
+                self.by_suffix.append((tail[1:], index))
+            else:
+                self.by_regex.append((_glob_to_regex(pattern), index))
+
+    def match(self, name: str, relative_path: str) -> List[int]:
+        hits = list(self.by_name.get(name, ()))
+        hits.extend(index for suffix, index in self.by_suffix if name.endswith(suffix))
+        hits.extend(index for regex, index in self.by_regex if regex.fullmatch(relative_path))
+        return hits
+
+
+_SIGNAL_TABLE = _PatternTable([pattern for _, _, pattern, _ in _SIGNAL_PATTERN_LIST])
+_CI_TABLE = _PatternTable(CI_FILE_PATTERNS)
+_COMPOSE_TABLE = _PatternTable(COMPOSE_FILE_PATTERNS)
+
+
+@dataclass
+class _RepositoryWalk:
+    """
+    Files matched by each pattern table during a single repository walk, as
+    (absolute path, POSIX path relative to the repository root) string pairs.
+    """
+    signal_matches: List[List[Tuple[str, str]]]
+    ci_files: List[Tuple[str, str]]
+    compose_files: List[Tuple[str, str]]
+
+
+def _walk_repository(repo_path: Path) -> _RepositoryWalk:
+    """
+    Walk the repository once and sort every entry into the signal, CI and compose
+    patterns it matches. Replaces one recursive glob per pattern; excluded
+    directories are pruned so their subtrees are never entered, and matched files
+    are stat'ed once through their DirEntry to drop anything too large to be configuration.
+    """
+    signal_matches: List[List[Tuple[str, str]]] = [[] for _ in range(_SIGNAL_TABLE.size)]
+    ci_matches: List[List[Tuple[str, str]]] = [[] for _ in range(_CI_TABLE.size)]
+    compose_matches: List[List[Tuple[str, str]]] = [[] for _ in range(_COMPOSE_TABLE.size)]
+
+    pending = [(str(repo_path), "")]
+    while pending:
+        dirpath, prefix = pending.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if entry.name in EXCLUDED_DIRS:
+                    continue
+                # Symlinked directories are matched but not descended into, like os.walk
+                if not entry.is_symlink():
+                    subdirs.append((entry.path, prefix + entry.name + "/"))
+
+            # Directories are matched too, as glob yields them (e.g. everything under charts/)
+            relative_path = prefix + entry.name
+            signal_hits = _SIGNAL_TABLE.match(entry.name, relative_path)
+            ci_hits = _CI_TABLE.match(entry.name, relative_path)
+            compose_hits = _COMPOSE_TABLE.match(entry.name, relative_path)
+            if not (signal_hits or ci_hits or compose_hits):
+                continue
+            if not is_dir and not _is_valid_deployment_file(entry):
+                continue
+            # Plain strings from the walk itself, no Path objects or relative_to() per hit
+            match = (entry.path, relative_path)
+            for index in signal_hits:
+                signal_matches[index].append(match)
+            for index in ci_hits:
+                ci_matches[index].append(match)
+            for index in compose_hits:
+                compose_matches[index].append(match)
+
+        # Depth-first in name order, matching the order os.walk/glob reported before
+        pending.extend(reversed(subdirs))
+
+    return _RepositoryWalk(
+        signal_matches=signal_matches,
+        ci_files=[path for paths in ci_matches for path in paths],
+        compose_files=[path for paths in compose_matches for path in paths],
+    )
+
 
 def detect_deployment_signals(repo_path: Path) -> List[DeploymentSignal]:
     """
@@ -75,322 +516,102 @@ def detect_deployment_signals(repo_path: Path) -> List[DeploymentSignal]:
     """
     signals = []
 
-    # Define deployment signal patterns
-    signal_patterns = {
-        "package_manager": {
-            "java": [
-                ("**/pom.xml", "Maven Project"),
-                ("**/build.gradle", "Gradle Project"),
-                ("**/build.gradle.kts", "Gradle Kotlin Project"),
-            ],
-            "javascript": [
-                ("**/package.json", "NPM/Node.js Project"),
-                ("**/project.json", "NX/Build Tool Project"),
-                ("**/yarn.lock", "Yarn Project"),
-                ("**/pnpm-lock.yaml", "PNPM Project"),
-            ],
-            "python": [
-                ("**/requirements.txt", "Python Requirements"),
-                ("**/pyproject.toml", "Python Project"),
-                ("**/setup.py", "Python Setup"),
-                ("**/Pipfile", "Pipenv Project"),
-                ("**/poetry.lock", "Poetry Project"),
-            ],
-            "dotnet": [
-                ("**/*.csproj", ".NET Project"),
-                ("**/*.sln", ".NET Solution"),
-                ("**/packages.config", ".NET Packages"),
-            ],
-            "go": [
-                ("**/go.mod", "Go Module"),
-            ],
-            "rust": [
-                ("**/Cargo.toml", "Rust Cargo Project"),
-            ],
-            "php": [
-                ("**/composer.json", "PHP Composer Project"),
-            ],
-            "ruby": [
-                ("**/Gemfile", "Ruby Gem Project"),
-            ],
-        },
-        "kubernetes": {
-            "deployment_manifests": [
-                ("**/deployment.yaml", "Kubernetes Deployment"),
-                ("**/deployment.yml", "Kubernetes Deployment"),
-                ("**/statefulset.yaml", "Kubernetes StatefulSet"),
-                ("**/statefulset.yml", "Kubernetes StatefulSet"),
-                ("**/job.yaml", "Kubernetes Job"),
-                ("**/job.yml", "Kubernetes Job"),
-                ("**/cronjob.yaml", "Kubernetes CronJob"),
-                ("**/cronjob.yml", "Kubernetes CronJob"),
-                ("**/*-deployment.yaml", "Kubernetes Deployment"),
-                ("**/*-deployment.yml", "Kubernetes Deployment"),
-                ("**/k8s/**/*.yaml", "Kubernetes Manifest"),
-                ("**/k8s/**/*.yml", "Kubernetes Manifest"),
-                ("**/kubernetes/**/*.yaml", "Kubernetes Manifest"),
-                ("**/kubernetes/**/*.yml", "Kubernetes Manifest"),
-                ("**/manifests/**/*.yaml", "Kubernetes Manifest"),
-                ("**/manifests/**/*.yml", "Kubernetes Manifest"),
-            ],
-            "helm": [
-                ("**/Chart.yaml", "Helm Chart"),
-                ("**/Chart.yml", "Helm Chart"),
-                ("**/values.yaml", "Helm Values"),
-                ("**/values.yml", "Helm Values"),
-                ("**/charts/**", "Helm Chart Directory"),
-                ("**/templates/**/*.yaml", "Helm Template"),
-                ("**/templates/**/*.yml", "Helm Template"),
-            ],
-            "kustomize": [
-                ("**/kustomization.yaml", "Kustomize"),
-                ("**/kustomization.yml", "Kustomize"),
-                ("**/Kustomization", "Kustomize"),
-            ]
-        },
-        "containerization": {
-            "docker": [
-                ("**/Dockerfile", "Docker Build"),
-                ("**/Dockerfile.*", "Docker Build Variant"),
-                ("**/docker-compose.yml", "Docker Compose"),
-                ("**/docker-compose.yaml", "Docker Compose"),
-                ("**/docker-compose.*.yml", "Docker Compose Variant"),
-                ("**/docker-compose.*.yaml", "Docker Compose Variant"),
-                ("**/.dockerignore", "Docker Configuration"),
-            ],
-            "buildpacks": [
-                ("**/project.toml", "Cloud Native Buildpacks"),
-                ("**/Procfile", "Buildpack Process File"),
-            ]
-        },
-        "serverless": {
-            "framework_agnostic": [
-                ("**/serverless.yml", "Serverless Framework"),
-                ("**/serverless.yaml", "Serverless Framework"),
-            ],
-            "aws": [
-                ("**/template.yaml", "AWS SAM Template"),
-                ("**/template.yml", "AWS SAM Template"),
-                ("**/sam-template.yaml", "AWS SAM Template"),
-                ("**/cloudformation.yaml", "AWS CloudFormation"),
-                ("**/cloudformation.yml", "AWS CloudFormation"),
-                ("**/*.sam.yaml", "AWS SAM"),
-                ("**/*.sam.yml", "AWS SAM"),
-            ],
-            "azure": [
-                ("**/host.json", "Azure Functions"),
-                ("**/function.json", "Azure Function"),
-                ("**/proxies.json", "Azure Functions Proxies"),
-            ],
-            "gcp": [
-                ("**/app.yaml", "Google App Engine"),
-                ("**/app.yml", "Google App Engine"),
-                ("**/cron.yaml", "Google App Engine Cron"),
-                ("**/queue.yaml", "Google App Engine Queue"),
-                ("**/cloudbuild.yaml", "Google Cloud Build"),
-                ("**/cloudbuild.yml", "Google Cloud Build"),
-            ],
-            "vercel": [
-                ("**/vercel.json", "Vercel Deployment"),
-                ("**/now.json", "Vercel (Now) Deployment"),
-            ],
-            "netlify": [
-                ("**/netlify.toml", "Netlify Deployment"),
-            ],
-            "cloudflare": [
-                ("**/wrangler.toml", "Cloudflare Workers"),
-            ]
-        },
-        "platform_specific": {
-            "heroku": [
-                ("**/Procfile", "Heroku Process File"),
-                ("**/app.json", "Heroku App Configuration"),
-                ("**/runtime.txt", "Heroku Runtime"),
-            ],
-            "fly_io": [
-                ("**/fly.toml", "Fly.io Deployment"),
-            ],
-            "render": [
-                ("**/render.yaml", "Render Deployment"),
-            ],
-            "railway": [
-                ("**/railway.json", "Railway Deployment"),
-                ("**/railway.toml", "Railway Deployment"),
-            ]
-        },
-        "ci_cd": {
-            "github_actions": [
-                ("**/.github/workflows/*.yml", "GitHub Actions Workflow"),
-                ("**/.github/workflows/*.yaml", "GitHub Actions Workflow"),
-            ],
-            "gitlab": [
-                ("**/.gitlab-ci.yml", "GitLab CI"),
-            ],
-            "jenkins": [
-                ("**/Jenkinsfile", "Jenkins Pipeline"),
-            ],
-            "azure_pipelines": [
-                ("**/azure-pipelines.yml", "Azure Pipelines"),
-                ("**/azure-pipelines.yaml", "Azure Pipelines"),
-            ],
-            "circle_ci": [
-                ("**/.circleci/config.yml", "CircleCI"),
-            ],
-            "travis": [
-                ("**/.travis.yml", "Travis CI"),
-            ]
-        },
-        "infrastructure_as_code": {
-            "terraform": [
-                ("**/*.tf", "Terraform"),
-                ("**/main.tf", "Terraform Main"),
-                ("**/variables.tf", "Terraform Variables"),
-                ("**/outputs.tf", "Terraform Outputs"),
-            ],
-            "pulumi": [
-                ("**/Pulumi.yaml", "Pulumi"),
-                ("**/Pulumi.yml", "Pulumi"),
-                ("**/__main__.py", "Pulumi Python"),
-                ("**/index.ts", "Pulumi TypeScript"),
-            ],
-            "cdk": [
-                ("**/cdk.json", "AWS CDK"),
-                ("**/cdk.yaml", "AWS CDK"),
-            ]
-        },
-        "gitops": {
-            "argocd": [
-                ("**/application.yaml", "Argo CD Application"),
-                ("**/application.yml", "Argo CD Application"),
-                ("**/argocd/**/*.yaml", "Argo CD Configuration"),
-            ],
-            "flux": [
-                ("**/kustomization.yaml", "Flux Kustomization"),
-                ("**/helmrelease.yaml", "Flux Helm Release"),
-                ("**/gitrepository.yaml", "Flux Git Repository"),
-            ]
-        }
-    }
-
-    # Search for deployment signals
-    for category, subcategories in signal_patterns.items():
-        for signal_type, patterns in subcategories.items():
-            for pattern, description in patterns:
-                found_files = list(repo_path.glob(pattern))
-                for file_path in found_files:
-                    if _is_valid_deployment_file(file_path):
-                        relative_path = file_path.relative_to(repo_path)
-                        signals.append(DeploymentSignal(
-                            category=category,
-                            signal_type=signal_type,
-                            file_path=str(relative_path),
-                            description=description,
-                            strength='weak'  # Default strength, will be updated later
-                        ))
+    walk = _walk_repository(repo_path)
+
+    # Search for deployment signals, reported in pattern order as the former per-pattern globs did.
+    # A file matched by several patterns of the same signal type (e.g. Chart.yaml by both
+    # **/Chart.yaml and **/charts/**) is reported once, with the first pattern's description.
+    seen = set()
+    for (category, signal_type, _, description), found_files in zip(_SIGNAL_PATTERN_LIST, walk.signal_matches):
+        for _, relative_path in found_files:
+            key = (relative_path, category, signal_type)
+            if key in seen:
+                continue
+            seen.add(key)
+            signals.append(DeploymentSignal(
+                category=category,
+                signal_type=signal_type,
+                file_path=relative_path,
+                description=description,
+                strength='weak'  # Default strength, will be updated later
+            ))
 
     # Content-based detection for CI/CD deployment steps
-    signals.extend(_detect_cicd_deployment_content(repo_path))
+    signals.extend(_detect_cicd_deployment_content(walk.ci_files))
 
     # Container reference detection
-    signals.extend(_detect_container_references(repo_path))
+    signals.extend(_detect_container_references(walk.compose_files))
 
     # Classify signal strength based on combination requirements
     signals = _classify_signal_strength_by_combination(signals)
 
     return signals
 
-def _is_valid_deployment_file(file_path: Path) -> bool:
-    """Check if file is a valid deployment configuration file."""
-
-    # Skip if in excluded directories
-    excluded_dirs = {
-        'node_modules', '.git', '__pycache__', 'target', 'build',
-        'dist', '.venv', 'venv', 'vendor', 'deps'
-    }
-
-    if any(part in excluded_dirs for part in file_path.parts):
-        return False
+def _is_valid_deployment_file(entry: os.DirEntry) -> bool:
+    """Check if a file found by the repository walk is a valid deployment configuration file."""
 
-    # Skip if file is too large (likely not a config file)
+    # Skip if file is too large (likely not a config file); DirEntry caches the stat result
     try:
-        if file_path.stat().st_size > 1024 * 1024:  # 1MB
+        if entry.stat().st_size > MAX_DEPLOYMENT_FILE_SIZE:
             return False
     except OSError:
         return False
 
     return True
 
-def _detect_cicd_deployment_content(repo_path: Path) -> List[DeploymentSignal]:
-    """Detect deployment-related content in CI/CD files."""
-    signals = []
-
-    ci_files = [
-        *repo_path.glob("**/.github/workflows/*.yml"),
-        *repo_path.glob("**/.github/workflows/*.yaml"),
-        *repo_path.glob("**/.gitlab-ci.yml"),
-        *repo_path.glob("**/Jenkinsfile"),
-        *repo_path.glob("**/azure-pipelines.yml"),
-        *repo_path.glob("**/azure-pipelines.yaml"),
-    ]
-
-    deployment_keywords = [
-        'docker build', 'docker push', 'kubectl apply', 'helm upgrade',
-        'helm install', 'serverless deploy', 'aws ecs', 'gcloud deploy',
-        'terraform apply', 'pulumi up', 'deploy:', 'deployment:',
-        'aws lambda', 'azure functions', 'vercel --prod', 'netlify deploy'
-    ]
-
-    for ci_file in ci_files:
-        if not _is_valid_deployment_file(ci_file):
-            continue
+def _scan_files(scan, files: List[Tuple[str, str]]) -> List[DeploymentSignal]:
+    """
+    Run a per-file content scan over files on a thread pool, keeping input order.
+    The work is dominated by blocking reads, which release the GIL.
+    """
+    if not files:
+        return []
+    with ThreadPoolExecutor(max_workers=min(CONTENT_SCAN_WORKERS, len(files))) as executor:
+        results = executor.map(lambda file: scan(*file), files)
+        return [signal for signal in results if signal is not None]
 
-        try:
-            content = ci_file.read_text(encoding='utf-8').lower()
-            for keyword in deployment_keywords:
-                if keyword in content:
-                    relative_path = ci_file.relative_to(repo_path)
-                    signals.append(DeploymentSignal(
-                        category="ci_cd",
-                        signal_type="deployment_step",
-                        file_path=str(relative_path),
-                        description=f"CI/CD with deployment step: {keyword}",
-                        strength='medium'  # Content-based signals are medium strength
-                    ))
-                    break  # Only add one signal per file
-        except Exception as e:
-            logger.debug(f"Could not read CI file {ci_file}: {e}")
+def _scan_ci_file(ci_file: str, relative_path: str) -> Optional[DeploymentSignal]:
+    try:
+        with open(ci_file, encoding='utf-8') as f:
+            content = f.read().lower()
+        for keyword in DEPLOYMENT_KEYWORDS:
+            if keyword in content:
+                # Only one signal per file
+                return DeploymentSignal(
+                    category="ci_cd",
+                    signal_type="deployment_step",
+                    file_path=relative_path,
+                    description=f"CI/CD with deployment step: {keyword}",
+                    strength='medium'  # Content-based signals are medium strength
+                )
+    except Exception as e:
+        logger.debug(f"Could not read CI file {ci_file}: {e}")
+    return None
+
+def _scan_compose_file(compose_file: str, relative_path: str) -> Optional[DeploymentSignal]:
+    try:
+        with open(compose_file, encoding='utf-8') as f:
+            content = f.read()
+        # Look for build context references
+        if BUILD_CONTEXT_RE.search(content):
+            return DeploymentSignal(
+                category="containerization",
+                signal_type="local_build",
+                file_path=relative_path,
+                description="Docker Compose with local build context",
+                strength='medium'  # Detected build context is medium strength
+            )
+    except Exception as e:
+        logger.debug(f"Could not read compose file {compose_file}: {e}")
+    return None
 
-    return signals
+def _detect_cicd_deployment_content(ci_files: List[Tuple[str, str]]) -> List[DeploymentSignal]:
+    """Detect deployment-related content in CI/CD files."""
+    return _scan_files(_scan_ci_file, ci_files)
 
-def _detect_container_references(repo_path: Path) -> List[DeploymentSignal]:
+def _detect_container_references(compose_files: List[Tuple[str, str]]) -> List[DeploymentSignal]:
     """Detect references to container builds in compose/manifest files."""
-    signals = []
-
-    compose_files = [
-        *repo_path.glob("**/docker-compose*.yml"),
-        *repo_path.glob("**/docker-compose*.yaml"),
-    ]
-
-    for compose_file in compose_files:
-        if not _is_valid_deployment_file(compose_file):
-            continue
-
-        try:
-            content = compose_file.read_text(encoding='utf-8')
-            # Look for build context references
-            if re.search(r'build:\s*\.', content) or re.search(r'build:\s*\w+', content):
-                relative_path = compose_file.relative_to(repo_path)
-                signals.append(DeploymentSignal(
-                    category="containerization",
-                    signal_type="local_build",
-                    file_path=str(relative_path),
-                    description="Docker Compose with local build context",
-                    strength='medium'  # Detected build context is medium strength
-                ))
-        except Exception as e:
-            logger.debug(f"Could not read compose file {compose_file}: {e}")
-
-    return signals
+    return _scan_files(_scan_compose_file, compose_files)
 
 def _classify_signal_strength_by_combination(signals: List[DeploymentSignal]) -> List[DeploymentSignal]:
     """
@@ -405,41 +626,36 @@ def _classify_signal_strength_by_combination(signals: List[DeploymentSignal]) ->
     Weak signal is everything else.
     """
 
+    if not signals:
+        return signals
+
     # Group signals by category to check combinations
-    categories_found = set(signal.category for signal in signals)
+    categories_found = {signal.category for signal in signals}
 
     # Check if we have all three required categories
     has_package_manager = "package_manager" in categories_found
-    has_ci_cd = "ci_cd" in categories_found or any(s.category == "ci_cd" and s.signal_type == "deployment_step" for s in signals)
-    has_way_to_run = ("containerization" in categories_found or
-                     "serverless" in categories_found or
-                     "platform_specific" in categories_found or
-                     "kubernetes" in categories_found)
+    has_ci_cd = "ci_cd" in categories_found
+    has_way_to_run = not WAY_TO_RUN_CATEGORIES.isdisjoint(categories_found)
 
     # Count how many of the three components we have
     component_count = sum([has_package_manager, has_ci_cd, has_way_to_run])
 
     logger.info(f"Deployment components found - Package Manager: {has_package_manager}, CI/CD: {has_ci_cd}, Way to Run: {has_way_to_run}")
 
+    # Strength for signals in the combination categories, and for all others
+    if component_count >= 3:
+        # All three components present - strong signals for relevant categories
+        combination_strength, other_strength = 'strong', 'medium'
+    elif component_count >= 2:
+        # Two components present - medium strength
+        combination_strength, other_strength = 'medium', 'weak'
+    else:
+        # Only one or no components - weak
+        combination_strength, other_strength = 'weak', 'weak'
+
     # Classify all signals based on the overall combination
     for signal in signals:
-        if component_count >= 3:
-            # All three components present - strong signals for relevant categories
-            if (signal.category in ["package_manager", "ci_cd", "containerization", "serverless", "platform_specific", "kubernetes"] or
-                (signal.category == "ci_cd" and signal.signal_type == "deployment_step")):
-                signal.strength = 'strong'
-            else:
-                signal.strength = 'medium'
-        elif component_count >= 2:
-            # Two components present - medium strength
-            if (signal.category in ["package_manager", "ci_cd", "containerization", "serverless", "platform_specific", "kubernetes"] or
-                (signal.category == "ci_cd" and signal.signal_type == "deployment_step")):
-                signal.strength = 'medium'
-            else:
-                signal.strength = 'weak'
-        else:
-            # Only one or no components - weak
-            signal.strength = 'weak'
+        signal.strength = combination_strength if signal.category in COMBINATION_CATEGORIES else other_strength
 
     return signals
 
@@ -469,6 +685,9 @@ def _evaluate_deployment_signals(signals: List[DeploymentSignal]) -> bool:
     logger.info("Repository requires all 3 components (package manager + CI/CD + way to run) for deployability")
     return False
 
+# Workflows packed into a single LLM classification prompt
+WORKFLOW_CLASSIFICATION_BATCH_SIZE = 5
+
 IGNORED_DEPLOY_PATHS = [
     "test/", "tests/", "template/", "templates/",
     "example/", "examples/", "spec/", "sample/"
@@ -478,36 +697,51 @@ def _is_ignored_deploy_file(file_path: str) -> bool:
     path_lc = file_path.lower()
     return any(p in path_lc for p in IGNORED_DEPLOY_PATHS)
 
-def has_service_deployment_workflow_llm(repo_path: Path, filtered_strong_signals: List[DeploymentSignal]) -> bool:
+def has_service_deployment_workflow_llm(
+    repo_path: Path,
+    filtered_strong_signals: List[DeploymentSignal],
+    all_signals: Optional[List[DeploymentSignal]] = None
+) -> bool:
     """
     Analyze all workflow files listed in filtered_strong_signals using the LLM classifier agent.
     Returns True if any workflow is classified as 'deployment'.
-    Passes strong deployment signals as context to the LLM.
+    Passes strong deployment signals as context to the LLM; all_signals should be the caller's
+    detect_deployment_signals result, the repository is only scanned again when it is omitted.
     """
     logger.info(f"Classifying {len(filtered_strong_signals)} workflow files using LLM agent.")
 
     # Gather all strong deployment signals (file names) for context
-    all_signals = detect_deployment_signals(repo_path)
+    if all_signals is None:
+        all_signals = detect_deployment_signals(repo_path)
     strong_signal_files = [
         signal.file_path for signal in all_signals if signal.strength == 'strong'
     ]
 
+    workflows = []
     for signal in filtered_strong_signals:
         wf = repo_path / signal.file_path
         try:
-            content = wf.read_text(encoding="utf-8")
-            logger.info(f"Classifying workflow '{wf.name}' using LLM agent. (path: {signal.file_path})")
-            classification = workflow_classifier_agent(
-                workflow_content=content,
-                workflow_path=signal.file_path,
+            workflows.append((wf.read_text(encoding="utf-8"), signal.file_path))
+        except Exception as e:
+            logger.warning(f"Failed to read workflow '{wf.name}': {e}")
+
+    # Several workflows per LLM call; stop at the first batch containing a deployment workflow
+    for start in range(0, len(workflows), WORKFLOW_CLASSIFICATION_BATCH_SIZE):
+        batch = workflows[start:start + WORKFLOW_CLASSIFICATION_BATCH_SIZE]
+        logger.info(f"Classifying workflows {[path for _, path in batch]} using LLM agent.")
+        try:
+            classifications = workflow_classifier_agent_batch(
+                batch,
                 repo_path=str(repo_path),
                 strong_signals=strong_signal_files
             )
-            logger.info(f"AI agent classified workflow '{wf.name}' as: {classification}")
-            if classification == "deployment":
-                return True
         except Exception as e:
-            logger.warning(f"Failed to read or classify workflow '{wf.name}': {e}")
+            logger.warning(f"Failed to classify workflows {[path for _, path in batch]}: {e}")
+            continue
+        for path, classification in classifications.items():
+            logger.info(f"AI agent classified workflow '{Path(path).name}' as: {classification}")
+        if "deployment" in classifications.values():
+            return True
 
     logger.info("No service deployment workflows detected by LLM in this repo.")
     return False
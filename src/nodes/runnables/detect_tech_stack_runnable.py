@@ -1,10 +1,11 @@
+import os
 from pathlib import Path
 from typing import List, Optional
 
 from langchain_core.runnables import RunnableConfig
 
-from src.dto.state_dto import RootRepoState, TechStack
-from src.nodes.agents.tech_stack_agent import tech_stack_agent
+from src.dto.state_dto import RootRepoState, SelfBuiltComponent, TechStack
+from src.nodes.agents.tech_stack_agent import tech_stack_agent_batch
 from src.logging.logging import get_logger
 
 logger = get_logger(__name__)
@@ -14,6 +15,22 @@ PACKAGE_MANAGER_FILES = [
     "pyproject.toml", "setup.py", "Pipfile", "poetry.lock", "composer.json", "Gemfile",
     "go.mod", "Cargo.toml"
 ]
+# File name -> position in PACKAGE_MANAGER_FILES, which is the order files are analyzed in
+_PACKAGE_MANAGER_ORDER = {name: index for index, name in enumerate(PACKAGE_MANAGER_FILES)}
+
+
+def _find_package_manager_files(comp_path: Path) -> List[Path]:
+    """
+    List the package manager files directly inside comp_path with one directory scan.
+    """
+    try:
+        with os.scandir(comp_path) as entries:
+            found = [entry for entry in entries if entry.name in _PACKAGE_MANAGER_ORDER and entry.is_file()]
+    except OSError as e:
+        logger.warning(f"Could not scan component directory {comp_path}: {e}")
+        return []
+    found.sort(key=lambda entry: _PACKAGE_MANAGER_ORDER[entry.name])
+    return [Path(entry.path) for entry in found]
 
 def detect_tech_stack_runnable(state: RootRepoState, config: RunnableConfig) -> RootRepoState:
     """
@@ -24,37 +41,50 @@ def detect_tech_stack_runnable(state: RootRepoState, config: RunnableConfig) ->
         return state
 
     repo_path = Path(state.local_path)
+    # Read every component's package manager files first, so the LLM calls of all components run in one batch
+    analyzed: List[SelfBuiltComponent] = []
+    components: List[SelfBuiltComponent] = []
+    file_paths: List[Path] = []
+    contents: List[str] = []
     for component in state.self_built_software:
         comp_path = repo_path / component.path
         if not comp_path.exists():
             logger.warning(f"Component path does not exist: {comp_path}")
             continue
 
-        tech_stacks: List[TechStack] = []
-        for pm_file in PACKAGE_MANAGER_FILES:
-            found_files = list(comp_path.glob(pm_file))
-            for file_path in found_files:
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    # Get model name from config if provided
-                    model_name = config.get("configurable", {}).get("model_name") if config else None
-                    result = tech_stack_agent(content, model_name)
-                    logger.info(f"Tech stack agent result for {file_path}: {result}")
-                    for stack_item in getattr(result, "tech_stacks", result.get("tech_stacks", [])):
-                        if stack_item and all(
-                            stack_item.get(key) if isinstance(stack_item, dict) else getattr(stack_item, key, None)
-                            for key in ["name", "version", "confidence", "evidence"]
-                        ):
-                            tech_stacks.append(TechStack(
-                                name=stack_item["name"] if isinstance(stack_item, dict) else stack_item.name,
-                                version=stack_item["version"] if isinstance(stack_item, dict) else stack_item.version,
-                                confidence=stack_item["confidence"] if isinstance(stack_item, dict) else stack_item.confidence,
-                                evidence=stack_item["evidence"] if isinstance(stack_item, dict) else stack_item.evidence,
-                            ))
-                except Exception as e:
-                    logger.warning(f"Failed to process {file_path}: {e}")
-
-        component.tech_stacks = tech_stacks
+        for file_path in _find_package_manager_files(comp_path):
+            try:
+                contents.append(file_path.read_text(encoding="utf-8"))
+                components.append(component)
+                file_paths.append(file_path)
+            except Exception as e:
+                logger.warning(f"Failed to process {file_path}: {e}")
+        component.tech_stacks = []
+        analyzed.append(component)
+
+    # Get model name from config if provided
+    model_name = config.get("configurable", {}).get("model_name") if config else None
+    # One concurrent round of LLM calls for the whole repository instead of one round per component
+    results = tech_stack_agent_batch(contents, model_name)
+
+    for component, file_path, result in zip(components, file_paths, results):
+        try:
+            logger.info(f"Tech stack agent result for {file_path}: {result}")
+            for stack_item in getattr(result, "tech_stacks", result.get("tech_stacks", [])):
+                if stack_item and all(
+                    stack_item.get(key) if isinstance(stack_item, dict) else getattr(stack_item, key, None)
+                    for key in ["name", "version", "confidence", "evidence"]
+                ):
+                    component.tech_stacks.append(TechStack(
+                        name=stack_item["name"] if isinstance(stack_item, dict) else stack_item.name,
+                        version=stack_item["version"] if isinstance(stack_item, dict) else stack_item.version,
+                        confidence=stack_item["confidence"] if isinstance(stack_item, dict) else stack_item.confidence,
+                        evidence=stack_item["evidence"] if isinstance(stack_item, dict) else stack_item.evidence,
+                    ))
+        except Exception as e:
+            logger.warning(f"Failed to process {file_path}: {e}")
+
+    for component in analyzed:
         logger.info(f"Extracted tech stack for {component.name}: {[f'{s.name} {s.version}' for s in component.tech_stacks]}")
 
     return state
@@ -1,13 +1,28 @@
 import os
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Optional
 
-from github import Github, GithubException
+import requests
+from github import GithubException
 
 from src.logging.logging import get_logger
+from src.tools.github_client import github_client
 from src.utils.url_helper import parse_github_url_to_repo_full_name
 
 logger = get_logger(__name__)
 
+# Locations GitHub reads CODEOWNERS from, in the order it gives them precedence:
+# .github/ first, then the repository root, then docs/
+CODEOWNERS_PATHS = [
+    ".github/CODEOWNERS",
+    "CODEOWNERS",
+    "docs/CODEOWNERS"
+]
+
+RAW_CONTENT_URL = "https://raw.githubusercontent.com/{repo_full_name}/HEAD/{path}"
+RAW_CONTENT_TIMEOUT_SECONDS = 10
+
 def discover_codeowners_runnable(repo_root_url: str) -> str:
     """
     Get the content of the CODEOWNERS file in a repository.
@@ -15,22 +30,58 @@ def discover_codeowners_runnable(repo_root_url: str) -> str:
     logger.info(f"Fetching CODEOWNERS content for repo: {repo_root_url}")
 
     repo_full_name = parse_repo_full_name(repo_root_url)
+    token = os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
+
+    # Plain file bodies from raw.githubusercontent.com, without the Contents API's JSON/base64 envelope
+    file_content = _find_codeowners(lambda path: _fetch_raw_content(token, repo_full_name, path))
+    if file_content is not None:
+        return file_content
+
+    logger.info("CODEOWNERS not found via raw content, falling back to the GitHub API.")
     repo_obj = get_gh_repo_object(repo_full_name)
-    codeowners_paths = [
-        "CODEOWNERS",
-        ".github/CODEOWNERS",
-        "docs/CODEOWNERS"
-    ]
-    for path in codeowners_paths:
+
+    def _fetch(path: str) -> Optional[str]:
         try:
-            file_content = repo_obj.get_contents(path).decoded_content.decode()
-            logger.info(f"Found CODEOWNERS at {path}")
-            return file_content
+            return repo_obj.get_contents(path).decoded_content.decode()
         except Exception:
-            continue
+            return None
+
+    file_content = _find_codeowners(_fetch)
+    if file_content is not None:
+        return file_content
     logger.warning("CODEOWNERS file not found.")
     return "CODEOWNERS file not found."
 
+def _find_codeowners(fetch) -> Optional[str]:
+    """
+    Probe all candidate locations at once with fetch(path) -> content or None, then honour their precedence.
+    """
+    with ThreadPoolExecutor(max_workers=len(CODEOWNERS_PATHS)) as executor:
+        contents = list(executor.map(fetch, CODEOWNERS_PATHS))
+    for path, file_content in zip(CODEOWNERS_PATHS, contents):
+        if file_content is not None:
+            logger.info(f"Found CODEOWNERS at {path}")
+            return file_content
+    return None
+
+def _fetch_raw_content(token: Optional[str], repo_full_name: str, path: str) -> Optional[str]:
+    url = RAW_CONTENT_URL.format(repo_full_name=repo_full_name, path=path)
+    try:
+        response = _get_raw_session(token).get(url, timeout=RAW_CONTENT_TIMEOUT_SECONDS)
+    except requests.RequestException as exc:
+        logger.debug(f"Could not fetch {url}: {exc}")
+        return None
+    if response.status_code != 200:
+        return None
+    return response.text
+
+@lru_cache(maxsize=4)
+def _get_raw_session(token: Optional[str]) -> requests.Session:
+    session = requests.Session()
+    if token:
+        session.headers["Authorization"] = f"token {token}"
+    return session
+
 def parse_repo_full_name(repo_root_url: str) -> str:
     try:
         owner, repo = parse_github_url_to_repo_full_name(repo_root_url)
@@ -47,11 +98,16 @@ def get_gh_repo_object(repo_full_name: str) -> Any:
         logger.error("GITHUB_TOKEN not set.")
         return "Error: GITHUB_TOKEN not set."
 
-    gh = Github(token)
     try:
-        repo_obj = gh.get_repo(repo_full_name)
+        repo_obj = _get_gh_repo(token, repo_full_name)
         logger.info(f"Fetched repo object for: {repo_full_name}")
         return repo_obj
     except GithubException as exc:
         logger.error(f"Error opening {repo_full_name!r}: {exc}")
-        return f"Error opening {repo_full_name!r}: {exc}"
\ No newline at end of file
+        return f"Error opening {repo_full_name!r}: {exc}"
+
+@lru_cache(maxsize=256)
+def _get_gh_repo(token: str, repo_full_name: str) -> Any:
+    # Keyed by token so a rotated token looks the repository up again with its own client;
+    # failed lookups raise and are therefore not cached
+    return github_client().get_repo(repo_full_name)
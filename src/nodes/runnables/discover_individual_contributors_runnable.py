@@ -1,6 +1,6 @@
-import re
 import subprocess
-from typing import TypedDict, List
+import threading
+from typing import Optional, TypedDict, List
 
 from src.logging.logging import get_logger
 
@@ -13,34 +13,60 @@ class Individual(TypedDict):
     commits: int
 
 
+SHORTLOG_TIMEOUT_SECONDS = 60
+
+# Lowercase name fragments of automation accounts that are not individual contributors
+BOT_NAME_MARKERS = ("renovate",)
+
+
+def _parse_shortlog_line(line: str) -> Optional[Individual]:
+    """
+    Parse a `git shortlog -sne` line ("  <commits>\t<name> <<email>>") with plain string
+    operations instead of a regex; returns None for lines that do not have that shape.
+    """
+    commits, _, author = line.strip().partition("\t")
+    email_start = author.rfind("<")
+    if not commits.isdigit() or email_start == -1 or not author.endswith(">"):
+        return None
+    name = author[:email_start].strip()
+    if any(marker in name.lower() for marker in BOT_NAME_MARKERS):
+        return None
+    # TypedDicts are plain dicts at runtime; the literal skips the keyword-argument call
+    return {"name": name, "email": author[email_start + 1:-1].strip(), "commits": int(commits)}
+
+
 def discover_individual_contributors_runnable(local_path: str, service_name: str, service_path: str) -> List[
     Individual]:
     """
     Get the contributors for a service
+    Safe to call from several threads at once: every call runs its own git process,
+    so callers may overlap it with other per-service discovery.
     """
     try:
 
         logger.info("Discovering individual contributors for service: %s", service_name)
-        result = subprocess.run(
-            ["git", "shortlog", "HEAD", "-sne", "--", service_path if service_path != "" else "."],
-            stdout=subprocess.PIPE,
-            cwd=local_path,
-            text=True,
-            timeout=60  # 1 minute timeout
-        )
+        # Merge commits only record who merged, not who contributed, and skipping them shortens the walk
+        command = ["git", "shortlog", "HEAD", "-sne", "--no-merges", "--", service_path if service_path != "" else "."]
         contributors: list[Individual] = []
-        for line in result.stdout.strip().splitlines():
-            match = re.match(r"\s*(\d+)\s+(.*?)\s+<(.+)>", line)
-            if match:
-                commits, name, email = match.groups()
-                if "renovate" in name.lower():
-                    continue
-                contributors.append(
-                    Individual(
-                        name=name.strip(),
-                        email=email.strip(),
-                        commits=int(commits)
-                    ))
+        # Parse lines as git writes them instead of buffering the whole output first
+        with subprocess.Popen(command, stdout=subprocess.PIPE, cwd=local_path, text=True) as proc:
+            timed_out = threading.Event()
+
+            def _kill() -> None:
+                timed_out.set()
+                proc.kill()
+
+            watchdog = threading.Timer(SHORTLOG_TIMEOUT_SECONDS, _kill)
+            watchdog.start()
+            try:
+                for line in proc.stdout:
+                    contributor = _parse_shortlog_line(line)
+                    if contributor:
+                        contributors.append(contributor)
+            finally:
+                watchdog.cancel()
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, SHORTLOG_TIMEOUT_SECONDS)
         return contributors
 
     except subprocess.TimeoutExpired:
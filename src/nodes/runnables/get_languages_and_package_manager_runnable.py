@@ -1,6 +1,11 @@
-import glob
+import os
+import re
+import subprocess
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from typing_extensions import TypedDict
 
@@ -60,6 +65,43 @@ LANGUAGES = {
 }
 
 
+# Source file extension ('*.kt' -> '.kt') -> language it indicates
+_EXTENSION_TO_LANGUAGE = {
+    indicator[1:]: language
+    for language, spec in LANGUAGES.items()
+    for indicator in spec["file_indicators"]
+}
+
+def _build_manifest_index() -> Tuple[Dict[str, List[str]], List[Tuple[re.Pattern, str]]]:
+    """
+    Split the build manifests of all languages into an exact file name -> languages map
+    (build.gradle -> Kotlin and Java) and (compiled glob, language) pairs for wildcards such as '*.csproj'.
+    """
+    by_name: Dict[str, List[str]] = defaultdict(list)
+    patterns: List[Tuple[re.Pattern, str]] = []
+    for language, spec in LANGUAGES.items():
+        for manifest in spec["build_manifests"]:
+            if any(c in manifest for c in "*?["):
+                patterns.append((re.compile(translate(manifest)), language))
+            else:
+                by_name[manifest].append(language)
+    return dict(by_name), patterns
+
+
+_MANIFEST_TO_LANGUAGES, _MANIFEST_PATTERNS = _build_manifest_index()
+
+# Concurrent manifest reads per service
+MANIFEST_READ_WORKERS = 8
+
+# Manifests above this size (typically lockfiles) are cut to their first and last half of it
+MANIFEST_MAX_BYTES = 256 * 1024
+
+# Dependency and build output directories, never scanned for source files
+EXCLUDED_DIRS = frozenset({"node_modules", "venv", "__pycache__", "target", "build", "dist", "vendor"})
+
+LS_FILES_TIMEOUT_SECONDS = 30
+
+
 class FilesContent(TypedDict):
     file_name: Optional[str]
     content: Optional[str]
@@ -77,33 +119,147 @@ class ServiceManifests(TypedDict):
 def get_languages_and_package_manager_runnable(local_path: str, service_name: str, service_path: str) -> ServiceManifests:
     """
     Get the content from the package manager for a service
+    Safe to call from several threads at once: no module state is mutated, so callers
+    may overlap it with contributor discovery.
     """
     if not local_path:
         logger.warning("No local path available for deployment signal analysis")
-        return f"Error: no local path"
+        return ServiceManifests(local_path="", service_name=service_name, languages=[])
 
     local_repo_path = Path(local_path + "/" + service_path)
     if not local_repo_path.exists():
         logger.error(f"Local repository path does not exist: {local_repo_path}")
-        return f"Error: no local path"
+        return ServiceManifests(local_path=local_path, service_name=service_name, languages=[])
+
+    source_file_counts, manifests_by_language = _scan_service(str(local_repo_path))
+
+    # Manifests of every detected language, each file once (e.g. build.gradle serves Kotlin and Java)
+    detected_languages = [language for language in LANGUAGES if source_file_counts.get(language, 0) > 0]
+    manifests_by_language = {language: manifests_by_language.get(language, []) for language in detected_languages}
+    manifest_names = list(dict.fromkeys(name for names in manifests_by_language.values() for name in names))
+    manifest_contents = _read_manifests(local_repo_path, manifest_names)
 
-    files_content: List[FilesContent] = []
     languages: List[Language] = []
     total_files_content_found = 0
-    for expected_language in LANGUAGES:
-        total_files = 0
-        for file_extension in LANGUAGES[expected_language]["file_indicators"]:
-            total_files += len(list(glob.glob(local_path + "/" + service_path + "/**/" + file_extension, recursive=True)))
-        if total_files > 0:
-            for expected_manifest_name in LANGUAGES[expected_language]["build_manifests"]:
-                found_files = list(local_repo_path.glob(expected_manifest_name))
-                for file_path in found_files:
-                    files_content.append(FilesContent(file_name=file_path.name, content=file_path.read_text(encoding="utf-8")))
-                total_files_content_found += len(found_files)
-
-            languages.append(Language(name=expected_language, total_files=total_files, packages_content=files_content))
+    for expected_language in detected_languages:
+        # Each language carries only its own manifests; TypedDicts are plain dicts at runtime
+        files_content: List[FilesContent] = [
+            {"file_name": file_name, "content": manifest_contents[file_name]}
+            for file_name in manifests_by_language[expected_language]
+        ]
+        total_files_content_found += len(manifests_by_language[expected_language])
+
+        languages.append({
+            "name": expected_language,
+            "total_files": source_file_counts[expected_language],
+            "packages_content": files_content,
+        })
 
     logger.info(f"Languages found {len(languages)} and manifest found {total_files_content_found} files for {service_name}")
 
     # ── return structured result ───────────────────────────────
     return ServiceManifests(local_path=local_path, service_name=service_name, languages=languages)
+
+
+def _scan_service(service_dir: str) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+    """
+    Count source files per language by extension and assign the build manifests directly
+    inside service_dir to their languages. Hidden entries are skipped like glob does, and
+    dependency/build output directories are pruned.
+    """
+    tracked_files = _list_tracked_files(service_dir)
+    if tracked_files is None:
+        return _walk_service(service_dir)
+
+    counts: Dict[str, int] = defaultdict(int)
+    manifests: Dict[str, List[str]] = defaultdict(list)
+    for relative_path in tracked_files:
+        *dir_parts, name = relative_path.split("/")
+        if any(part.startswith(".") or part in EXCLUDED_DIRS for part in dir_parts):
+            continue
+        if not dir_parts:
+            for language in _manifest_languages(name):
+                manifests[language].append(name)
+        if name.startswith("."):
+            continue
+        language = _EXTENSION_TO_LANGUAGE.get(os.path.splitext(name)[1])
+        if language:
+            counts[language] += 1
+    return counts, manifests
+
+
+def _list_tracked_files(service_dir: str) -> Optional[List[str]]:
+    """
+    List the files tracked under service_dir, relative to it, from the git index.
+    Reading the index needs no stat call per file and never sees untracked or ignored output.
+    Returns None when service_dir is not inside a git work tree.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "-C", service_dir, "ls-files", "-z"],
+            capture_output=True,
+            timeout=LS_FILES_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        logger.warning(f"git ls-files failed for {service_dir}, walking the directory instead: {exc}")
+        return None
+    if result.returncode != 0:
+        return None
+    # The index is kept in path order, so top-level manifests come out sorted like the walk's
+    return [p for p in result.stdout.decode("utf-8", errors="surrogateescape").split("\0") if p]
+
+
+def _walk_service(service_dir: str) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+    """
+    Walk the service directory once; used when it is not a git work tree.
+    """
+    counts: Dict[str, int] = defaultdict(int)
+    manifests: Dict[str, List[str]] = defaultdict(list)
+    for dirpath, dirnames, filenames in os.walk(service_dir):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in EXCLUDED_DIRS]
+        if dirpath == service_dir:
+            for name in sorted(filenames):
+                for language in _manifest_languages(name):
+                    manifests[language].append(name)
+        for name in filenames:
+            if name.startswith("."):
+                continue
+            language = _EXTENSION_TO_LANGUAGE.get(os.path.splitext(name)[1])
+            if language:
+                counts[language] += 1
+    return counts, manifests
+
+
+def _manifest_languages(file_name: str) -> List[str]:
+    languages = _MANIFEST_TO_LANGUAGES.get(file_name)
+    if languages is not None:
+        return languages
+    return [language for pattern, language in _MANIFEST_PATTERNS if pattern.match(file_name)]
+
+
+def _read_manifests(service_dir: Path, file_names: List[str]) -> Dict[str, str]:
+    """
+    Read the given manifest files concurrently, returning file name -> content.
+    """
+    if not file_names:
+        return {}
+
+    def _read(file_name: str) -> str:
+        # Binary read + one decode: no newline translation pass over large lockfiles
+        with open(service_dir / file_name, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= MANIFEST_MAX_BYTES:
+                return f.read().decode("utf-8", errors="replace")
+            # Too large for a prompt anyway; keep the head (names, versions) and the tail
+            half = MANIFEST_MAX_BYTES // 2
+            head = f.read(half)
+            f.seek(size - half)
+            tail = f.read(half)
+        return (
+            head.decode("utf-8", errors="replace")
+            + f"\n... [{size - 2 * half} bytes truncated] ...\n"
+            + tail.decode("utf-8", errors="replace")
+        )
+
+    with ThreadPoolExecutor(max_workers=min(MANIFEST_READ_WORKERS, len(file_names))) as executor:
+        return dict(zip(file_names, executor.map(_read, file_names)))
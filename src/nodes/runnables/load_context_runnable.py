@@ -72,6 +72,10 @@ def load_context_runnable(state: RootRepoState) -> RootRepoState:
     return state
 
 
+_GITHUB_HTTPS_PREFIXES = ("https://github.com/", "https://www.github.com/")
+_GITHUB_SSH_RE = re.compile(r"^git@github\.com:([^/]+)/.*$")
+
+
 def _extract_org_from_url(repo_url: str) -> Optional[str]:
     """Extract the organization/owner name from a GitHub repository URL.
 
@@ -90,6 +94,14 @@ def _extract_org_from_url(repo_url: str) -> Optional[str]:
     if not repo_url:
         return None
 
+    # Fast path for the canonical https://github.com/org/repo form
+    for prefix in _GITHUB_HTTPS_PREFIXES:
+        if repo_url.startswith(prefix):
+            org = repo_url[len(prefix):].split("/", 1)[0]
+            if org and not any(c in org for c in "?#"):
+                return org
+            break
+
     # Try HTTPS format: https://github.com/org/repo[.git]
     try:
         parsed = urlparse(repo_url)
@@ -102,8 +114,7 @@ def _extract_org_from_url(repo_url: str) -> Optional[str]:
         pass
 
     # Try SSH format: git@github.com:org/repo.git
-    ssh_pattern = r"^git@github\.com:([^/]+)/.*$"
-    match = re.match(ssh_pattern, repo_url)
+    match = _GITHUB_SSH_RE.match(repo_url)
     if match:
         return match.group(1)
 
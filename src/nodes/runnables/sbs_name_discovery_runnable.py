@@ -1,11 +1,15 @@
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Set, Dict
+from typing import Iterator, List, Optional, Set, Dict, Tuple
 
 from src.dto.state_dto import RootRepoState, SelfBuiltComponent, Owner, ComponentType
 from src.logging.logging import get_logger
-from src.utils.file_filters import _should_skip_directory, _is_binary_file, _is_generated_or_derived_directory
+from src.utils.file_filters import _should_skip_directory, _is_generated_or_derived_directory
 from src.nodes.agents.ai_service_discovery_agent import ai_service_discovery_agent
 
 
@@ -34,6 +38,33 @@ PACKAGE_MANAGER_FILES = {
     "pubspec.yaml": "dart"
 }
 
+# Exact package manager file names, and the suffix -> language map of the '*.ext' entries
+_EXACT_PACKAGE_MANAGER_FILES = frozenset(name for name in PACKAGE_MANAGER_FILES if not name.startswith("*"))
+_PACKAGE_MANAGER_SUFFIXES = {
+    name[1:]: language for name, language in PACKAGE_MANAGER_FILES.items() if name.startswith("*")
+}
+_PACKAGE_MANAGER_SUFFIX_TUPLE = tuple(_PACKAGE_MANAGER_SUFFIXES)
+
+# Path fragments of CI/CD files, matched anywhere in the path (e.g. Jenkinsfile.release too)
+CICD_FILE_PATTERNS = (
+    '.github/workflows/',
+    '.gitlab-ci.yml',
+    'Jenkinsfile',
+    'azure-pipelines.yml',
+    'azure-pipelines.yaml',
+    '.circleci/config.yml',
+    '.travis.yml',
+)
+# One compiled alternation instead of a substring test per fragment
+_CICD_FILE_RE = re.compile("|".join(re.escape(pattern) for pattern in CICD_FILE_PATTERNS))
+
+# Concurrent deployment/CI/CD file reads per repository
+DEPLOYMENT_READ_WORKERS = 8
+
+# With fewer CI/CD-referenced directories than this, the pattern heuristic is not trusted
+# and the LLM picks the services from the candidates and deployment files instead
+MIN_REFERENCED_DIRS_FOR_HEURISTIC = 4
+
 def sbs_name_discovery_runnable(state: RootRepoState) -> RootRepoState:
     """
     Analyze the locally cloned repository to discover self-built software.
@@ -72,11 +103,12 @@ def discover_services_by_deployment_signals(repo_path: Path, repo_root_url: str,
     logger.info(f"Found {len(package_manager_dirs)} directories with package managers")
 
     # Step 2: Analyze CI/CD files to find which directories they reference
-    referenced_dirs = _analyze_cicd_references(repo_path, deployment_signal_files, package_manager_dirs)
+    file_contents = _read_deployment_files(repo_path, [f for f in deployment_signal_files if _is_cicd_file(f)])
+    referenced_dirs = _analyze_cicd_references(repo_path, deployment_signal_files, package_manager_dirs, file_contents)
     logger.info(f"CI/CD files reference {len(referenced_dirs)} package manager directories")
 
     # Step 3: Create services for referenced directories
-    if len(referenced_dirs)>=4:
+    if len(referenced_dirs) >= MIN_REFERENCED_DIRS_FOR_HEURISTIC:
         for dir_info in package_manager_dirs:
             relative_path = dir_info['path']
 
@@ -103,17 +135,15 @@ def discover_services_by_deployment_signals(repo_path: Path, repo_root_url: str,
                 services.append(component)
                 logger.info(f"Found service: {service_name} at {relative_path} (language: {language})")
     else:
-        # Read CI/CD/deployment file contents
-        cicd_files = []
-        for file in deployment_signal_files:
-            fpath = repo_path / file
-            if fpath.exists() and fpath.is_file():
-                try:
-                    with open(fpath, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
-                    cicd_files.append({"path": file, "content": content})
-                except Exception as e:
-                    logger.warning(f"Could not read {file}: {e}")
+        # Read CI/CD/deployment file contents; the CI/CD files were already read for step 2
+        file_contents.update(_read_deployment_files(
+            repo_path, [f for f in dict.fromkeys(deployment_signal_files) if f not in file_contents]
+        ))
+        cicd_files = [
+            {"path": file, "content": file_contents[file]}
+            for file in deployment_signal_files
+            if file in file_contents
+        ]
 
         # Call the LLM agent
         discovered = ai_service_discovery_agent(
@@ -151,33 +181,20 @@ def discover_services_by_deployment_signals(repo_path: Path, repo_root_url: str,
 def _find_package_manager_directories(repo_path: Path) -> List[Dict]:
     """Find all directories containing package manager files."""
     package_dirs = []
-    processed_dirs = set()  # Track already processed directories
-
-    for root, dirs, files in os.walk(repo_path):
-        root_path = Path(root)
-
-        # Skip directories that should be filtered out
-        dirs[:] = [
-            d for d in dirs
-            if not _should_skip_directory(d)
-            and not _is_generated_or_derived_directory(root_path / d)
-        ]
 
-        # Filter out binary files
-        filtered_files = [
-            f for f in files
-            if not _is_binary_file(f)
-        ]
-
-        # Check for package manager files in this directory
+    for relative_dir, files in _walk_candidate_directories(repo_path):
+        # Check for package manager files in this directory. No package manager file name
+        # looks binary, so a single pass without a separate binary filter is enough.
         package_files_found = []
-        for file in filtered_files:
+        for file in files:
             if _is_package_manager_file(file):
                 package_files_found.append(file)
+                # Nothing outranks package.json, so the rest of the directory cannot change the choice
+                if file == 'package.json':
+                    break
 
-        # If we found package manager files and haven't processed this directory yet
-        relative_path = root_path.relative_to(repo_path)
-        if package_files_found and str(relative_path) not in processed_dirs:
+        # The walk yields every directory once, so no seen-set is needed
+        if package_files_found:
             # Prioritize certain package manager files over others
             priority_order = ['package.json', 'project.json', 'pom.xml', 'build.gradle', 'go.mod', 'Cargo.toml']
 
@@ -187,20 +204,64 @@ def _find_package_manager_directories(repo_path: Path) -> List[Dict]:
                     selected_file = priority_file
                     break
 
+            # Only reported directories are boxed into a Path
             package_dirs.append({
-                'path': relative_path,
+                'path': Path(relative_dir),
                 'package_file': selected_file,
-                'language': PACKAGE_MANAGER_FILES.get(selected_file, "unknown")
+                'language': _package_manager_language(selected_file)
             })
 
-            processed_dirs.add(str(relative_path))
-
     return package_dirs
 
-def _analyze_cicd_references(repo_path: Path, deployment_signal_files: List[str], package_manager_dirs: List[Dict]) -> Set[str]:
+def _walk_candidate_directories(repo_path: Path) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Yield (relative directory, file names) for every directory that may hold a service,
+    top-down in the same order as os.walk; the root is ".". Entry types come from the
+    os.scandir DirEntry cache instead of a stat per entry, skipped or generated directories
+    are pruned before they are opened, and paths stay plain strings.
+    """
+    pending = [(str(repo_path), ".")]
+    while pending:
+        dirpath, relative_dir = pending.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        files = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(entry.name)
+            elif (
+                # Symlinked directories are not descended into, like os.walk
+                not entry.is_symlink()
+                and not _should_skip_directory(entry.name)
+                and not _is_generated_or_derived_directory(Path(entry.name))
+            ):
+                child = entry.name if relative_dir == "." else f"{relative_dir}/{entry.name}"
+                subdirs.append((entry.path, child))
+
+        yield relative_dir, files
+        # Reversed so the stack pops subdirectories in listing order
+        pending.extend(reversed(subdirs))
+
+
+def _analyze_cicd_references(
+    repo_path: Path,
+    deployment_signal_files: List[str],
+    package_manager_dirs: List[Dict],
+    file_contents: Optional[Dict[str, str]] = None,
+) -> Set[str]:
     """
     Analyze CI/CD files to find which package manager directories they reference.
     Handles both source directories and their corresponding build/dist directories.
+    file_contents holds already read files (path -> content); CI/CD files missing from it are read here.
     """
     referenced_dirs = set()
 
@@ -212,41 +273,99 @@ def _analyze_cicd_references(repo_path: Path, deployment_signal_files: List[str]
 
     logger.info(f"Analyzing {len(cicd_files)} CI/CD files for service references: {cicd_files}")
 
+    # Infrastructure directories are never services; decide that once per directory, not per CI/CD file
+    candidate_dirs = [
+        dir_info for dir_info in package_manager_dirs
+        if not _is_infrastructure_directory(str(dir_info['path']))
+    ]
+    if not cicd_files or not candidate_dirs:
+        # Nothing can be referenced; skip building the pattern index and reading files
+        logger.info(f"Referenced directories found: {referenced_dirs}")
+        return referenced_dirs
+
+    # Invert to pattern -> directories, so a pattern shared by several directories
+    # (e.g. "services:") is searched once per CI/CD file instead of once per directory.
+    # Patterns are grouped under an anchor they contain (the directory path, name or a path
+    # segment): a CI/CD file without the anchor cannot contain any of its patterns, which
+    # rules most of them out with one search per anchor instead of one search each.
+    patterns_by_anchor: Dict[str, Dict[str, List[str]]] = {}
+    for dir_info in candidate_dirs:
+        dir_path = str(dir_info['path'])
+        anchors = _reference_anchors(dir_path)
+        # A directory repeats some patterns (e.g. "app: {name}" from the service and the Helm set)
+        for pattern in dict.fromkeys(_directory_reference_patterns(dir_path, dir_info['package_file'])):
+            anchor = next((a for a in anchors if a in pattern), pattern)
+            patterns_by_anchor.setdefault(anchor, {}).setdefault(pattern, []).append(dir_path)
+
+    if file_contents is None:
+        file_contents = _read_deployment_files(repo_path, cicd_files)
+
     for cicd_file in cicd_files:
-        try:
-            cicd_path = repo_path / cicd_file
-            logger.debug(f"Processing CI/CD file: {cicd_path}")
-            if not cicd_path.exists():
-                logger.warning(f"CI/CD file does not exist: {cicd_path}")
+        if cicd_file not in file_contents:
+            continue
+        content = file_contents[cicd_file].lower()
+
+        # Check which package manager directories are referenced in this CI/CD file
+        for anchor, dirs_by_pattern in patterns_by_anchor.items():
+            if anchor not in content:
                 continue
+            for pattern, dir_paths in dirs_by_pattern.items():
+                # Directories already referenced need no further matches
+                if all(dir_path in referenced_dirs for dir_path in dir_paths):
+                    continue
+                if pattern in content:
+                    for dir_path in dir_paths:
+                        if dir_path not in referenced_dirs:
+                            logger.info(f"Directory '{dir_path}' referenced in CI/CD file '{cicd_file}'")
+                            referenced_dirs.add(dir_path)
 
-            content = cicd_path.read_text(encoding='utf-8', errors='ignore').lower()
+    logger.info(f"Referenced directories found: {referenced_dirs}")
+    return referenced_dirs
 
-            # Check which package manager directories are referenced in this CI/CD file
-            for dir_info in package_manager_dirs:
-                dir_path = str(dir_info['path'])
-                logger.debug(f"Checking if directory '{dir_path}' is referenced in CI/CD file '{cicd_file}'")
-                if _is_directory_referenced_in_cicd(content, dir_path, dir_info):
-                    logger.info(f"Directory '{dir_path}' referenced in CI/CD file '{cicd_file}'")
-                    referenced_dirs.add(dir_path)
+def _read_deployment_files(repo_path: Path, files: List[str]) -> Dict[str, str]:
+    """
+    Read the given deployment/CI/CD files concurrently, returning path -> content
+    for every file that exists and could be read. Directory signals are skipped.
+    """
+    if not files:
+        return {}
 
+    def _read(file: str) -> Optional[str]:
+        fpath = repo_path / file
+        logger.debug("Reading deployment file: %s", fpath)
+        # Open directly instead of an exists() check first: one syscall less per file
+        try:
+            with open(fpath, "r", encoding="utf-8", errors="ignore") as f:
+                return f.read()
+        except (FileNotFoundError, NotADirectoryError):
+            logger.warning(f"Deployment file does not exist: {fpath}")
+        except IsADirectoryError:
+            pass
         except Exception as e:
-            logger.debug(f"Could not analyze CI/CD file {cicd_file}: {e}")
+            logger.warning(f"Could not read {file}: {e}")
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(DEPLOYMENT_READ_WORKERS, len(files))) as executor:
+        contents = list(executor.map(_read, files))
+    return {file: content for file, content in zip(files, contents) if content is not None}
 
-    logger.info(f"Referenced directories found: {referenced_dirs}")
-    return referenced_dirs
 
-def _is_directory_referenced_in_cicd(content: str, dir_path: str, dir_info: Dict) -> bool:
+def _reference_anchors(dir_path: str) -> List[str]:
     """
-    Check if a directory is referenced in CI/CD content.
-    Generic pattern matching for various monorepo tools and CI/CD systems.
+    Lowercased parts of a directory path that its reference patterns are built around,
+    longest first so the most selective one is picked for a pattern.
     """
-    package_file = dir_info['package_file']
+    service_name = Path(dir_path).name if dir_path != "." else "root"
+    path_segments = dir_path.split('/') if dir_path != "." else []
+    anchors = {dir_path.lower(), service_name.lower(), *(segment.lower() for segment in path_segments)}
+    return sorted(anchors, key=lambda anchor: (-len(anchor), anchor))
 
-    # First check if this looks like an infrastructure directory
-    if _is_infrastructure_directory(dir_path):
-        return False
 
+def _directory_reference_patterns(dir_path: str, package_file: str) -> Iterator[str]:
+    """
+    Lowercased patterns that indicate a directory is referenced in CI/CD content.
+    Generic pattern matching for various monorepo tools and CI/CD systems.
+    """
     # Extract service/project name from directory path
     service_name = Path(dir_path).name if dir_path != "." else "root"
 
@@ -265,16 +384,9 @@ def _is_directory_referenced_in_cicd(content: str, dir_path: str, dir_info: Dict
     # 4. Tool-specific patterns
     tool_patterns = _generate_tool_specific_patterns(service_name, dir_path, path_segments)
 
-    # Combine all patterns and convert to lowercase for case-insensitive matching
-    all_patterns = direct_patterns + service_patterns + build_patterns + tool_patterns
-    all_patterns_lower = [pattern.lower() for pattern in all_patterns]
-
-    # Check if any pattern matches
-    for pattern in all_patterns_lower:
-        if pattern in content:
-            return True
-
-    return False
+    # Chain the patterns lazily and convert to lowercase for case-insensitive matching
+    for pattern in chain(direct_patterns, service_patterns, build_patterns, tool_patterns):
+        yield pattern.lower()
 
 def _generate_direct_path_patterns(dir_path: str, package_file: str) -> List[str]:
     """Generate direct path reference patterns."""
@@ -483,66 +595,57 @@ def _generate_tool_specific_patterns(service_name: str, dir_path: str, path_segm
 
     return patterns
 
+# Exact matches for common infrastructure directories
+INFRASTRUCTURE_DIR_NAMES = frozenset({
+    'k8s', 'kubernetes', 'kube',
+    'infrastructure', 'infra', 'deploy', 'deployment', 'deployments',
+    'config', 'configuration', 'configs', 'conf',
+    'manifests', 'helm', 'charts', 'chart',
+    'terraform', 'tf', 'ansible', 'playbooks',
+    'scripts', 'tools', 'utilities', 'utils',
+    'docs', 'documentation', 'doc',
+    'test', 'tests', 'testing', 'e2e', 'integration',
+    'ci', 'cd', 'pipeline', 'pipelines',
+    'security', 'secrets', 'vault',
+    'storybook', 'styleguide', 'design-system',
+    'libs', 'lib', 'libraries',
+    'monitoring', 'logs', 'logging',
+})
+
+# Excluded path prefixes (for full path matching)
+INFRASTRUCTURE_PATH_PREFIXES = ('libs/', 'scripts/', 'tools/', 'utilities/')
+
+# More specific config and metrics patterns that are clearly infrastructure
+INFRASTRUCTURE_NAME_PATTERNS = (
+    'k8s-config', 'kubernetes-config', 'helm-config',
+    'terraform-config', 'ansible-config',
+    'nginx-config', 'apache-config',
+    'docker-config', 'compose-config',
+    'ci-config', 'cd-config', 'pipeline-config',
+    'deployment-config', 'infrastructure-config',
+    'metrics-config', 'metrics-dashboard', 'metrics-setup',
+    'prometheus-config', 'grafana-config', 'observability-config',
+)
+
+@lru_cache(maxsize=1024)
 def _is_infrastructure_directory(dir_path: str) -> bool:
     """
     Check if directory appears to be infrastructure/configuration rather than a deployable service.
     Uses more specific matching to avoid false positives.
     """
     dir_name = Path(dir_path).name.lower()
-    dir_path_lower = dir_path.lower()
-
-    # Exact matches for common infrastructure directories
-    exact_infrastructure_names = {
-        'k8s', 'kubernetes', 'kube',
-        'infrastructure', 'infra', 'deploy', 'deployment', 'deployments',
-        'config', 'configuration', 'configs', 'conf',
-        'manifests', 'helm', 'charts', 'chart',
-        'terraform', 'tf', 'ansible', 'playbooks',
-        'scripts', 'tools', 'utilities', 'utils',
-        'docs', 'documentation', 'doc',
-        'test', 'tests', 'testing', 'e2e', 'integration',
-        'ci', 'cd', 'pipeline', 'pipelines',
-        'security', 'secrets', 'vault',
-        'storybook', 'styleguide', 'design-system',
-        'libs', 'lib', 'libraries',
-        'monitoring', 'logs', 'logging',
-    }
 
     # Check for exact matches first
-    if dir_name in exact_infrastructure_names:
+    if dir_name in INFRASTRUCTURE_DIR_NAMES:
         return True
 
-    # Check if directory starts with excluded patterns (for full path matching)
-    excluded_prefixes = ['libs/', 'scripts/', 'tools/', 'utilities/']
-    if any(dir_path_lower.startswith(prefix) for prefix in excluded_prefixes):
+    if dir_path.lower().startswith(INFRASTRUCTURE_PATH_PREFIXES):
         return True
 
-    # More specific config patterns that are clearly infrastructure
-    specific_config_patterns = [
-        'k8s-config', 'kubernetes-config', 'helm-config',
-        'terraform-config', 'ansible-config',
-        'nginx-config', 'apache-config',
-        'docker-config', 'compose-config',
-        'ci-config', 'cd-config', 'pipeline-config',
-        'deployment-config', 'infrastructure-config'
-    ]
+    return any(pattern in dir_name for pattern in INFRASTRUCTURE_NAME_PATTERNS)
 
-    # Check specific config patterns
-    if any(pattern in dir_name for pattern in specific_config_patterns):
-        return True
-
-    # Metrics exclusion patterns (more specific)
-    metrics_exclusion_patterns = [
-        'metrics-config', 'metrics-dashboard', 'metrics-setup',
-        'prometheus-config', 'grafana-config', 'observability-config'
-    ]
-
-    if any(pattern in dir_name for pattern in metrics_exclusion_patterns):
-        return True
-
-    return False
-
-def _generate_build_directory_mappings(source_dir: str) -> List[str]:
+@lru_cache(maxsize=1024)
+def _generate_build_directory_mappings(source_dir: str) -> Tuple[str, ...]:
     """
     Generate possible build/dist directory paths for a source directory.
     Examples:
@@ -568,7 +671,8 @@ def _generate_build_directory_mappings(source_dir: str) -> List[str]:
                 if len(parts) >= 3:
                     mappings.append(f"{prefix}/{'/'.join(parts[-2:])}")
 
-    return mappings
+    # A tuple, so the cached result cannot be changed by a caller
+    return tuple(mappings)
 
 def _generate_source_directory_mappings(build_dir: str) -> List[str]:
     """
@@ -604,17 +708,7 @@ def _generate_source_directory_mappings(build_dir: str) -> List[str]:
 
 def _is_cicd_file(file_path: str) -> bool:
     """Check if file is a CI/CD file."""
-    cicd_patterns = [
-        '.github/workflows/',
-        '.gitlab-ci.yml',
-        'Jenkinsfile',
-        'azure-pipelines.yml',
-        'azure-pipelines.yaml',
-        '.circleci/config.yml',
-        '.travis.yml'
-    ]
-
-    return any(pattern in file_path for pattern in cicd_patterns)
+    return _CICD_FILE_RE.search(file_path) is not None
 
 def _group_deployment_signals_for_service(service_path: Path, deployment_signal_files: List[str]) -> List[str]:
     """Group deployment signals that belong to a specific service."""
@@ -631,13 +725,20 @@ def _group_deployment_signals_for_service(service_path: Path, deployment_signal_
     return service_signals
 
 def _is_package_manager_file(filename: str) -> bool:
-    """Check if file is a package manager file."""
-    return filename in PACKAGE_MANAGER_FILES
+    """Check if file is a package manager file, including wildcard entries such as '*.csproj'."""
+    return filename in _EXACT_PACKAGE_MANAGER_FILES or filename.endswith(_PACKAGE_MANAGER_SUFFIX_TUPLE)
+
+def _package_manager_language(filename: str) -> str:
+    """Language of a package manager file, resolving wildcard entries by suffix."""
+    language = PACKAGE_MANAGER_FILES.get(filename)
+    if language is None:
+        language = _PACKAGE_MANAGER_SUFFIXES.get(os.path.splitext(filename)[1], "unknown")
+    return language
 
 def _extract_service_name(path: Path, package_file: str) -> str:
     """Extract service name from directory path or package file, with logging."""
     service_name = path.name
-    logger.debug(f"Attempting to extract service name from path: {path}, package_file: {package_file}")
+    logger.debug("Attempting to extract service name from path: %s, package_file: %s", path, package_file)
 
     # If it's the root directory, try to extract from package.json or similar
     if service_name == "." or not service_name:
@@ -645,7 +746,7 @@ def _extract_service_name(path: Path, package_file: str) -> str:
         if package_file == "package.json":
             try:
                 package_json_path = path / package_file
-                logger.debug(f"Reading package.json at: {package_json_path}")
+                logger.debug("Reading package.json at: %s", package_json_path)
                 with open(package_json_path, 'r') as f:
                     package_data = json.load(f)
                     extracted_name = package_data.get('name', path.parent.name)
@@ -2,12 +2,16 @@ import dataclasses
 
 from typing import Optional
 from uuid import UUID
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from src.db.conn import get_session
 from src.db.models import AiDiscoveryData
 from src.dto.state_dto import SelfBuiltComponent
 
+# Dialects with INSERT ... ON CONFLICT DO NOTHING RETURNING
+_UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
 
 def _build_filter_conditions(session: Session, fact_sheet_id: UUID):
     """Build common filter conditions for AI discovery data queries."""
@@ -35,24 +39,41 @@ def delete_ai_discovery_data(fact_sheet_id: UUID) -> None:
 
 def create_ai_discovery_data_if_not_exists(fact_sheet_id: UUID,
                                            self_built_component: SelfBuiltComponent) -> AiDiscoveryData:
-    data = get_ai_discovery_data(fact_sheet_id)
-    if data is None:
-        with get_session() as session:
-            contributors_dict = None
-            if self_built_component.owner.individuals:
-                contributors_dict = [{"name": individual.name, "emails": individual.emails} for individual in
-                                     self_built_component.owner.individuals]
-            tech_stacks_dict = None
-            if self_built_component.tech_stacks:
-                tech_stacks_dict = [dataclasses.asdict(stack) for stack in self_built_component.tech_stacks]
-            data = AiDiscoveryData(
-                fact_sheet_id=fact_sheet_id,
-                languages=self_built_component.language,
-                teams=self_built_component.owner.team if self_built_component.owner.team else None,
-                contributors=contributors_dict,
-                tech_stacks=tech_stacks_dict
+    contributors_dict = None
+    if self_built_component.owner.individuals:
+        contributors_dict = [{"name": individual.name, "emails": individual.emails} for individual in
+                             self_built_component.owner.individuals]
+    tech_stacks_dict = None
+    if self_built_component.tech_stacks:
+        tech_stacks_dict = [dataclasses.asdict(stack) for stack in self_built_component.tech_stacks]
+    values = dict(
+        fact_sheet_id=fact_sheet_id,
+        languages=self_built_component.language,
+        teams=self_built_component.owner.team if self_built_component.owner.team else None,
+        contributors=contributors_dict,
+        tech_stacks=tech_stacks_dict
+    )
+
+    with get_session() as session:
+        # The returned row stays readable after the session closes, without a refresh query
+        session.expire_on_commit = False
+        dialect_insert = _UPSERT_DIALECTS.get(session.get_bind().dialect.name)
+        if dialect_insert is not None:
+            # One INSERT ... ON CONFLICT DO NOTHING RETURNING: no separate existence check,
+            # and no race between checking and inserting
+            statement = (
+                dialect_insert(AiDiscoveryData)
+                .values(**values)
+                .on_conflict_do_nothing(index_elements=["fact_sheet_id"])
+                .returning(AiDiscoveryData)
             )
-            session.add(data)
-            session.commit()
-            session.refresh(data)
+            data = session.scalars(statement).first()
+            if data is None:
+                data = session.get(AiDiscoveryData, fact_sheet_id)
+        else:
+            data = session.get(AiDiscoveryData, fact_sheet_id)
+            if data is None:
+                data = AiDiscoveryData(**values)
+                session.add(data)
+        session.commit()
     return data
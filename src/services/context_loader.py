@@ -10,7 +10,9 @@ Repository context extends/overrides organization context.
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISREG
 from typing import Optional
 
 from src.dto.context_dto import DiscoveryContext, merge_contexts
@@ -38,11 +40,21 @@ def load_org_context(org_name: str) -> tuple[Optional[str], Optional[str]]:
     if not org_name:
         return None, None
 
+    if not _org_context_dir_exists(str(ORG_CONTEXT_DIR)):
+        # Most installations have no org context at all; skip the per-file stat
+        return None, None
+
     context_path = ORG_CONTEXT_DIR / f"{org_name}.md"
 
     try:
-        if context_path.exists() and context_path.is_file():
-            content = context_path.read_text(encoding="utf-8")
+        # One stat answers "is it a regular file" and yields the cache key; a missing
+        # file or directory ends up in the not-found branch like exists() did
+        try:
+            file_stat = context_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            file_stat = None
+        if file_stat is not None and S_ISREG(file_stat.st_mode):
+            content = _read_org_context_file(str(context_path), file_stat.st_mtime_ns, file_stat.st_size)
             logger.debug(
                 "Loaded organization context",
                 org_name=org_name,
@@ -74,6 +86,31 @@ def load_org_context(org_name: str) -> tuple[Optional[str], Optional[str]]:
         return None, None
 
 
+@lru_cache(maxsize=8)
+def _org_context_dir_exists(directory: str) -> bool:
+    """Check once per process whether the organization context directory exists.
+
+    Without the directory no organization has a context file, and every
+    repository would otherwise stat a file that cannot be there. A directory
+    created while a run is in progress is picked up by the next run.
+    """
+    exists = os.path.isdir(directory)
+    if not exists:
+        logger.debug("No organization context directory", expected_path=directory)
+    return exists
+
+
+@lru_cache(maxsize=64)
+def _read_org_context_file(path: str, mtime_ns: int, size: int) -> str:
+    """Read an organization context file once per version.
+
+    Every repository of an organization loads the same file, so it is read
+    from disk only once. The modification time and size are part of the
+    cache key, which means an edited file is picked up on the next lookup.
+    """
+    return Path(path).read_text(encoding="utf-8")
+
+
 def load_repo_context(local_path: str) -> tuple[Optional[str], Optional[str]]:
     """Load repository-level context from the cloned repo.
 
@@ -90,8 +127,13 @@ def load_repo_context(local_path: str) -> tuple[Optional[str], Optional[str]]:
     context_path = Path(local_path) / REPO_CONTEXT_FILENAME
 
     try:
-        if context_path.exists() and context_path.is_file():
+        # Each repository is loaded once, so there is nothing to cache; opening the file
+        # directly replaces the exists() and is_file() probes
+        try:
             content = context_path.read_text(encoding="utf-8")
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            content = None
+        if content is not None:
             logger.debug(
                 "Loaded repository context",
                 path=str(context_path),
@@ -1,11 +1,12 @@
-import os
 from collections import Counter
 from typing import Literal, TypedDict
 
-from github import Github, GithubException
+from github import GithubException
 from langchain_core.tools import tool
 
 from src.logging.logging import get_logger
+from src.tools.github_client import github_client
+from src.tools.github_tree import get_tree_entries, resolve_head_sha
 from src.utils.url_helper import parse_github_url_to_repo_full_name
 
 logger = get_logger(__name__)
@@ -40,18 +41,18 @@ def classify_repo_type_tool(repo_root_url: str) -> RepoClassification:
 
     logger.info("↪️  classify_repo_type_tool(%s)", repo_full_name)
 
-    token = os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
-    if not token:
+    try:
+        gh = github_client()
+    except RuntimeError:
         return "Error: GITHUB_TOKEN not set."
 
-    gh = Github(token)
     try:
         repo = gh.get_repo(repo_full_name)
     except GithubException as exc:
         return f"Error opening {repo_full_name!r}: {exc}"
 
     try:
-        tree = repo.get_git_tree(repo.default_branch, recursive=True).tree
+        tree = get_tree_entries(repo_full_name, resolve_head_sha(repo))
     except GithubException as exc:
         return f"Error fetching git tree: {exc}"
 
@@ -61,12 +62,12 @@ def classify_repo_type_tool(repo_root_url: str) -> RepoClassification:
     manifest_hits, docker_hits = 0, 0
     per_dir_hits = Counter()
 
-    for entry in tree:
-        if entry.type != "blob" or depth(entry.path) > 3:
+    for path, entry_type, _size in tree:
+        if entry_type != "blob" or depth(path) > 3:
             continue
 
-        filename = entry.path.rsplit("/", 1)[-1]
-        top_dir = entry.path.split("/", 1)[0] if depth(entry.path) == 2 else ""
+        filename = path.rsplit("/", 1)[-1]
+        top_dir = path.split("/", 1)[0] if depth(path) == 2 else ""
 
         if filename in BUILD_MANIFESTS:
             manifest_hits += 1
@@ -1,11 +1,12 @@
 import base64
-import os
 from typing import List, TypedDict, Set, Dict, Optional
 
-from github import Github, GithubException, ContentFile
+from github import GithubException, ContentFile
 from langchain_core.tools import tool
 
 from src.logging.logging import get_logger
+from src.tools.github_client import github_client
+from src.tools.github_tree import get_tree_entries, resolve_head_sha
 from src.utils.url_helper import parse_github_url_to_repo_full_name
 
 logger = get_logger(__name__)
@@ -56,16 +57,10 @@ _CURRENT: Dict[str, str] = {
     "head_sha": "",
 }
 
-def _gh_client() -> Github:
-    token = os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
-    if not token:
-        raise RuntimeError("GITHUB_TOKEN (or GH_TOKEN) not set.")
-    return Github(token)
-
 def _ensure_repo() -> "Repository.Repository":
     if not _CURRENT["repo_full_name"]:
         raise RuntimeError("Repository context missing. Call repo.get_head_sha first.")
-    gh = _gh_client()
+    gh = github_client()
     return gh.get_repo(_CURRENT["repo_full_name"])
 
 # ---- Tools -------------------------------------------------------------------
@@ -83,7 +78,7 @@ def repo_get_head_sha(repo_root_url: str) -> HeadSHAResult | Dict[str, str]:
         return {"error": "invalid_url", "message": str(err)}
 
     try:
-        gh = _gh_client()
+        gh = github_client()
     except Exception as err:
         return {"error": "tooling_missing", "message": str(err)}
 
@@ -176,7 +171,7 @@ def repo_search_code(query: str, limit: int = 50) -> SearchCodeResult | Dict[str
         repo_full_name = _CURRENT.get("repo_full_name")
         if not repo_full_name:
             raise RuntimeError("Repository context missing. Call repo.get_head_sha first.")
-        gh = _gh_client()
+        gh = github_client()
         # Force repo scoping
         q = f"{query} repo:{repo_full_name}"
         results = gh.search_code(q)
@@ -212,44 +207,42 @@ def discover_services_tool(repo_root_url: str) -> List[Service]:
 
     # Prime context (so downstream repo.* tools can be used immediately if desired)
     try:
-        gh = _gh_client()
+        gh = github_client()
         repo = gh.get_repo(repo_full_name)
     except Exception as exc:
         return [{"name": "error", "path": f"Auth/Repo error: {exc}"}]
 
     try:
-        default_branch = repo.default_branch
-        tree = repo.get_git_tree(default_branch, recursive=True).tree
+        head_sha = resolve_head_sha(repo)
+        tree = get_tree_entries(repo_full_name, head_sha)
     except GithubException as exc:
         return [{"name": "error", "path": f"Error fetching git tree: {exc}"}]
 
-    # folder -> set(file_basename)
-    folders: Dict[str, Set[str]] = {}
+    # Only folders holding a manifest or a Dockerfile matter; no per-folder set of every file name
+    manifest_folders: Set[str] = set()
+    dockerfile_folders: Dict[str, None] = {}  # insertion-ordered, keeps the tree order of the result
 
-    for entry in tree:
-        if entry.type != "blob":
+    for path, entry_type, _size in tree:
+        if entry_type != "blob":
             continue
-        folder_path = "/".join(entry.path.split("/")[:-1])  # '' for root
-        base = entry.path.rsplit("/", 1)[-1]
-        folders.setdefault(folder_path, set()).add(base)
+        folder_path, _, base = path.rpartition("/")  # '' for root
+        if base in BUILD_MANIFESTS:
+            manifest_folders.add(folder_path)
+        elif base in DOCKERFILE_NAMES:
+            dockerfile_folders[folder_path] = None
 
     services: List[Service] = []
 
-    for folder, files in folders.items():
-        has_manifest = any(f in BUILD_MANIFESTS for f in files)
-        has_docker = any(f in DOCKERFILE_NAMES for f in files)
-        if has_manifest and has_docker:
+    for folder in dockerfile_folders:
+        if folder in manifest_folders:
             # Name: last segment of folder, or repo name if root
-            service_name = folder.split("/")[-1] if folder else repo_name
+            service_name = folder.rpartition("/")[2] if folder else repo_name
             # Path: repo-relative, no leading slash; use '' for root
             service_path = folder  # '' means repo root
             services.append({"name": service_name, "path": service_path})
 
     logger.info("📦 found services=%s", services)
     # Update global context to this repo for subsequent calls
-    try:
-        _CURRENT["repo_full_name"] = repo_full_name
-        _CURRENT["head_sha"] = repo.get_branch(repo.default_branch).commit.sha
-    except Exception:
-        pass
+    _CURRENT["repo_full_name"] = repo_full_name
+    _CURRENT["head_sha"] = head_sha
     return services
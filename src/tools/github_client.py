@@ -0,0 +1,25 @@
+import os
+from functools import lru_cache
+
+from github import Auth, Github
+
+# Largest page GitHub allows; search results and other listings need fewer requests
+GITHUB_PER_PAGE = 100
+
+
+def github_client() -> Github:
+    """
+    Return the GitHub client for the configured token.
+    The client is built once per token and reused, so consecutive tool calls share its
+    pooled HTTPS connections instead of opening a new TLS session each time.
+    """
+    token = os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
+    if not token:
+        raise RuntimeError("GITHUB_TOKEN (or GH_TOKEN) not set.")
+    return _client_for_token(token)
+
+
+@lru_cache(maxsize=1)
+def _client_for_token(token: str) -> Github:
+    # Keyed by token so a rotated token gets a fresh client; PyGithub's default retry stays in place
+    return Github(auth=Auth.Token(token), per_page=GITHUB_PER_PAGE)
@@ -0,0 +1,35 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from src.logging.logging import get_logger
+from src.tools.github_client import github_client
+
+if TYPE_CHECKING:
+    from github import Repository
+
+logger = get_logger(__name__)
+
+# (path, type, size) of one git tree entry; type is "blob" | "tree"
+TreeEntryTuple = Tuple[str, str, Optional[int]]
+
+
+def resolve_head_sha(repo: "Repository.Repository") -> str:
+    """
+    Resolve the commit SHA at the tip of the repository's default branch.
+    """
+    return repo.get_branch(repo.default_branch).commit.sha
+
+
+@lru_cache(maxsize=32)
+def get_tree_entries(repo_full_name: str, sha: str) -> Tuple[TreeEntryTuple, ...]:
+    """
+    Fetch the recursive git tree of a repository at a commit as flat (path, type, size) tuples.
+    A commit's tree never changes, so classify_repo_type and discover_services share one
+    fetch per (repo, commit) instead of each listing the whole tree; the tuple is immutable
+    and safe to hand to every caller. Failures raise and are not cached.
+    """
+    # Lazy: the trees endpoint needs only the full name, not a separate repository lookup
+    repo = github_client().get_repo(repo_full_name, lazy=True)
+    tree = repo.get_git_tree(sha, recursive=True).tree
+    logger.info("Fetched git tree of %s at %s: %s entries", repo_full_name, sha, len(tree))
+    return tuple((entry.path, entry.type, entry.size) for entry in tree)
@@ -0,0 +1,40 @@
+import os
+import re
+from typing import Optional
+
+_SHA_RE = re.compile(r"^[0-9a-f]{40}(?:[0-9a-f]{24})?$")
+
+
+def read_head_commit(repo_path: str) -> Optional[str]:
+    """
+    Resolve the HEAD commit SHA of a repository by reading .git directly, without starting a git process.
+    Handles detached HEADs, loose refs and packed refs; returns None for anything else
+    (e.g. worktrees where .git is a file, or an unborn branch).
+    """
+    git_dir = os.path.join(repo_path, ".git")
+    try:
+        with open(os.path.join(git_dir, "HEAD"), encoding="utf-8") as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+
+    if not head.startswith("ref: "):
+        return head if _SHA_RE.match(head) else None
+
+    ref = head[len("ref: "):]
+    try:
+        with open(os.path.join(git_dir, *ref.split("/")), encoding="utf-8") as f:
+            sha = f.read().strip()
+        return sha if _SHA_RE.match(sha) else None
+    except OSError:
+        pass
+
+    try:
+        with open(os.path.join(git_dir, "packed-refs"), encoding="utf-8") as f:
+            for line in f:
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref and _SHA_RE.match(sha):
+                    return sha
+    except OSError:
+        pass
+    return None
@@ -1,6 +1,9 @@
 """Pytest fixtures and configuration for the test suite."""
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Callable
+
 import pytest
 
 from src.dto.context_dto import DiscoveryContext
@@ -40,3 +43,14 @@ def full_context() -> DiscoveryContext:
         org_context_path="~/.sbs-discovery/myorg.md",
         repo_context_path="/path/to/repo/.sbs-discovery.md",
     )
+
+
+@pytest.fixture
+def touch() -> Callable[..., None]:
+    """touch(base, relative, content=""): create a file (and its parent directories) under base."""
+    def _touch(base: Path, relative: str, content: str = "") -> None:
+        path = base / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    return _touch
@@ -0,0 +1,75 @@
+"""Tests for ai_discovery_data service module.
+
+Runs against an in-memory SQLite database in place of the configured one.
+"""
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.db.models import AiDiscoveryData, Base
+from src.dto.state_dto import Individual, Owner, SelfBuiltComponent, TechStack
+from src.services import ai_discovery_data as service_module
+from src.services.ai_discovery_data import create_ai_discovery_data_if_not_exists
+
+
+@pytest.fixture
+def statements(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Point the service at a fresh in-memory database and record the SQL it runs."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(service_module, "get_session", sessionmaker(bind=engine))
+    executed: list = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, sql, *args: executed.append(sql))
+    return executed
+
+
+def _component(team: str = "payments") -> SelfBuiltComponent:
+    return SelfBuiltComponent(
+        name="api", path="api", display_url="", evidence="", confidence="high",
+        owner=Owner(team=team, individuals=[Individual(name="Ann", emails=["ann@x.io"])]),
+        tech_stacks=[TechStack(name="fastapi", version="0.1", confidence="high")],
+        language=[{"name": "Python", "version": "3.13"}],
+    )
+
+
+class TestCreateAiDiscoveryDataIfNotExists:
+    """Test cases for creating the AI discovery row of a fact sheet."""
+
+    def test_creates_row_with_a_single_statement(self, statements: list) -> None:
+        """A new fact sheet gets its row from one INSERT, readable after the session closed."""
+        fact_sheet_id = uuid.uuid4()
+
+        data = create_ai_discovery_data_if_not_exists(fact_sheet_id, _component())
+
+        assert [sql.split()[0] for sql in statements] == ["INSERT"]
+        assert data.fact_sheet_id == fact_sheet_id
+        assert data.teams == "payments"
+        assert data.contributors == [{"name": "Ann", "emails": ["ann@x.io"]}]
+        assert data.languages == [{"name": "Python", "version": "3.13"}]
+        assert data.tech_stacks == [{"name": "fastapi", "version": "0.1", "confidence": "high", "evidence": []}]
+
+    def test_existing_row_is_kept(self, statements: list) -> None:
+        """A second call for the same fact sheet returns the stored row unchanged."""
+        fact_sheet_id = uuid.uuid4()
+        create_ai_discovery_data_if_not_exists(fact_sheet_id, _component(team="payments"))
+
+        data = create_ai_discovery_data_if_not_exists(fact_sheet_id, _component(team="other"))
+
+        assert data.teams == "payments"
+        with service_module.get_session() as session:
+            assert session.query(AiDiscoveryData).count() == 1
+
+    def test_other_dialects_check_before_inserting(self, statements: list, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without ON CONFLICT support the row is looked up first, in the same session."""
+        monkeypatch.setattr(service_module, "_UPSERT_DIALECTS", {})
+        fact_sheet_id = uuid.uuid4()
+
+        data = create_ai_discovery_data_if_not_exists(fact_sheet_id, _component())
+
+        assert [sql.split()[0] for sql in statements] == ["SELECT", "INSERT"]
+        assert data.teams == "payments"
@@ -102,6 +102,45 @@ class TestLoadOrgContext:
         assert content is None
         assert path is None
 
+    def test_returns_none_none_when_path_is_a_directory(self, tmp_path: Path) -> None:
+        """A directory named like the context file is not read."""
+        org_dir = tmp_path / ".sbs-discovery"
+        (org_dir / "myorg.md").mkdir(parents=True)
+
+        with patch("src.services.context_loader.ORG_CONTEXT_DIR", org_dir):
+            content, path = load_org_context("myorg")
+
+        assert content is None
+        assert path is None
+
+    def test_missing_directory_is_checked_once(self, tmp_path: Path) -> None:
+        """Without the context directory, later lookups do not touch the filesystem."""
+        nonexistent_dir = tmp_path / "nonexistent"
+
+        with patch("src.services.context_loader.ORG_CONTEXT_DIR", nonexistent_dir):
+            assert load_org_context("first") == (None, None)
+            with patch("os.path.isdir", side_effect=AssertionError("unexpected stat")), \
+                    patch.object(Path, "stat", side_effect=AssertionError("unexpected stat")):
+                assert load_org_context("second") == (None, None)
+
+    def test_file_is_read_once_per_version(self, tmp_path: Path) -> None:
+        """Repeated lookups reuse the content until the file changes."""
+        org_dir = tmp_path / ".sbs-discovery"
+        org_dir.mkdir()
+        org_file = org_dir / "myorg.md"
+        org_file.write_text(SAMPLE_ORG_CONTEXT)
+
+        with patch("src.services.context_loader.ORG_CONTEXT_DIR", org_dir):
+            with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read_text:
+                first, _ = load_org_context("myorg")
+                second, _ = load_org_context("myorg")
+                org_file.write_text(SAMPLE_ORG_CONTEXT + "More rules.\n")
+                third, _ = load_org_context("myorg")
+
+        assert first == second == SAMPLE_ORG_CONTEXT
+        assert third == SAMPLE_ORG_CONTEXT + "More rules.\n"
+        assert read_text.call_count == 2
+
 
 class TestLoadRepoContext:
     """Tests for load_repo_context function."""
@@ -143,6 +182,16 @@ class TestLoadRepoContext:
         assert content is None
         assert path is None
 
+    def test_returns_none_none_when_path_is_a_directory(self, tmp_path: Path) -> None:
+        """A directory named .sbs-discovery.md in the repo is not read."""
+        repo_dir = tmp_path / "my-repo"
+        (repo_dir / REPO_CONTEXT_FILENAME).mkdir(parents=True)
+
+        content, path = load_repo_context(str(repo_dir))
+
+        assert content is None
+        assert path is None
+
     def test_handles_permission_error_gracefully(self, tmp_path: Path) -> None:
         """When file exists but can't be read, returns (None, None)."""
         repo_dir = tmp_path / "my-repo"
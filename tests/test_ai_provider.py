@@ -0,0 +1,137 @@
+"""Tests for ai_provider module, specifically init_llm_by_provider caching."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from langchain_core.globals import get_llm_cache, set_llm_cache
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.ai_provider import ai_provider
+from src.ai_provider.ai_provider import init_llm_by_provider, validate_llm_availability
+
+PROVIDER_ENV_VARS = (
+    "OPENAI_API_KEY",
+    "ANTHROPIC_BASE_URL",
+    "ANTHROPIC_AUTH_TOKEN",
+    "ANTHROPIC_API_KEY",
+    "AICORE_CLIENT_ID",
+    "AZURE_OPENAI_API_KEY",
+    "LLM_DEPLOYMENT",
+    "LLM_CACHE_PATH",
+)
+
+
+@pytest.fixture(autouse=True)
+def openai_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Configure only the OpenAI provider and start from an empty LLM cache."""
+    for var in PROVIDER_ENV_VARS:
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(ai_provider, "_LLM_CACHE", {})
+
+
+class TestInitLlmByProviderCache:
+    """Test cases for per-process memoization of LLM instances."""
+
+    def test_same_model_returns_cached_instance(self) -> None:
+        """Repeated calls for the same model initialize the provider once."""
+        with patch.object(ai_provider, "_init_openai_llm", side_effect=lambda m: object()) as init:
+            first = init_llm_by_provider("gpt-4o")
+            second = init_llm_by_provider("gpt-4o")
+
+        assert first is second
+        init.assert_called_once_with("gpt-4o")
+
+    def test_default_model_shares_cache_with_explicit_name(self) -> None:
+        """Calling without a model name reuses the instance for the default model."""
+        with patch.object(ai_provider, "_init_openai_llm", side_effect=lambda m: object()) as init:
+            explicit = init_llm_by_provider("gpt-4o")
+            default = init_llm_by_provider()
+
+        assert explicit is default
+        init.assert_called_once()
+
+    def test_different_models_get_different_instances(self) -> None:
+        """Each model gets its own cached instance."""
+        with patch.object(ai_provider, "_init_openai_llm", side_effect=lambda m: object()) as init:
+            first = init_llm_by_provider("gpt-4o")
+            second = init_llm_by_provider("gpt-4o-mini")
+
+        assert first is not second
+        assert init.call_count == 2
+
+    def test_no_provider_configured_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without provider configuration a ValueError is raised and nothing is cached."""
+        monkeypatch.delenv("OPENAI_API_KEY")
+
+        with pytest.raises(ValueError, match="No LLM provider configured"):
+            init_llm_by_provider("gpt-4o")
+        assert ai_provider._LLM_CACHE == {}
+
+
+class TestResponseCache:
+    """Test cases for the opt-in persistent LLM response cache."""
+
+    @pytest.fixture(autouse=True)
+    def reset_global_cache(self):
+        """Leave the process-wide langchain cache as it was found."""
+        set_llm_cache(None)
+        yield
+        set_llm_cache(None)
+
+    def test_disabled_by_default(self) -> None:
+        """Without LLM_CACHE_PATH no global response cache is installed."""
+        with patch.object(ai_provider, "_init_openai_llm", side_effect=lambda m: object()):
+            init_llm_by_provider("gpt-4o")
+
+        assert get_llm_cache() is None
+
+    def test_cache_path_installs_sqlite_cache(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """LLM_CACHE_PATH installs a SQLite cache at that location."""
+        cache_file = tmp_path / "llm.db"
+        monkeypatch.setenv("LLM_CACHE_PATH", str(cache_file))
+
+        with patch.object(ai_provider, "_init_openai_llm", side_effect=lambda m: object()):
+            init_llm_by_provider("gpt-4o")
+
+        assert type(get_llm_cache()).__name__ == "SQLiteCache"
+        assert cache_file.exists()
+
+    def test_cache_path_is_expanded_and_created(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A ~ path in a directory that does not exist yet works, as the documented default does."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("LLM_CACHE_PATH", "~/.cache/sbs/llm.db")
+
+        with patch.object(ai_provider, "_init_openai_llm", side_effect=lambda m: object()):
+            init_llm_by_provider("gpt-4o")
+
+        assert (tmp_path / ".cache" / "sbs" / "llm.db").exists()
+
+    def test_unusable_cache_path_disables_the_cache(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A cache that cannot be opened is skipped instead of failing the LLM initialization."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("LLM_CACHE_PATH", str(blocker / "llm.db"))
+
+        with patch.object(ai_provider, "_init_openai_llm", side_effect=lambda m: "llm"):
+            assert init_llm_by_provider("gpt-4o") == "llm"
+
+        assert get_llm_cache() is None
+
+    def test_availability_probe_bypasses_the_cache(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A cached answer to the probe prompt does not hide a model that can no longer be reached."""
+        monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "llm.db"))
+        llm = FakeListChatModel(responses=["Hello"])
+        with patch.object(ai_provider, "_init_openai_llm", side_effect=lambda m: llm):
+            init_llm_by_provider("gpt-4o").invoke("Hi")
+
+            def _unreachable(*args, **kwargs):
+                raise RuntimeError("Authentication failed: invalid api key")
+
+            monkeypatch.setattr(FakeListChatModel, "_call", _unreachable)
+            available, error = validate_llm_availability("gpt-4o")
+
+        assert llm.invoke("Hi").content == "Hello"  # still answered from the cache
+        assert not available
+        assert error.startswith("Authentication failed")
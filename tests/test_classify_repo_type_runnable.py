@@ -0,0 +1,100 @@
+"""Tests for classify_repo_type_runnable module."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from src.dto.state_dto import RootRepoState
+from src.nodes.runnables.classify_repo_type_runnable import classify_repo_type_runnable
+
+
+def _classify(repo: Path) -> RootRepoState:
+    return classify_repo_type_runnable(
+        RootRepoState(repo_root_url="https://github.com/org/repo", local_path=str(repo))
+    )
+
+
+class TestClassifyRepoTypeRunnable:
+    """Test cases for the local repository classification."""
+
+    def test_single_manifest_is_single_purpose(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """A root manifest plus Dockerfile is a single-purpose repo."""
+        touch(tmp_path, "package.json")
+        touch(tmp_path, "Dockerfile")
+
+        state = _classify(tmp_path)
+
+        assert state.repo_type == "single-purpose-repo"
+        assert state.repo_type_evidence == "manifests=1 dockerfiles=1 dirs_with_hits=1"
+
+    def test_services_in_separate_directories_is_mono_repo(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Manifests and Dockerfiles spread over several top-level dirs is a mono-repo."""
+        for service in ("api", "web", "worker"):
+            touch(tmp_path, f"{service}/package.json")
+            touch(tmp_path, f"{service}/Dockerfile")
+
+        state = _classify(tmp_path)
+
+        assert state.repo_type == "mono-repo"
+        assert state.repo_type_evidence.startswith("manifests=")
+
+    def test_traversal_stops_once_mono_repo_is_certain(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Hits stop being counted as soon as the score reaches the mono-repo threshold."""
+        for i in range(20):
+            touch(tmp_path, f"service-{i}/package.json")
+            touch(tmp_path, f"service-{i}/Dockerfile")
+
+        state = _classify(tmp_path)
+
+        assert state.repo_type == "mono-repo"
+        manifests, dockerfiles, dirs = (int(part.split("=")[1]) for part in state.repo_type_evidence.split())
+        assert dirs <= 3
+        assert manifests + dockerfiles < 40
+
+    def test_nested_hits_are_attributed_to_top_level_directory(
+        self, tmp_path: Path, touch: Callable[..., None]
+    ) -> None:
+        """Files deeper in a tree count towards their top-level directory."""
+        touch(tmp_path, "services/a/pom.xml")
+        touch(tmp_path, "services/b/pom.xml")
+
+        state = _classify(tmp_path)
+
+        assert state.repo_type_evidence == "manifests=2 dockerfiles=0 dirs_with_hits=1"
+
+    def test_files_deeper_than_three_levels_are_ignored(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Manifests below depth 3 are not counted."""
+        touch(tmp_path, "a/b/c/go.mod")
+        touch(tmp_path, "a/b/c/d/go.mod")
+
+        state = _classify(tmp_path)
+
+        assert state.repo_type_evidence == "manifests=1 dockerfiles=0 dirs_with_hits=1"
+
+    def test_hidden_directories_are_ignored(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Hidden directories such as .git or .github are not scanned."""
+        touch(tmp_path, ".github/package.json")
+        touch(tmp_path, ".git/Dockerfile")
+
+        state = _classify(tmp_path)
+
+        assert state.repo_type_evidence == "manifests=0 dockerfiles=0 dirs_with_hits=0"
+
+    def test_dependency_directories_are_ignored(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Vendored manifests under node_modules or vendor are not counted."""
+        touch(tmp_path, "package.json")
+        touch(tmp_path, "node_modules/left-pad/package.json")
+        touch(tmp_path, "node_modules/react/package.json")
+        touch(tmp_path, "vendor/lib/go.mod")
+
+        state = _classify(tmp_path)
+
+        assert state.repo_type == "single-purpose-repo"
+        assert state.repo_type_evidence == "manifests=1 dockerfiles=0 dirs_with_hits=1"
+
+    def test_missing_local_path_raises(self) -> None:
+        """A state without local_path is rejected."""
+        with pytest.raises(ValueError, match="local_path is required"):
+            classify_repo_type_runnable(RootRepoState(repo_root_url="https://github.com/org/repo"))
@@ -0,0 +1,148 @@
+"""Tests for clone_repo_runnable module, specifically the commit-keyed clone cache."""
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.dto.state_dto import RootRepoState
+from src.nodes.runnables import clone_repo_runnable
+from src.nodes.runnables import delete_repo_runnable as delete_module
+from src.nodes.runnables.clone_repo_runnable import clone_repo_tool_runnable, is_cached_clone
+from src.nodes.runnables.delete_repo_runnable import delete_repo_runnable
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def origin(tmp_path: Path) -> Path:
+    """A local repository with a single commit, cloned via file:// URL."""
+    repo = tmp_path / "origin" / "svc"
+    repo.mkdir(parents=True)
+    _git(repo, "init", "-q")
+    (repo / "package.json").write_text("{}")
+    _git(repo, "add", ".")
+    _git(repo, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init")
+    return repo
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Enable the clone cache under a temporary directory."""
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("CLONE_CACHE_DIR", str(cache))
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    return cache
+
+
+class TestCloneCache:
+    """Test cases for reusing clones of an unchanged remote HEAD."""
+
+    def test_second_clone_of_same_commit_is_served_from_cache(self, origin: Path, cache_dir: Path) -> None:
+        """The second run reuses the cached clone without cloning again."""
+        url = f"file://{origin}"
+        first = clone_repo_tool_runnable(RootRepoState(repo_root_url=url)).local_path
+
+        with patch.object(clone_repo_runnable, "_clone") as clone:
+            second = clone_repo_tool_runnable(RootRepoState(repo_root_url=url)).local_path
+
+        clone.assert_not_called()
+        assert first == second
+        assert Path(first).parent.parent == cache_dir
+        assert Path(first).name == "svc"
+        assert (Path(first) / "package.json").exists()
+
+    def test_push_during_clone_files_entry_under_cloned_commit(self, origin: Path, cache_dir: Path) -> None:
+        """When the remote moves after ls-remote, the entry is named after the commit that was cloned."""
+        stale_sha = "0" * 40
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=origin, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+        with patch.object(clone_repo_runnable, "_remote_head_sha", return_value=stale_sha):
+            state = clone_repo_tool_runnable(RootRepoState(repo_root_url=f"file://{origin}"))
+
+        assert Path(state.local_path).parent.name.endswith(f"__{head}")
+        assert not any(entry.name.endswith(stale_sha) for entry in cache_dir.iterdir())
+
+    def test_delete_keeps_cached_clone(self, origin: Path, cache_dir: Path) -> None:
+        """delete_repo_runnable leaves cached clones in place."""
+        state = clone_repo_tool_runnable(RootRepoState(repo_root_url=f"file://{origin}"))
+
+        assert is_cached_clone(state.local_path)
+        delete_repo_runnable(state)
+        assert Path(state.local_path).exists()
+
+    def test_least_recently_used_clones_are_evicted(
+        self, origin: Path, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Only CLONE_CACHE_MAX_ENTRIES clones are kept."""
+        monkeypatch.setenv("CLONE_CACHE_MAX_ENTRIES", "1")
+        stale = cache_dir / "org__old__deadbeef"
+        (stale / "old" / ".git").mkdir(parents=True)
+        os.utime(stale, (0, 0))
+
+        state = clone_repo_tool_runnable(RootRepoState(repo_root_url=f"file://{origin}"))
+
+        assert not stale.exists()
+        assert Path(state.local_path).exists()
+
+    def test_recently_used_clones_are_not_evicted(
+        self, origin: Path, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A clone used within CLONE_CACHE_MIN_AGE_SECONDS may be in use by another run and is kept."""
+        monkeypatch.setenv("CLONE_CACHE_MAX_ENTRIES", "1")
+        in_use = cache_dir / "org__busy__deadbeef"
+        (in_use / "busy" / ".git").mkdir(parents=True)
+
+        clone_repo_tool_runnable(RootRepoState(repo_root_url=f"file://{origin}"))
+
+        assert in_use.exists()
+
+    def test_cache_disabled_without_env(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Without CLONE_CACHE_DIR no path counts as a cached clone."""
+        monkeypatch.delenv("CLONE_CACHE_DIR", raising=False)
+
+        assert not is_cached_clone(str(tmp_path / "anything"))
+
+
+class TestUncachedClone:
+    """Test cases for clones made without the cache."""
+
+    def test_each_run_gets_its_own_directory(
+        self, origin: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Two runs on the same repository clone into distinct temp directories, named after the repository."""
+        monkeypatch.delenv("CLONE_CACHE_DIR", raising=False)
+        monkeypatch.setenv("GITHUB_TOKEN", "token")
+        monkeypatch.setattr(clone_repo_runnable.tempfile, "tempdir", str(tmp_path))
+        url = origin.as_uri()
+
+        first = clone_repo_tool_runnable(RootRepoState(repo_root_url=url)).local_path
+        second = clone_repo_tool_runnable(RootRepoState(repo_root_url=url)).local_path
+
+        assert first != second
+        assert Path(first).name == Path(second).name == "svc"
+        assert (Path(first) / "package.json").exists()
+        assert (Path(second) / "package.json").exists()
+
+    def test_delete_removes_the_run_directory(
+        self, origin: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Deleting an uncached clone also removes the temp directory that holds it."""
+        monkeypatch.delenv("CLONE_CACHE_DIR", raising=False)
+        monkeypatch.setenv("GITHUB_TOKEN", "token")
+        work_root = tmp_path / "work"
+        work_root.mkdir()
+        monkeypatch.setattr(clone_repo_runnable.tempfile, "tempdir", str(work_root))
+
+        state = clone_repo_tool_runnable(RootRepoState(repo_root_url=origin.as_uri()))
+        delete_repo_runnable(state)
+        delete_module._wait_for_pending_deletions()
+
+        assert list(work_root.iterdir()) == []
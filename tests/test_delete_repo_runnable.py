@@ -0,0 +1,31 @@
+"""Tests for delete_repo_runnable module."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.dto.state_dto import RootRepoState
+from src.nodes.runnables import delete_repo_runnable as delete_module
+from src.nodes.runnables.delete_repo_runnable import delete_repo_runnable
+
+
+class TestDeleteRepoRunnable:
+    """Test cases for the background clone deletion."""
+
+    def test_clone_path_is_freed_immediately_and_deleted(self, tmp_path: Path) -> None:
+        """The clone path is gone on return and the moved-aside copy is removed."""
+        clone = tmp_path / "repo"
+        (clone / ".git" / "objects").mkdir(parents=True)
+        (clone / "README.md").write_text("x")
+
+        delete_repo_runnable(RootRepoState(repo_root_url="https://github.com/o/repo", local_path=str(clone)))
+
+        assert not clone.exists()
+        delete_module._wait_for_pending_deletions()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_missing_path_raises(self, tmp_path: Path) -> None:
+        """Deleting a path that does not exist still surfaces an error."""
+        with pytest.raises(FileNotFoundError):
+            delete_repo_runnable(RootRepoState(repo_root_url="https://github.com/o/repo", local_path=str(tmp_path / "nope")))
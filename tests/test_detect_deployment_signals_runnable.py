@@ -0,0 +1,200 @@
+"""Tests for detect_deployment_signals_runnable module."""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Callable
+from unittest.mock import patch
+
+import pytest
+
+from src.dto.state_dto import RootRepoState
+from src.nodes.runnables import detect_deployment_signals_runnable as runnable_module
+from src.nodes.runnables.detect_deployment_signals_runnable import (
+    DeploymentSignal,
+    _classify_signal_strength_by_combination,
+    _glob_to_regex,
+    deployment_signals_detection_runnable,
+    detect_deployment_signals,
+)
+
+
+def _found(repo: Path) -> set[tuple[str, str]]:
+    return {(s.signal_type, s.file_path) for s in detect_deployment_signals(repo)}
+
+
+class TestGlobToRegex:
+    """Test cases for the glob translation used by the pattern tables."""
+
+    def test_leading_double_star_matches_any_depth(self) -> None:
+        """'**/' matches zero or more leading directories."""
+        regex = _glob_to_regex("**/.github/workflows/*.yml")
+
+        assert regex.fullmatch(".github/workflows/ci.yml")
+        assert regex.fullmatch("svc/.github/workflows/ci.yml")
+        assert not regex.fullmatch(".github/workflows/nested/ci.yml")
+
+    def test_trailing_double_star_matches_directory_and_descendants(self) -> None:
+        """A trailing '**' matches the directory itself and everything below it."""
+        regex = _glob_to_regex("**/charts/**")
+
+        assert regex.fullmatch("charts")
+        assert regex.fullmatch("deploy/charts/app/Chart.yaml")
+        assert not regex.fullmatch("mycharts/values.yaml")
+
+
+class TestDetectDeploymentSignals:
+    """Test cases for signal detection over a single repository walk."""
+
+    def test_basename_suffix_and_path_patterns(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Exact names, '*.ext' and directory-scoped patterns are all detected."""
+        touch(tmp_path, "svc/pom.xml")
+        touch(tmp_path, "infra/main.tf")
+        touch(tmp_path, "k8s/base/api.yaml")
+        touch(tmp_path, ".github/workflows/ci.yml")
+
+        found = _found(tmp_path)
+
+        assert ("java", "svc/pom.xml") in found
+        assert ("terraform", "infra/main.tf") in found
+        assert ("deployment_manifests", "k8s/base/api.yaml") in found
+        assert ("github_actions", ".github/workflows/ci.yml") in found
+
+    def test_excluded_directories_are_skipped(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Files under node_modules or .git never produce signals."""
+        touch(tmp_path, "node_modules/pkg/package.json")
+        touch(tmp_path, ".git/hooks/Dockerfile")
+
+        assert _found(tmp_path) == set()
+
+    def test_overlapping_patterns_each_report(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """A file matched by several patterns is reported once per pattern."""
+        touch(tmp_path, "Procfile")
+
+        assert _found(tmp_path) == {("buildpacks", "Procfile"), ("heroku", "Procfile")}
+
+    def test_same_signal_type_is_reported_once_per_file(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Several patterns of one signal type matching a file yield a single signal."""
+        touch(tmp_path, "charts/app/Chart.yaml")
+
+        signals = [s for s in detect_deployment_signals(tmp_path) if s.file_path == "charts/app/Chart.yaml"]
+
+        assert [(s.signal_type, s.description) for s in signals] == [("helm", "Helm Chart")]
+
+    def test_content_scans_use_walked_files(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """CI deployment steps and compose build contexts are found from the same walk."""
+        touch(tmp_path, ".github/workflows/deploy.yml", "steps:\n  - run: kubectl apply -f k8s/\n")
+        touch(tmp_path, "docker-compose-dev.yml", "services:\n  api:\n    build: .\n")
+
+        found = _found(tmp_path)
+
+        assert ("deployment_step", ".github/workflows/deploy.yml") in found
+        assert ("local_build", "docker-compose-dev.yml") in found
+
+    def test_oversized_files_are_skipped(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Files above the size limit are dropped by the walk, including from content scans."""
+        touch(tmp_path, ".github/workflows/deploy.yml", "kubectl apply\n" + "#" * (1024 * 1024))
+
+        assert _found(tmp_path) == set()
+
+    def test_repository_under_excluded_name_is_still_scanned(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Only directories inside the repository are excluded, not the clone location itself."""
+        repo = tmp_path / "build" / "repo"
+        touch(repo, "Dockerfile")
+
+        assert _found(repo) == {("docker", "Dockerfile")}
+
+
+def _signal(category: str) -> DeploymentSignal:
+    return DeploymentSignal(category=category, signal_type="t", file_path="f", description="d", strength="weak")
+
+
+class TestClassifySignalStrengthByCombination:
+    """Test cases for strength assignment from the package manager / CI/CD / way-to-run combination."""
+
+    def test_all_three_components_are_strong(self) -> None:
+        """With every component present, combination categories are strong and the rest medium."""
+        signals = [_signal("package_manager"), _signal("ci_cd"), _signal("kubernetes"), _signal("infrastructure")]
+
+        strengths = [s.strength for s in _classify_signal_strength_by_combination(signals)]
+
+        assert strengths == ["strong", "strong", "strong", "medium"]
+
+    def test_two_components_are_medium(self) -> None:
+        """With two components, combination categories are medium and the rest weak."""
+        signals = [_signal("package_manager"), _signal("serverless"), _signal("infrastructure")]
+
+        strengths = [s.strength for s in _classify_signal_strength_by_combination(signals)]
+
+        assert strengths == ["medium", "medium", "weak"]
+
+    def test_single_component_is_weak(self) -> None:
+        """A lone component leaves everything weak, even previously medium content signals."""
+        signals = [_signal("ci_cd")]
+        signals[0].strength = "medium"
+
+        assert _classify_signal_strength_by_combination(signals)[0].strength == "weak"
+
+    def test_no_signals(self) -> None:
+        """An empty list is returned unchanged."""
+        assert _classify_signal_strength_by_combination([]) == []
+
+
+class TestDeploymentAnalysisCache:
+    """Test cases for the commit-keyed deployment analysis cache."""
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path, touch: Callable[..., None]) -> Path:
+        """A committed repository with all three deployment components."""
+        repo = tmp_path / "repo"
+        touch(repo, "package.json")
+        touch(repo, "Dockerfile")
+        touch(repo, ".github/workflows/ci.yml")
+        subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+        subprocess.run(["git", "add", "."], cwd=repo, check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init"], cwd=repo, check=True
+        )
+        return repo
+
+    def _run(self, repo: Path) -> RootRepoState:
+        return deployment_signals_detection_runnable(
+            RootRepoState(repo_root_url="https://github.com/org/repo", local_path=str(repo))
+        )
+
+    def test_second_run_on_same_commit_is_served_from_cache(
+        self, repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The stored result is returned without walking the repository again."""
+        monkeypatch.setenv("DEPLOYMENT_CACHE_PATH", str(tmp_path / "deployment.sqlite"))
+        first = self._run(repo)
+
+        with patch.object(runnable_module, "detect_deployment_signals") as detect:
+            second = self._run(repo)
+
+        detect.assert_not_called()
+        assert second.deployable is first.deployable is True
+        assert second.deployable_signal_files == first.deployable_signal_files
+
+    def test_cache_directory_is_created(self, repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A cache path under directories that do not exist yet, like the documented default, still caches."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setenv("DEPLOYMENT_CACHE_PATH", "~/.cache/sbs-ai-discovery/deployment.sqlite")
+        self._run(repo)
+
+        with patch.object(runnable_module, "detect_deployment_signals") as detect:
+            assert self._run(repo).deployable is True
+
+        detect.assert_not_called()
+        assert (tmp_path / "home" / ".cache" / "sbs-ai-discovery" / "deployment.sqlite").exists()
+
+    def test_cache_disabled_without_env(self, repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without DEPLOYMENT_CACHE_PATH every run analyzes the repository."""
+        monkeypatch.delenv("DEPLOYMENT_CACHE_PATH", raising=False)
+
+        with patch.object(runnable_module, "detect_deployment_signals", return_value=[]) as detect:
+            with patch.object(runnable_module, "has_service_deployment_workflow_llm", return_value=False):
+                self._run(repo)
+                self._run(repo)
+
+        assert detect.call_count == 2
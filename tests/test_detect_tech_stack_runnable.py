@@ -0,0 +1,75 @@
+"""Tests for detect_tech_stack_runnable module."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.dto.state_dto import Owner, RootRepoState, SelfBuiltComponent
+from src.nodes.runnables import detect_tech_stack_runnable as runnable_module
+from src.nodes.runnables.detect_tech_stack_runnable import _find_package_manager_files, detect_tech_stack_runnable
+
+
+def _component(path: str) -> SelfBuiltComponent:
+    return SelfBuiltComponent(
+        name=path, path=path, display_url=f"https://github.com/org/repo/tree/main/{path}",
+        owner=Owner(), evidence="", confidence="high",
+    )
+
+
+class TestFindPackageManagerFiles:
+    """Test cases for _find_package_manager_files."""
+
+    def test_files_follow_package_manager_order(self, tmp_path: Path) -> None:
+        """Matches come back in PACKAGE_MANAGER_FILES order, not directory order."""
+        for name in ("go.mod", "package.json", "pom.xml", "README.md"):
+            (tmp_path / name).write_text("")
+
+        found = _find_package_manager_files(tmp_path)
+
+        assert [p.name for p in found] == ["pom.xml", "package.json", "go.mod"]
+
+    def test_only_direct_children_are_considered(self, tmp_path: Path) -> None:
+        """Manifests in subdirectories and directories named like manifests are ignored."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "pom.xml").write_text("")
+        (tmp_path / "package.json").mkdir()
+
+        assert _find_package_manager_files(tmp_path) == []
+
+    def test_non_directory_component_path_yields_nothing(self, tmp_path: Path) -> None:
+        """A component path pointing at a file does not raise."""
+        target = tmp_path / "pom.xml"
+        target.write_text("")
+
+        assert _find_package_manager_files(target) == []
+
+
+class TestDetectTechStackRunnable:
+    """Test cases for detect_tech_stack_runnable."""
+
+    def test_all_components_share_one_batch(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Files of every component go through a single batch and results land on their own component."""
+        (tmp_path / "api").mkdir()
+        (tmp_path / "api" / "pom.xml").write_text("spring")
+        (tmp_path / "web").mkdir()
+        (tmp_path / "web" / "package.json").write_text("react")
+        batches = []
+
+        def fake_batch(contents, model_name=None):
+            batches.append(list(contents))
+            return [{"tech_stacks": [{"name": c, "version": "1", "confidence": "high", "evidence": ["e"]}]} for c in contents]
+
+        monkeypatch.setattr(runnable_module, "tech_stack_agent_batch", fake_batch)
+        state = RootRepoState(
+            repo_root_url="https://github.com/org/repo",
+            local_path=str(tmp_path),
+            self_built_software=[_component("api"), _component("web"), _component("missing")],
+        )
+
+        detect_tech_stack_runnable(state, {})
+
+        assert batches == [["spring", "react"]]
+        assert [s.name for s in state.self_built_software[0].tech_stacks] == ["spring"]
+        assert [s.name for s in state.self_built_software[1].tech_stacks] == ["react"]
+        assert state.self_built_software[2].tech_stacks == []
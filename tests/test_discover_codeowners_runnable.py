@@ -0,0 +1,110 @@
+"""Tests for discover_codeowners_runnable module."""
+from __future__ import annotations
+
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.nodes.runnables import discover_codeowners_runnable as runnable_module
+from src.nodes.runnables.discover_codeowners_runnable import (
+    _fetch_raw_content,
+    discover_codeowners_runnable,
+    get_gh_repo_object,
+)
+from src.tools import github_client
+
+
+@pytest.fixture(autouse=True)
+def github_env(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Provide a token, keep tests off the network and start with empty client caches."""
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    monkeypatch.setattr(runnable_module, "_fetch_raw_content", lambda token, repo_full_name, path: None)
+    github_client._client_for_token.cache_clear()
+    runnable_module._get_gh_repo.cache_clear()
+    runnable_module._get_raw_session.cache_clear()
+    yield
+    github_client._client_for_token.cache_clear()
+
+
+def _repo_with_files(files: dict[str, str]) -> MagicMock:
+    """Repository stand-in whose get_contents only knows the given paths."""
+    def get_contents(path: str) -> MagicMock:
+        if path not in files:
+            raise FileNotFoundError(path)
+        return MagicMock(decoded_content=files[path].encode())
+
+    repo = MagicMock()
+    repo.get_contents.side_effect = get_contents
+    return repo
+
+
+class TestDiscoverCodeownersRunnable:
+    """Test cases for discover_codeowners_runnable."""
+
+    def test_github_directory_takes_precedence(self) -> None:
+        """Like GitHub, .github/CODEOWNERS wins over the root file, which wins over docs/."""
+        files = {".github/CODEOWNERS": "* @github", "CODEOWNERS": "* @root", "docs/CODEOWNERS": "* @docs"}
+        with patch.object(runnable_module, "get_gh_repo_object", return_value=_repo_with_files(files)):
+            assert discover_codeowners_runnable("https://github.com/org/repo") == "* @github"
+
+        del files[".github/CODEOWNERS"]
+        with patch.object(runnable_module, "get_gh_repo_object", return_value=_repo_with_files(files)):
+            assert discover_codeowners_runnable("https://github.com/org/repo") == "* @root"
+
+    def test_later_location_is_found(self) -> None:
+        """A CODEOWNERS file only under docs/ is still returned."""
+        repo = _repo_with_files({"docs/CODEOWNERS": "* @docs"})
+        with patch.object(runnable_module, "get_gh_repo_object", return_value=repo):
+            assert discover_codeowners_runnable("https://github.com/org/repo") == "* @docs"
+
+    def test_missing_file(self) -> None:
+        """No CODEOWNERS anywhere yields the not-found message."""
+        with patch.object(runnable_module, "get_gh_repo_object", return_value=_repo_with_files({})):
+            assert discover_codeowners_runnable("https://github.com/org/repo") == "CODEOWNERS file not found."
+
+    def test_raw_content_skips_the_api(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A file served by raw.githubusercontent.com is returned without a repository lookup."""
+        raw_files = {".github/CODEOWNERS": "* @raw"}
+        monkeypatch.setattr(
+            runnable_module, "_fetch_raw_content", lambda token, repo_full_name, path: raw_files.get(path)
+        )
+        with patch.object(runnable_module, "get_gh_repo_object") as get_repo:
+            assert discover_codeowners_runnable("https://github.com/org/repo") == "* @raw"
+        get_repo.assert_not_called()
+
+
+class TestFetchRawContent:
+    """Test cases for the raw.githubusercontent.com request."""
+
+    def test_url_and_auth_header(self) -> None:
+        """The file is requested at HEAD with the token attached to the session."""
+        with patch.object(runnable_module.requests.Session, "get") as get:
+            get.return_value = MagicMock(status_code=200, text="* @team")
+            content = _fetch_raw_content("token", "org/repo", ".github/CODEOWNERS")
+
+        assert content == "* @team"
+        assert get.call_args.args[0] == "https://raw.githubusercontent.com/org/repo/HEAD/.github/CODEOWNERS"
+        assert runnable_module._get_raw_session("token").headers["Authorization"] == "token token"
+
+
+class TestGetGhRepoObject:
+    """Test cases for the cached GitHub client and repository lookup."""
+
+    def test_client_and_repo_are_reused(self) -> None:
+        """Repeated lookups share the tools' GitHub client and fetch each repository once."""
+        with patch.object(github_client, "Github") as github:
+            first = get_gh_repo_object("org/a")
+            second = get_gh_repo_object("org/a")
+            get_gh_repo_object("org/b")
+
+        assert first is second
+        github.assert_called_once()
+        assert github.return_value.get_repo.call_count == 2
+
+    def test_missing_token(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without a token an error string is returned."""
+        monkeypatch.delenv("GITHUB_TOKEN")
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+
+        assert get_gh_repo_object("org/a") == "Error: GITHUB_TOKEN not set."
@@ -0,0 +1,92 @@
+"""Tests for discover_individual_contributors_runnable module."""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.nodes.runnables import discover_individual_contributors_runnable as runnable_module
+from src.nodes.runnables.discover_individual_contributors_runnable import (
+    _parse_shortlog_line,
+    discover_individual_contributors_runnable,
+)
+
+
+def _commit(repo: Path, relative: str, author: str) -> None:
+    path = repo / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(relative + author)
+    subprocess.run(["git", "add", "."], cwd=repo, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=x", "-c", "user.email=x@x", "commit", "-q", "--author", author, "-m", "c"],
+        cwd=repo,
+        check=True,
+    )
+
+
+class TestParseShortlogLine:
+    """Test cases for parsing `git shortlog -sne` lines."""
+
+    def test_regular_line(self) -> None:
+        """Commit count, name and email are extracted."""
+        assert _parse_shortlog_line("    42\tJane Doe <jane@example.com>") == {
+            "name": "Jane Doe", "email": "jane@example.com", "commits": 42
+        }
+
+    def test_bot_accounts_are_skipped(self) -> None:
+        """Automation accounts such as Renovate are not reported."""
+        assert _parse_shortlog_line("     7\tRenovate Bot <bot@renovateapp.com>") is None
+
+    def test_malformed_lines_are_ignored(self) -> None:
+        """Lines without a count or an email yield None."""
+        assert _parse_shortlog_line("") is None
+        assert _parse_shortlog_line("    3\tNo Email") is None
+        assert _parse_shortlog_line("abc\tName <a@b>") is None
+
+
+class TestDiscoverIndividualContributorsRunnable:
+    """Test cases for contributor discovery on a local repository."""
+
+    def test_contributors_of_service_path(self, tmp_path: Path) -> None:
+        """Only authors of commits touching the service path are returned, busiest first."""
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        _commit(tmp_path, "api/a.py", "Ann <ann@x.io>")
+        _commit(tmp_path, "api/b.py", "Ann <ann@x.io>")
+        _commit(tmp_path, "api/c.py", "Bob <bob@x.io>")
+        _commit(tmp_path, "web/d.py", "Cid <cid@x.io>")
+
+        contributors = discover_individual_contributors_runnable(str(tmp_path), "api", "api")
+
+        assert contributors == [
+            {"name": "Ann", "email": "ann@x.io", "commits": 2},
+            {"name": "Bob", "email": "bob@x.io", "commits": 1},
+        ]
+
+    def test_merge_commits_are_not_counted(self, tmp_path: Path) -> None:
+        """Whoever only merged branches is not reported as a contributor."""
+        subprocess.run(["git", "init", "-q", "-b", "main"], cwd=tmp_path, check=True)
+        _commit(tmp_path, "api/a.py", "Ann <ann@x.io>")
+        subprocess.run(["git", "checkout", "-q", "-b", "feature"], cwd=tmp_path, check=True)
+        _commit(tmp_path, "api/b.py", "Bob <bob@x.io>")
+        subprocess.run(["git", "checkout", "-q", "main"], cwd=tmp_path, check=True)
+        _commit(tmp_path, "api/c.py", "Ann <ann@x.io>")
+        subprocess.run(
+            ["git", "-c", "user.name=Merger", "-c", "user.email=m@x.io", "merge", "-q", "--no-ff", "-m", "merge", "feature"],
+            cwd=tmp_path,
+            check=True,
+        )
+
+        contributors = discover_individual_contributors_runnable(str(tmp_path), "api", "api")
+
+        assert [c["name"] for c in contributors] == ["Ann", "Bob"]
+
+    def test_timeout_kills_git(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A shortlog running past the timeout is killed and reported as an error."""
+        monkeypatch.setattr(runnable_module, "SHORTLOG_TIMEOUT_SECONDS", 0.1)
+        # A command that outlives the timeout stands in for a slow shortlog
+        popen = subprocess.Popen
+        monkeypatch.setattr(subprocess, "Popen", lambda command, **kwargs: popen(["sleep", "5"], **kwargs))
+
+        with pytest.raises(Exception, match="timed out"):
+            discover_individual_contributors_runnable(str(tmp_path), "api", "api")
@@ -0,0 +1,109 @@
+"""Tests for discover_services_tool module."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.tools import discover_services_tool as tool_module
+from src.tools import github_client, github_tree
+from src.tools.classify_repo_type_tool import classify_repo_type_tool
+from src.tools.discover_services_tool import discover_services_tool
+
+URL = "https://github.com/acme/shop"
+
+
+@pytest.fixture
+def github(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """A fake GitHub whose only repository serves `state.paths` as blobs on its default branch."""
+    state = SimpleNamespace(paths=[], trees=[], tree_fetches=[])
+
+    def get_git_tree(sha: str, recursive: bool) -> SimpleNamespace:
+        state.tree_fetches.append(sha)
+        entries = [SimpleNamespace(path=p, type="blob", size=1) for p in state.paths]
+        entries += [SimpleNamespace(path=p, type="tree", size=None) for p in state.trees]
+        return SimpleNamespace(tree=entries)
+
+    repo = SimpleNamespace(
+        default_branch="main",
+        get_git_tree=get_git_tree,
+        get_branch=lambda name: SimpleNamespace(commit=SimpleNamespace(sha="a" * 40)),
+    )
+    client = SimpleNamespace(get_repo=lambda full_name, lazy=False: repo)
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    monkeypatch.setattr(tool_module, "_CURRENT", {"repo_full_name": "", "head_sha": ""})
+    monkeypatch.setattr(github_client, "Github", lambda auth, per_page: client)
+    github_client._client_for_token.cache_clear()
+    github_tree.get_tree_entries.cache_clear()
+    yield state
+    github_tree.get_tree_entries.cache_clear()
+    github_client._client_for_token.cache_clear()
+
+
+class TestDiscoverServicesTool:
+    """Test cases for the manifest + Dockerfile service heuristic."""
+
+    def test_folders_with_manifest_and_dockerfile(self, github: SimpleNamespace) -> None:
+        """Only folders holding both a build manifest and a Dockerfile are services."""
+        github.paths = [
+            "Dockerfile",
+            "go.mod",
+            "services/api/Dockerfile",
+            "services/api/package.json",
+            "services/api/src/index.ts",
+            "services/web/package.json",
+            "tools/dockerfile",
+            "tools/pom.xml",
+        ]
+        github.trees = ["services/api/Dockerfile.d"]
+
+        services = discover_services_tool.invoke({"repo_root_url": URL})
+
+        assert services == [
+            {"name": "shop", "path": ""},
+            {"name": "api", "path": "services/api"},
+            {"name": "tools", "path": "tools"},
+        ]
+        assert tool_module._CURRENT == {"repo_full_name": "acme/shop", "head_sha": "a" * 40}
+
+    def test_manifest_in_other_folder_does_not_count(self, github: SimpleNamespace) -> None:
+        """A Dockerfile next to a manifest of a nested folder is not a service."""
+        github.paths = ["deploy/Dockerfile", "deploy/app/package.json"]
+
+        assert discover_services_tool.invoke({"repo_root_url": URL}) == []
+
+    def test_tree_is_shared_with_classify_repo_type(self, github: SimpleNamespace) -> None:
+        """Classifying and then discovering the same commit lists the tree once."""
+        github.paths = ["api/Dockerfile", "api/go.mod", "web/Dockerfile", "web/package.json"]
+
+        classification = classify_repo_type_tool.invoke({"repo_root_url": URL})
+        services = discover_services_tool.invoke({"repo_root_url": URL})
+
+        assert classification["repo_type"] == "mono-repo"
+        assert [service["path"] for service in services] == ["api", "web"]
+        assert github.tree_fetches == ["a" * 40]
+
+
+class TestGithubClient:
+    """Test cases for the shared GitHub client."""
+
+    def test_client_is_reused_per_token(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Tool calls with the same token share one client; a new token gets its own."""
+        monkeypatch.setattr(github_client, "Github", lambda auth, per_page: object())
+        github_client._client_for_token.cache_clear()
+        monkeypatch.setenv("GITHUB_TOKEN", "one")
+
+        first = github_client.github_client()
+        assert github_client.github_client() is first
+        monkeypatch.setenv("GITHUB_TOKEN", "two")
+        assert github_client.github_client() is not first
+        github_client._client_for_token.cache_clear()
+
+    def test_missing_token(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without a token the tools report it instead of calling GitHub anonymously."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+
+        with pytest.raises(RuntimeError, match="GITHUB_TOKEN"):
+            github_client.github_client()
+        assert classify_repo_type_tool.invoke({"repo_root_url": URL}) == "Error: GITHUB_TOKEN not set."
@@ -0,0 +1,137 @@
+"""Tests for get_languages_and_package_manager_runnable module."""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from src.nodes.runnables import get_languages_and_package_manager_runnable as runnable_module
+from src.nodes.runnables.get_languages_and_package_manager_runnable import get_languages_and_package_manager_runnable
+
+
+def _languages(repo: Path, service_path: str = "") -> dict:
+    result = get_languages_and_package_manager_runnable(str(repo), "svc", service_path)
+    return {language["name"]: language for language in result["languages"]}
+
+
+class TestGetLanguagesAndPackageManagerRunnable:
+    """Test cases for the per-service language and manifest discovery."""
+
+    def test_source_files_are_counted_per_language(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Files at any depth count towards the language of their extension."""
+        touch(tmp_path, "src/main/App.kt")
+        touch(tmp_path, "build.gradle.kts")
+        touch(tmp_path, "src/main/Util.java")
+        touch(tmp_path, "src/main/deep/Other.java")
+
+        languages = _languages(tmp_path)
+
+        assert languages["Kotlin"]["total_files"] == 2
+        assert languages["Java"]["total_files"] == 2
+        assert "Python" not in languages
+
+    def test_hidden_and_dependency_directories_are_skipped(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Sources under hidden, node_modules or build output directories are not counted."""
+        touch(tmp_path, "index.ts")
+        touch(tmp_path, ".github/scripts/release.js")
+        touch(tmp_path, "node_modules/lib/index.js")
+        touch(tmp_path, "dist/bundle.js")
+
+        languages = _languages(tmp_path)
+
+        assert languages["TypeScript"]["total_files"] == 1
+        assert "Javascript" not in languages
+
+    def test_manifests_are_read_from_the_service_root(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Exact and wildcard manifest names are matched only directly inside the service."""
+        touch(tmp_path, "svc/Program.cs")
+        touch(tmp_path, "svc/App.csproj", "<Project />")
+        touch(tmp_path, "svc/sub/Other.csproj", "<Project />")
+
+        languages = _languages(tmp_path, "svc")
+
+        assert languages["C#"]["packages_content"] == [{"file_name": "App.csproj", "content": "<Project />"}]
+
+    def test_shared_manifest_is_read_once(
+        self, tmp_path: Path, touch: Callable[..., None], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A manifest used by several languages is read a single time and reported for each."""
+        touch(tmp_path, "App.kt")
+        touch(tmp_path, "Util.java")
+        touch(tmp_path, "build.gradle", "plugins {}")
+        reads = []
+
+        def counting_open(path, *args, **kwargs):
+            reads.append(Path(path).name)
+            return open(path, *args, **kwargs)
+
+        monkeypatch.setattr(runnable_module, "open", counting_open, raising=False)
+        languages = _languages(tmp_path)
+
+        assert reads == ["build.gradle"]
+        for name in ("Kotlin", "Java"):
+            assert {"file_name": "build.gradle", "content": "plugins {}"} in languages[name]["packages_content"]
+
+    def test_languages_only_carry_their_own_manifests(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Manifests of one language are not attached to the others."""
+        touch(tmp_path, "main.go")
+        touch(tmp_path, "go.mod", "module x")
+        touch(tmp_path, "lib.rs")
+        touch(tmp_path, "Cargo.toml", "[package]")
+
+        languages = _languages(tmp_path)
+
+        assert [f["file_name"] for f in languages["Go"]["packages_content"]] == ["go.mod"]
+        assert [f["file_name"] for f in languages["Rust"]["packages_content"]] == ["Cargo.toml"]
+
+    def test_undecodable_manifest_does_not_fail(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Invalid UTF-8 in a manifest is replaced instead of raising."""
+        touch(tmp_path, "main.go")
+        (tmp_path / "go.mod").write_bytes(b"module x\xff\n")
+
+        languages = _languages(tmp_path)
+
+        assert languages["Go"]["packages_content"][0]["content"].startswith("module x")
+
+    def test_large_manifest_keeps_head_and_tail(
+        self, tmp_path: Path, touch: Callable[..., None], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Manifests above the size cap are truncated in the middle."""
+        monkeypatch.setattr(runnable_module, "MANIFEST_MAX_BYTES", 8)
+        touch(tmp_path, "index.ts")
+        touch(tmp_path, "yarn.lock", "HEAD" + "x" * 100 + "TAIL")
+
+        content = _languages(tmp_path)["TypeScript"]["packages_content"][0]["content"]
+
+        assert content == "HEAD\n... [100 bytes truncated] ...\nTAIL"
+
+    def test_git_repository_counts_only_tracked_files(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """In a work tree the index is used: untracked and ignored files are not counted."""
+        touch(tmp_path, "svc/main.py")
+        touch(tmp_path, "svc/pkg/util.py")
+        touch(tmp_path, "svc/requirements.txt", "requests")
+        touch(tmp_path, "svc/.venv-tools/lib/site.py")
+        touch(tmp_path, "svc/.gitignore", "generated/\n")
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+        touch(tmp_path, "svc/scratch.py")
+        touch(tmp_path, "svc/generated/out.py")
+
+        languages = _languages(tmp_path, "svc")
+
+        assert languages["Python"]["total_files"] == 2
+        assert languages["Python"]["packages_content"] == [{"file_name": "requirements.txt", "content": "requests"}]
+
+    def test_missing_service_path(self, tmp_path: Path) -> None:
+        """A service path that does not exist yields manifests without languages."""
+        result = get_languages_and_package_manager_runnable(str(tmp_path), "svc", "missing")
+
+        assert result == {"local_path": str(tmp_path), "service_name": "svc", "languages": []}
+
+    def test_missing_local_path(self) -> None:
+        """Without a clone there is nothing to scan, and the result keeps its shape."""
+        result = get_languages_and_package_manager_runnable("", "svc", "")
+
+        assert result == {"local_path": "", "service_name": "svc", "languages": []}
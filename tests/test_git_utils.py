@@ -0,0 +1,51 @@
+"""Tests for git_utils module."""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.utils.git_utils import read_head_commit
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A repository with a single commit on main."""
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=tmp_path, check=True)
+    (tmp_path / "a.txt").write_text("a")
+    subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+    subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "c"], cwd=tmp_path, check=True)
+    return tmp_path
+
+
+def _rev_parse(repo: Path) -> str:
+    return subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+class TestReadHeadCommit:
+    """Test cases for resolving HEAD without a git process."""
+
+    def test_loose_ref(self, repo: Path) -> None:
+        """A branch stored as a loose ref resolves to its commit."""
+        assert read_head_commit(str(repo)) == _rev_parse(repo)
+
+    def test_packed_ref(self, repo: Path) -> None:
+        """A branch only present in packed-refs, as after a fresh clone, resolves too."""
+        subprocess.run(["git", "pack-refs", "--all"], cwd=repo, check=True)
+        assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+
+        assert read_head_commit(str(repo)) == _rev_parse(repo)
+
+    def test_detached_head(self, repo: Path) -> None:
+        """A detached HEAD holds the commit itself."""
+        subprocess.run(["git", "checkout", "-q", "--detach"], cwd=repo, check=True)
+
+        assert read_head_commit(str(repo)) == _rev_parse(repo)
+
+    def test_unborn_branch_and_missing_repo(self, tmp_path: Path) -> None:
+        """Without a commit, or without a repository, there is nothing to resolve."""
+        assert read_head_commit(str(tmp_path)) is None
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+
+        assert read_head_commit(str(tmp_path)) is None
@@ -0,0 +1,51 @@
+"""Tests for individual_contributors_service_agent module."""
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from src.dto.state_dto import Owner, RootRepoState, SelfBuiltComponent
+from src.nodes.agents import individual_contributors_service_agent as agent_module
+from src.nodes.agents.individual_contributors_service_agent import individual_contributors_service_agent
+
+
+def _component(name: str) -> SelfBuiltComponent:
+    return SelfBuiltComponent(
+        name=name, path=name, display_url="", owner=Owner(), evidence="", confidence="high"
+    )
+
+
+def _echo_llm(prompt) -> AIMessage:
+    """LLM stand-in that returns the single contributor named in the prompt."""
+    text = prompt.to_string()
+    name = next(n for n in ("Ann", "Bob") if n in text)
+    return AIMessage(content=json.dumps({"individuals": [{"name": name, "emails": [], "commits": 1}]}))
+
+
+class TestIndividualContributorsServiceAgent:
+    """Test cases for the per-service contributor agent."""
+
+    def test_discoveries_overlap_and_results_match_services(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Shortlogs for all services run concurrently and each answer lands on its own service."""
+        monkeypatch.setattr(agent_module, "init_llm_by_provider", lambda model_name=None: RunnableLambda(_echo_llm))
+        # Each discovery waits for the other, which only succeeds if both run at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _discover(local_path: str, service_name: str, service_path: str) -> list:
+            barrier.wait()
+            author = {"api": "Ann", "web": "Bob"}[service_name]
+            return [{"name": author, "email": f"{author.lower()}@x.io", "commits": 1}]
+
+        monkeypatch.setattr(agent_module, "discover_individual_contributors_runnable", _discover)
+        state = RootRepoState(
+            repo_root_url="https://github.com/o/repo", local_path="/tmp/repo",
+            self_built_software=[_component("api"), _component("web")],
+        )
+
+        individual_contributors_service_agent(state, {})
+
+        assert [c.owner.individuals[0].name for c in state.self_built_software] == ["Ann", "Bob"]
@@ -0,0 +1,57 @@
+"""Tests for languages_service_agent module."""
+from __future__ import annotations
+
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from src.dto.state_dto import Owner, RootRepoState, SelfBuiltComponent
+from src.nodes.agents import languages_service_agent as agent_module
+from src.nodes.agents.languages_service_agent import languages_service_agent
+
+
+def _component(name: str) -> SelfBuiltComponent:
+    return SelfBuiltComponent(
+        name=name, path=name, display_url="", owner=Owner(), evidence="", confidence="high"
+    )
+
+
+def _language(name: str, manifests: int = 0) -> dict:
+    return {
+        "name": name,
+        "total_files": 3,
+        "packages_content": [{"file_name": f"m{i}", "content": ""} for i in range(manifests)],
+    }
+
+
+class TestLanguagesServiceAgent:
+    """Test cases for the per-service language agent."""
+
+    def test_every_branch_stores_a_list(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """No language, a single obvious language and an LLM decision all yield a list of results."""
+        answer = {"name": "Kotlin", "version": "1.9.0", "reason": "most source files"}
+        calls = []
+        llm = RunnableLambda(lambda prompt: calls.append(prompt) or AIMessage(content=json.dumps(answer)))
+        monkeypatch.setattr(agent_module, "init_llm_by_provider", lambda model_name=None: llm)
+        languages = {
+            "none": [],
+            "go": [_language("Go")],
+            "jvm": [_language("Kotlin", manifests=1), _language("Java", manifests=1)],
+        }
+        monkeypatch.setattr(
+            agent_module,
+            "get_languages_and_package_manager_runnable",
+            lambda local_path, service_name, service_path: {"languages": languages[service_name]},
+        )
+        state = RootRepoState(repo_root_url="https://github.com/o/r", local_path="/repo")
+        state.self_built_software = [_component(name) for name in languages]
+
+        languages_service_agent(state, {})
+
+        none, go, jvm = (service.language for service in state.self_built_software)
+        assert none[0]["name"] == "NA"
+        assert go[0]["name"] == "Go"
+        assert jvm == [answer]
+        assert len(calls) == 1
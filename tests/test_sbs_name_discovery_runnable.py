@@ -0,0 +1,176 @@
+"""Tests for sbs_name_discovery_runnable module."""
+from __future__ import annotations
+
+import builtins
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from src.nodes.runnables import sbs_name_discovery_runnable as runnable_module
+from src.nodes.runnables.sbs_name_discovery_runnable import (
+    _analyze_cicd_references,
+    _find_package_manager_directories,
+    _is_cicd_file,
+    discover_services_by_deployment_signals,
+)
+
+
+def _found(repo: Path) -> dict:
+    return {str(d["path"]): d["package_file"] for d in _find_package_manager_directories(repo)}
+
+
+class TestFindPackageManagerDirectories:
+    """Test cases for locating directories that hold a package manager file."""
+
+    def test_nested_directories_are_found(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Package manager files are found at the root and at any depth, prioritised per directory."""
+        touch(tmp_path, "package.json", "{}")
+        touch(tmp_path, "services/api/requirements.txt")
+        touch(tmp_path, "services/web/go.mod")
+        touch(tmp_path, "services/web/package.json", "{}")
+
+        assert _found(tmp_path) == {
+            ".": "package.json",
+            "services/api": "requirements.txt",
+            "services/web": "package.json",
+        }
+
+    def test_project_files_matched_by_extension(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Wildcard entries such as '*.csproj' match any project file with that extension."""
+        touch(tmp_path, "src/Billing/Billing.csproj")
+        touch(tmp_path, "src/Pricing/Pricing.fsproj")
+
+        package_dirs = {str(d["path"]): d["language"] for d in _find_package_manager_directories(tmp_path)}
+
+        assert package_dirs == {"src/Billing": "csharp", "src/Pricing": "fsharp"}
+
+    def test_walk_is_top_down_in_listing_order(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Directories come out in the same order as os.walk visits them."""
+        for relative in ("a/go.mod", "a/x/go.mod", "b/go.mod", "b/y/z/go.mod", "c/go.mod"):
+            touch(tmp_path, relative)
+        expected = [
+            str(Path(root).relative_to(tmp_path)) for root, _, files in os.walk(tmp_path) if "go.mod" in files
+        ]
+
+        assert [str(d["path"]) for d in _find_package_manager_directories(tmp_path)] == expected
+
+    def test_skipped_and_generated_directories_are_pruned(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Dependency, test, hidden and generated subtrees are never searched."""
+        touch(tmp_path, "app/go.mod")
+        touch(tmp_path, "node_modules/lib/package.json", "{}")
+        touch(tmp_path, "tests/fixture/go.mod")
+        touch(tmp_path, ".hidden/go.mod")
+        touch(tmp_path, "generated-client/go.mod")
+        touch(tmp_path, "app/deadbeefcafe/go.mod")
+
+        assert list(_found(tmp_path)) == ["app"]
+
+    def test_symlinked_directories_are_not_followed(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """A symlink to a service directory does not report the service twice."""
+        touch(tmp_path, "app/go.mod")
+        os.symlink(tmp_path / "app", tmp_path / "alias")
+
+        assert list(_found(tmp_path)) == ["app"]
+
+
+class TestAnalyzeCicdReferences:
+    """Test cases for matching package manager directories against CI/CD files."""
+
+    def test_referenced_directories_are_returned(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Directories named in a workflow are reported, others and infrastructure ones are not."""
+        touch(tmp_path, "services/api/go.mod")
+        touch(tmp_path, "services/idle/go.mod")
+        touch(tmp_path, "k8s/go.mod")
+        touch(tmp_path, ".github/workflows/ci.yml", "jobs:\n  build:\n    working-directory: services/api\n    run: cd k8s\n")
+        package_dirs = _find_package_manager_directories(tmp_path)
+
+        referenced = _analyze_cicd_references(tmp_path, [".github/workflows/ci.yml", "Dockerfile"], package_dirs)
+
+        assert referenced == {"services/api"}
+
+    def test_nothing_to_match_reads_no_files(
+        self, tmp_path: Path, touch: Callable[..., None], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without candidate directories or CI/CD files no file is read."""
+        touch(tmp_path, ".github/workflows/ci.yml", "working-directory: docs\n")
+        touch(tmp_path, "k8s/go.mod")
+        monkeypatch.setattr(runnable_module, "_read_deployment_files", lambda *args: pytest.fail("unexpected read"))
+        package_dirs = _find_package_manager_directories(tmp_path)
+
+        assert _analyze_cicd_references(tmp_path, [".github/workflows/ci.yml"], []) == set()
+        assert _analyze_cicd_references(tmp_path, [".github/workflows/ci.yml"], package_dirs) == set()
+        assert _analyze_cicd_references(tmp_path, ["Dockerfile"], [{"path": Path("api"), "package_file": "go.mod"}]) == set()
+
+    def test_name_patterns_match_case_insensitively(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """Tool and environment patterns built from the directory name match in any case."""
+        touch(tmp_path, "apps/billing/package.json", "{}")
+        touch(tmp_path, "apps/ledger/build.gradle")
+        touch(tmp_path, "apps/unused/go.mod")
+        touch(tmp_path, "Jenkinsfile", "env.APP_NAME=BILLING\nsh './gradlew :ledger:build'\n")
+        package_dirs = _find_package_manager_directories(tmp_path)
+
+        referenced = _analyze_cicd_references(tmp_path, ["Jenkinsfile"], package_dirs)
+
+        assert referenced == {"apps/billing", "apps/ledger"}
+
+    def test_pattern_shared_by_all_directories(self, tmp_path: Path, touch: Callable[..., None]) -> None:
+        """A generic pattern such as 'services:' references every candidate directory."""
+        touch(tmp_path, "a/go.mod")
+        touch(tmp_path, "b/go.mod")
+        touch(tmp_path, ".gitlab-ci.yml", "services:\n  - docker:dind\n")
+        package_dirs = _find_package_manager_directories(tmp_path)
+
+        referenced = _analyze_cicd_references(tmp_path, [".gitlab-ci.yml"], package_dirs)
+
+        assert referenced == {"a", "b"}
+
+
+class TestIsCicdFile:
+    """Test cases for recognising CI/CD files among deployment signals."""
+
+    def test_cicd_paths(self) -> None:
+        """Workflow, pipeline and Jenkins files are CI/CD files wherever they live."""
+        assert _is_cicd_file(".github/workflows/build.yml")
+        assert _is_cicd_file("ci/Jenkinsfile.release")
+        assert _is_cicd_file("azure-pipelines.yaml")
+        assert _is_cicd_file(".circleci/config.yml")
+
+    def test_other_deployment_files(self) -> None:
+        """Dockerfiles, charts and manifests are not CI/CD files."""
+        assert not _is_cicd_file("Dockerfile")
+        assert not _is_cicd_file("charts/api/values.yaml")
+        assert not _is_cicd_file(".github/dependabot.yml")
+
+
+class TestDiscoverServicesByDeploymentSignals:
+    """Test cases for choosing between the pattern heuristic and the LLM."""
+
+    def test_llm_fallback_reuses_cicd_contents(
+        self, tmp_path: Path, touch: Callable[..., None], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With few referenced directories the LLM gets every readable signal file, each read once."""
+        touch(tmp_path, "api/go.mod")
+        touch(tmp_path, ".github/workflows/ci.yml", "Working-Directory: api\n")
+        touch(tmp_path, "api/Dockerfile", "FROM golang\n")
+        (tmp_path / "charts").mkdir()
+        opened = []
+
+        def _open(file, *args, **kwargs):
+            opened.append(Path(file).relative_to(tmp_path).as_posix())
+            return builtins.open(file, *args, **kwargs)
+
+        agent_calls = []
+        monkeypatch.setattr(runnable_module, "open", _open, raising=False)
+        monkeypatch.setattr(runnable_module, "ai_service_discovery_agent", lambda **kwargs: agent_calls.append(kwargs) or [])
+
+        signals = [".github/workflows/ci.yml", "api/Dockerfile", "charts"]
+        services = discover_services_by_deployment_signals(tmp_path, "https://github.com/o/r", signals)
+
+        assert services == []
+        assert agent_calls[0]["cicd_files"] == [
+            {"path": ".github/workflows/ci.yml", "content": "Working-Directory: api\n"},
+            {"path": "api/Dockerfile", "content": "FROM golang\n"},
+        ]
+        assert sorted(opened) == [".github/workflows/ci.yml", "api/Dockerfile", "charts"]
@@ -0,0 +1,83 @@
+"""Tests for tech_stack_agent module, specifically the concurrent batch entry point."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.nodes.agents import tech_stack_agent as agent_module
+from src.nodes.agents.tech_stack_agent import TechStackResult, tech_stack_agent_batch
+
+
+class _FakeChain:
+    """Chain stand-in whose invoke echoes the input after a content-dependent delay."""
+
+    def invoke(self, inputs: dict) -> dict:
+        content = inputs["dependency_file_content"]
+        if content == "boom":
+            raise ValueError("unparseable output")
+        # Later inputs finish first, so ordering must come from the executor, not completion
+        time.sleep(0.01 / (len(content) + 1))
+        return {"tech_stacks": [{"name": content}]}
+
+
+@pytest.fixture(autouse=True)
+def fake_chain(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace the cached LLM chain with a local fake."""
+    monkeypatch.setattr(agent_module, "_get_tech_stack_chain", lambda model_name=None: _FakeChain())
+
+
+class TestTechStackAgentBatch:
+    """Test cases for tech_stack_agent_batch."""
+
+    def test_results_follow_input_order(self) -> None:
+        """Each result lines up with the dependency file at the same index."""
+        results = tech_stack_agent_batch(["a", "bbb", "cc"])
+
+        assert [r["tech_stacks"][0]["name"] for r in results] == ["a", "bbb", "cc"]
+
+    def test_failure_falls_back_to_empty_result(self) -> None:
+        """A failing file yields an empty result without affecting the others."""
+        results = tech_stack_agent_batch(["a", "boom"])
+
+        assert results[0]["tech_stacks"][0]["name"] == "a"
+        assert results[1] == TechStackResult(tech_stacks=[])
+
+    def test_empty_input_returns_empty_list(self) -> None:
+        """No dependency files means no LLM calls."""
+        assert tech_stack_agent_batch([]) == []
+
+    def test_concurrency_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """No more than TECH_STACK_MAX_CONCURRENCY calls are in flight at once."""
+        monkeypatch.setattr(agent_module, "TECH_STACK_MAX_CONCURRENCY", 2)
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        class _CountingChain:
+            def invoke(self, inputs: dict) -> dict:
+                nonlocal in_flight, peak
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                time.sleep(0.01)
+                with lock:
+                    in_flight -= 1
+                return {"tech_stacks": []}
+
+        monkeypatch.setattr(agent_module, "_get_tech_stack_chain", lambda model_name=None: _CountingChain())
+
+        tech_stack_agent_batch([str(i) for i in range(6)])
+
+        assert peak == 2
+
+    def test_callable_from_a_running_event_loop(self) -> None:
+        """The batch works inside an async server, where asyncio.run would refuse to start."""
+        async def _serve() -> list:
+            return tech_stack_agent_batch(["a", "b"])
+
+        results = asyncio.run(_serve())
+
+        assert [r["tech_stacks"][0]["name"] for r in results] == ["a", "b"]
@@ -0,0 +1,305 @@
+"""Tests for workflow_classifier_agent module, specifically batched classification."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.nodes.agents import workflow_classifier_agent as agent_module
+from src.nodes.agents.workflow_classifier_agent import workflow_classifier_agent, workflow_classifier_agent_batch
+
+
+@pytest.fixture(autouse=True)
+def clear_classification_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test without remembered classifications and without the persistent cache."""
+    monkeypatch.delenv("WORKFLOW_CLASSIFICATION_CACHE_PATH", raising=False)
+    agent_module._CLASSIFICATION_CACHE.clear()
+
+
+def _fake_llm(batch_response: str, **fallback_responses: str) -> MagicMock:
+    """LLM stand-in: answers the batched prompt, and per-file fallbacks by the workflow path in the prompt."""
+    def invoke(prompt: str) -> MagicMock:
+        if "--- WORKFLOW 1:" in prompt:
+            return MagicMock(content=batch_response)
+        path = prompt.split("Workflow file path: ", 1)[1].split("\n", 1)[0]
+        return MagicMock(content=fallback_responses[path.replace(".yml", "")])
+
+    llm = MagicMock()
+    llm.invoke.side_effect = invoke
+    return llm
+
+
+class TestWorkflowClassifierAgentBatch:
+    """Test cases for workflow_classifier_agent_batch."""
+
+    def test_single_prompt_for_all_workflows(self, tmp_path) -> None:
+        """All workflows are classified from one JSON response."""
+        llm = _fake_llm('{"a.yml": "deployment", "b.yml": "Tooling"}')
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            result = workflow_classifier_agent_batch([("on: push", "a.yml"), ("on: pr", "b.yml")], str(tmp_path))
+
+        assert result == {"a.yml": "deployment", "b.yml": "tooling"}
+        assert llm.invoke.call_count == 1
+        prompt = llm.invoke.call_args.args[0]
+        assert "--- WORKFLOW 1: path=a.yml ---" in prompt
+        assert "--- WORKFLOW 2: path=b.yml ---" in prompt
+
+    def test_missing_entry_falls_back_to_single_classification(self, tmp_path) -> None:
+        """Workflows absent from the batched response are classified individually."""
+        llm = _fake_llm('```json\n{"a.yml": "tooling"}\n```', b="deployment")
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            result = workflow_classifier_agent_batch([("x", "a.yml"), ("y", "b.yml")], str(tmp_path))
+
+        assert result == {"a.yml": "tooling", "b.yml": "deployment"}
+        assert llm.invoke.call_count == 2
+
+    def test_unparseable_response_falls_back_per_file(self, tmp_path) -> None:
+        """A non-JSON batched response triggers per-file classification."""
+        llm = _fake_llm("not json", a="tooling", b="unknown")
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            result = workflow_classifier_agent_batch([("x", "a.yml"), ("y", "b.yml")], str(tmp_path))
+
+        assert result == {"a.yml": "tooling", "b.yml": "unknown"}
+
+    def test_fallback_works_from_a_running_event_loop(self, tmp_path) -> None:
+        """The per-file fallback runs inside an async server, where asyncio.run would refuse to start."""
+        llm = _fake_llm("not json", a="tooling", b="deployment")
+
+        async def _serve() -> dict:
+            return workflow_classifier_agent_batch([("x", "a.yml"), ("y", "b.yml")], str(tmp_path))
+
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            result = asyncio.run(_serve())
+
+        assert result == {"a.yml": "tooling", "b.yml": "deployment"}
+
+    def test_empty_input_makes_no_llm_call(self) -> None:
+        """No workflows means no LLM initialization at all."""
+        with patch.object(agent_module, "init_llm_by_provider") as init:
+            assert workflow_classifier_agent_batch([]) == {}
+        init.assert_not_called()
+
+
+class TestClassificationCache:
+    """Test cases for the in-process classification cache."""
+
+    def test_same_content_is_classified_once(self, tmp_path) -> None:
+        """A repeated workflow reuses the earlier LLM answer, even from another directory."""
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content="deployment")
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            first = workflow_classifier_agent("on: push", "repo-a/.github/workflows/cd.yml", str(tmp_path))
+            second = workflow_classifier_agent("on: push", "repo-b/.github/workflows/cd.yml", str(tmp_path))
+
+        assert first == second == "deployment"
+        assert llm.invoke.call_count == 1
+
+    def test_other_repository_context_is_classified_again(self, tmp_path) -> None:
+        """The same workflow next to another README or other strong signals is not served the earlier answer."""
+        repo_a, repo_b = tmp_path / "a", tmp_path / "b"
+        repo_a.mkdir()
+        repo_b.mkdir()
+        (repo_a / "README.md").write_text("Deploys the shop API\n", encoding="utf-8")
+        (repo_b / "README.md").write_text("Terraform modules\n", encoding="utf-8")
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content="deployment")
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            workflow_classifier_agent("on: push", "cd.yml", str(repo_a))
+            workflow_classifier_agent("on: push", "cd.yml", str(repo_b))
+            workflow_classifier_agent("on: push", "cd.yml", str(repo_a), strong_signals=["Dockerfile"])
+            workflow_classifier_agent("on: push", "cd.yml", str(repo_a))
+
+        assert llm.invoke.call_count == 3
+
+    def test_persistent_cache_survives_the_process(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With WORKFLOW_CLASSIFICATION_CACHE_PATH set, answers are reused after the in-memory cache is gone."""
+        monkeypatch.setenv("WORKFLOW_CLASSIFICATION_CACHE_PATH", str(tmp_path / "wfclass.sqlite"))
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content="deployment")
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            first = workflow_classifier_agent("on: push", "cd.yml", str(tmp_path))
+            agent_module._CLASSIFICATION_CACHE.clear()
+            second = workflow_classifier_agent("on: push", "cd.yml", str(tmp_path))
+
+        assert first == second == "deployment"
+        assert llm.invoke.call_count == 1
+
+    def test_batch_skips_cached_workflows(self, tmp_path) -> None:
+        """Workflows already classified are not sent to the LLM again."""
+        llm = _fake_llm('{"a.yml": "deployment", "b.yml": "tooling"}')
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            workflow_classifier_agent_batch([("x", "a.yml"), ("y", "b.yml")], str(tmp_path))
+            result = workflow_classifier_agent_batch([("x", "a.yml"), ("y", "b.yml")], str(tmp_path))
+
+        assert result == {"a.yml": "deployment", "b.yml": "tooling"}
+        assert llm.invoke.call_count == 1
+
+    def test_failed_classification_is_not_cached(self, tmp_path) -> None:
+        """An LLM error yields unknown without pinning that answer."""
+        llm = MagicMock()
+        llm.invoke.side_effect = [RuntimeError("rate limited"), MagicMock(content="tooling")]
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            assert workflow_classifier_agent("x", "a.yml", str(tmp_path)) == "unknown"
+            assert workflow_classifier_agent("x", "a.yml", str(tmp_path)) == "tooling"
+
+    def test_persistent_cache_directory_is_created(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The documented ~/.cache default works on a machine where that directory does not exist yet."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("WORKFLOW_CLASSIFICATION_CACHE_PATH", "~/.cache/sbs-ai-discovery/wfclass.sqlite")
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content="deployment")
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            workflow_classifier_agent("on: push", "cd.yml", str(tmp_path))
+
+        assert (tmp_path / ".cache" / "sbs-ai-discovery" / "wfclass.sqlite").is_file()
+
+    def test_answer_is_normalized_before_caching(self, tmp_path) -> None:
+        """Decorated answers are reduced to their label; anything else is unknown and never stored."""
+        llm = MagicMock()
+        llm.invoke.side_effect = [
+            MagicMock(content=" Deployment.\n"),
+            MagicMock(content="It ships the app to production"),
+            MagicMock(content="tooling"),
+        ]
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            assert workflow_classifier_agent("x", "a.yml", str(tmp_path)) == "deployment"
+            assert workflow_classifier_agent("y", "b.yml", str(tmp_path)) == "unknown"
+            assert workflow_classifier_agent("y", "b.yml", str(tmp_path)) == "tooling"
+
+        assert set(agent_module._CLASSIFICATION_CACHE.values()) == {"deployment", "tooling"}
+
+    def test_batch_invalid_label_is_classified_again(self, tmp_path) -> None:
+        """A batched entry that is not one of the labels goes to the per-file fallback instead of the cache."""
+        llm = _fake_llm('{"a.yml": "Deployment", "b.yml": "deploys docs"}', b="tooling")
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            result = workflow_classifier_agent_batch([("x", "a.yml"), ("y", "b.yml")], str(tmp_path))
+
+        assert result == {"a.yml": "deployment", "b.yml": "tooling"}
+        assert llm.invoke.call_count == 2
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch) -> None:
+        """The least recently used entry is evicted past the size limit."""
+        monkeypatch.setattr(agent_module, "CLASSIFICATION_CACHE_MAX_ENTRIES", 2)
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content="tooling")
+        with patch.object(agent_module, "init_llm_by_provider", return_value=llm):
+            for content in ("a", "b", "c"):
+                workflow_classifier_agent(content, "w.yml", str(tmp_path))
+
+        assert len(agent_module._CLASSIFICATION_CACHE) == 2
+
+
+class TestReadReadmeHead:
+    """Test cases for the cached README head read."""
+
+    def test_repeated_reads_hit_cache(self, tmp_path) -> None:
+        """The README is opened once for repeated lookups of the same head."""
+        (tmp_path / "README.md").write_text("line1\nline2\nline3\n", encoding="utf-8")
+        agent_module._read_readme_head_cached.cache_clear()
+
+        with patch("builtins.open", wraps=open) as opened:
+            first = agent_module._read_readme_head(str(tmp_path), 2)
+            second = agent_module._read_readme_head(str(tmp_path), 2)
+
+        assert first == second == "line1\nline2\n"
+        assert opened.call_count == 1
+
+    def test_changed_readme_is_reread(self, tmp_path) -> None:
+        """A README rewritten at the same path is not served from the cache."""
+        readme = tmp_path / "README.md"
+        readme.write_text("old\n", encoding="utf-8")
+        assert agent_module._read_readme_head(str(tmp_path), 5) == "old\n"
+
+        readme.write_text("newer\n", encoding="utf-8")
+        assert agent_module._read_readme_head(str(tmp_path), 5) == "newer\n"
+
+    def test_missing_readme_returns_empty(self, tmp_path) -> None:
+        """A repository without README.md yields empty context."""
+        assert agent_module._read_readme_head(str(tmp_path), 20) == ""
+
+    def test_invalid_utf8_is_replaced(self, tmp_path) -> None:
+        """Undecodable bytes no longer drop the whole README context."""
+        (tmp_path / "README.md").write_bytes(b"ok\n\xff bad\nthird\n")
+
+        assert agent_module._read_readme_head(str(tmp_path), 2) == "ok\n� bad\n"
+
+
+class TestFastClassify:
+    """Test cases for the rule-based pre-classifier."""
+
+    def test_pure_reusable_workflow_caller_is_tooling(self) -> None:
+        """Jobs that only call local reusable workflows need no LLM."""
+        content = "on: push\njobs:\n  build:\n    uses: ./.github/workflows/build.yml\n"
+
+        assert agent_module._fast_classify(content) == "tooling"
+
+    def test_workflow_call_without_deploy_commands_is_tooling(self) -> None:
+        """A reusable workflow that does not deploy itself is tooling."""
+        content = "on:\n  workflow_call:\njobs:\n  lint:\n    steps:\n      - run: npm run lint\n"
+
+        assert agent_module._fast_classify(content) == "tooling"
+
+    def test_workflow_call_with_deploy_command_is_left_to_llm(self) -> None:
+        """A reusable workflow that runs kubectl may deploy and is not decided by rules."""
+        content = "on:\n  workflow_call:\njobs:\n  deploy:\n    steps:\n      - run: kubectl apply -f k8s/\n"
+
+        assert agent_module._fast_classify(content) is None
+
+    def test_mixed_local_and_remote_reusable_workflows_are_left_to_llm(self) -> None:
+        """A job calling a reusable workflow from another repository may deploy."""
+        content = (
+            "on: push\njobs:\n  build:\n    uses: ./.github/workflows/build.yml\n"
+            "  deploy:\n    uses: org/platform/.github/workflows/deploy.yml@v1\n"
+        )
+
+        assert agent_module._fast_classify(content) is None
+
+    @pytest.mark.parametrize("action", [
+        "azure/webapps-deploy@v3",
+        "azure/k8s-deploy@v5",
+        "google-github-actions/deploy-cloudrun@v2",
+        "aws-actions/amazon-ecs-deploy-task-definition@v2",
+    ])
+    def test_workflow_call_with_deploy_action_is_left_to_llm(self, action: str) -> None:
+        """A reusable workflow that deploys through a marketplace action is not decided by rules."""
+        content = f"on:\n  workflow_call:\njobs:\n  release:\n    steps:\n      - uses: {action}\n"
+
+        assert agent_module._fast_classify(content) is None
+
+    def test_workflow_call_mentioning_deploy_is_left_to_llm(self) -> None:
+        """Any mention of a deployment defers a reusable workflow to the LLM."""
+        content = "on:\n  workflow_call:\njobs:\n  deploy:\n    steps:\n      - run: ./scripts/release.sh\n"
+
+        assert agent_module._fast_classify(content) is None
+
+    def test_pages_publish_with_first_party_actions_is_tooling(self) -> None:
+        """The standard Pages workflow built from GitHub's own actions needs no LLM."""
+        content = (
+            "on: push\njobs:\n  deploy:\n    steps:\n      - uses: actions/checkout@v4\n"
+            "      - uses: actions/upload-pages-artifact@v3\n      - uses: actions/deploy-pages@v4\n"
+        )
+
+        assert agent_module._fast_classify(content) == "tooling"
+
+    def test_pages_publish_with_other_deploy_action_is_left_to_llm(self) -> None:
+        """Publishing docs next to a marketplace deployment is not plain tooling."""
+        content = (
+            "on: push\njobs:\n  docs:\n    steps:\n      - uses: actions/deploy-pages@v4\n"
+            "      - uses: azure/webapps-deploy@v3\n"
+        )
+
+        assert agent_module._fast_classify(content) is None
+
+    def test_pages_publish_is_tooling(self) -> None:
+        """Publishing docs to GitHub Pages is tooling."""
+        content = "on: push\njobs:\n  docs:\n    steps:\n      - uses: peaceiris/actions-gh-pages@v3\n"
+
+        assert agent_module._fast_classify(content) == "tooling"
+
+    def test_rule_hit_skips_llm(self) -> None:
+        """workflow_classifier_agent does not initialize the LLM on a rule hit."""
+        content = "on:\n  workflow_call:\njobs:\n  test:\n    steps:\n      - run: make test\n"
+        with patch.object(agent_module, "init_llm_by_provider") as init:
+            assert agent_module.workflow_classifier_agent(content, "ci.yml") == "tooling"
+        init.assert_not_called()